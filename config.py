@@ -1,92 +1,193 @@
 """Configuration module for switching between stub and production services"""
 import os
-from typing import Dict, Any
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from dataclasses import dataclass
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; fall back to a regular dataclass on 3.9
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, eq=False, **_DATACLASS_SLOTS)
 class ServiceConfig:
-    """Configuration for individual service"""
+    """Configuration for individual service (immutable once loaded)"""
     url: str
     api_key: str = ""
     use_stub: bool = False
 
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class EmailServiceConfig:
+    """Configuration for the SMTP email service"""
+    use_stub: bool
+    smtp_server: str
+    smtp_port: int
+    email_from: str
+    email_password: str = ""
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class LandscapeServiceConfig:
+    """Configuration for landscape updates via GitHub"""
+    use_stub: bool
+    github_token: str = ""
+    github_org: str = "cncf"
+
+# Environment variables read by Config: (name, cast, default)
+_ENV_SPEC = (
+    ('RUN_MODE', str, 'local'),
+    ('DB_TYPE', str, 'postgres'),
+    ('SQLITE_PATH', str, './local_onboarding.db'),
+    ('DB_HOST', str, 'localhost'),
+    ('DB_PORT', int, '5432'),
+    ('DB_NAME', str, 'onboarding'),
+    ('DB_USER', str, 'postgres'),
+    ('DB_PASSWORD', str, ''),
+    ('MEMBER_SERVICE_URL', str, 'https://api.lfx.linuxfoundation.org/v1/member-service'),
+    ('PROJECT_SERVICE_URL', str, 'https://api.lfx.linuxfoundation.org/v1/project-service'),
+    ('LFX_API_KEY', str, ''),
+    ('SLACK_API_URL', str, 'https://slack.com/api'),
+    ('SLACK_BOT_TOKEN', str, ''),
+    ('SMTP_SERVER', str, 'smtp.gmail.com'),
+    ('SMTP_PORT', int, '587'),
+    ('EMAIL_FROM', str, 'onboarding@linuxfoundation.org'),
+    ('EMAIL_PASSWORD', str, ''),
+    ('GITHUB_TOKEN', str, ''),
+    ('GITHUB_ORG', str, 'cncf'),
+    ('MAX_RETRIES', int, '3'),
+    ('RETRY_DELAY', int, '5'),
+    ('BATCH_SIZE', int, '10'),
+    ('MAX_PROCESSING_TIME', int, '3600'),
+    ('MAX_FAILURE_RATE', float, '0.2'),
+    ('SLACK_INVITES_PER_MINUTE', int, '20'),
+)
+
+def _build_env_reader():
+    """Compile a straight-line reader for _ENV_SPEC.
+
+    The generated function builds one dict literal with each cast inlined,
+    so reading the environment doesn't loop over the spec at runtime.
+    """
+    entries = ",\n".join(
+        f"        {name!r}: _{cast.__name__}(env.get({name!r}, {default!r}))"
+        for name, cast, default in _ENV_SPEC
+    )
+    src = (
+        "def _read_env():\n"
+        "    env = _environ.copy()\n"
+        "    return {\n" + entries + "\n    }\n"
+    )
+    namespace = {'_environ': os.environ, '_str': str, '_int': int, '_float': float}
+    exec(compile(src, "<config._read_env>", "exec"), namespace)
+    reader = namespace['_read_env']
+    reader.__doc__ = "Read and cast every variable in _ENV_SPEC from one environment snapshot"
+    return reader
+
+_read_env = _build_env_reader()
+
 class Config:
     """Main configuration class for the onboarding agent system"""
     
     def __init__(self):
+        env = _read_env()
+        
         # Check if running in local/development mode
-        self.is_local = os.getenv('RUN_MODE', 'local').lower() == 'local'
+        self.is_local = env['RUN_MODE'].lower() == 'local'
         
         # Database configuration
         self.database = {
-            'type': 'sqlite' if self.is_local else os.getenv('DB_TYPE', 'postgres'),
+            'type': 'sqlite' if self.is_local else env['DB_TYPE'],
             'connection': {
                 'sqlite': {
-                    'path': os.getenv('SQLITE_PATH', './local_onboarding.db')
+                    'path': env['SQLITE_PATH']
                 },
                 'postgres': {
-                    'host': os.getenv('DB_HOST', 'localhost'),
-                    'port': int(os.getenv('DB_PORT', '5432')),
-                    'database': os.getenv('DB_NAME', 'onboarding'),
-                    'user': os.getenv('DB_USER', 'postgres'),
-                    'password': os.getenv('DB_PASSWORD', '')
+                    'host': env['DB_HOST'],
+                    'port': env['DB_PORT'],
+                    'database': env['DB_NAME'],
+                    'user': env['DB_USER'],
+                    'password': env['DB_PASSWORD']
                 }
             }
         }
         
-        # Service configurations
+        # Service configurations: LFX services share one key, and every
+        # service uses stubs exactly when running locally
+        lfx_api_key = env['LFX_API_KEY']
+        use_stub = self.is_local
+        
         self.member_service = ServiceConfig(
-            url=os.getenv('MEMBER_SERVICE_URL', 'https://api.lfx.linuxfoundation.org/v1/member-service'),
-            api_key=os.getenv('LFX_API_KEY', ''),
-            use_stub=self.is_local
+            url=env['MEMBER_SERVICE_URL'],
+            api_key=lfx_api_key,
+            use_stub=use_stub
         )
         
         self.project_service = ServiceConfig(
-            url=os.getenv('PROJECT_SERVICE_URL', 'https://api.lfx.linuxfoundation.org/v1/project-service'),
-            api_key=os.getenv('LFX_API_KEY', ''),
-            use_stub=self.is_local
+            url=env['PROJECT_SERVICE_URL'],
+            api_key=lfx_api_key,
+            use_stub=use_stub
         )
         
         self.slack_service = ServiceConfig(
-            url=os.getenv('SLACK_API_URL', 'https://slack.com/api'),
-            api_key=os.getenv('SLACK_BOT_TOKEN', ''),
-            use_stub=self.is_local
+            url=env['SLACK_API_URL'],
+            api_key=env['SLACK_BOT_TOKEN'],
+            use_stub=use_stub
         )
         
-        self.email_service = {
-            'use_stub': self.is_local,
-            'smtp_server': os.getenv('SMTP_SERVER', 'smtp.gmail.com'),
-            'smtp_port': int(os.getenv('SMTP_PORT', '587')),
-            'email_from': os.getenv('EMAIL_FROM', 'onboarding@linuxfoundation.org'),
-            'email_password': os.getenv('EMAIL_PASSWORD', '')
-        }
+        self.email_service = EmailServiceConfig(
+            use_stub=use_stub,
+            smtp_server=env['SMTP_SERVER'],
+            smtp_port=env['SMTP_PORT'],
+            email_from=env['EMAIL_FROM'],
+            email_password=env['EMAIL_PASSWORD']
+        )
         
-        self.landscape_service = {
-            'use_stub': self.is_local,
-            'github_token': os.getenv('GITHUB_TOKEN', ''),
-            'github_org': os.getenv('GITHUB_ORG', 'cncf')
-        }
+        self.landscape_service = LandscapeServiceConfig(
+            use_stub=use_stub,
+            github_token=env['GITHUB_TOKEN'],
+            github_org=env['GITHUB_ORG']
+        )
         
         # Agent behavior configuration
         self.agent_config = {
-            'max_retries': int(os.getenv('MAX_RETRIES', '3')),
-            'retry_delay': int(os.getenv('RETRY_DELAY', '5')),
-            'batch_size': int(os.getenv('BATCH_SIZE', '10')),
-            'max_processing_time': int(os.getenv('MAX_PROCESSING_TIME', '3600')),
-            'max_failure_rate': float(os.getenv('MAX_FAILURE_RATE', '0.2'))
+            'max_retries': env['MAX_RETRIES'],
+            'retry_delay': env['RETRY_DELAY'],
+            'batch_size': env['BATCH_SIZE'],
+            'max_processing_time': env['MAX_PROCESSING_TIME'],
+            'max_failure_rate': env['MAX_FAILURE_RATE']
         }
+        
+        # service -> (requests, per seconds) for the per-contact calls; Slack
+        # onboarding is bound by admin.users.invite, a Tier 2 method (~20 per minute)
+        self.service_rate_limits: Mapping[str, Tuple[float, float]] = MappingProxyType({
+            'committee': (20, 1),
+            'slack': (env['SLACK_INVITES_PER_MINUTE'], 60),
+            'email': (10, 1)
+        })
+        
+        # Resolved database config, built on first get_database_config() call
+        self._db_config_cache: Optional[Dict[str, Any]] = None
     
     def get_database_config(self) -> Dict[str, Any]:
         """Get database configuration based on type"""
-        db_type = self.database['type']
-        return {
-            'type': db_type,
-            **self.database['connection'][db_type]
-        }
+        if self._db_config_cache is None:
+            db_type = self.database['type']
+            self._db_config_cache = {
+                'type': db_type,
+                **self.database['connection'][db_type]
+            }
+        return self._db_config_cache
     
     def is_using_stubs(self) -> bool:
         """Check if system is using stub services"""
         return self.is_local
 
-# Global config instance
-config = Config()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the process-wide config, building it on first access"""
+    return Config()
+
+def __getattr__(name: str) -> Any:
+    # Keep `from config import config` working without parsing env at import
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
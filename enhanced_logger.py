@@ -1,8 +1,11 @@
 """Enhanced logging module for clear onboarding progress tracking"""
-import logging
-from datetime import datetime
+import os
+import sys
+import time
 from typing import Dict, List, Optional, Any
-from functools import wraps
+from functools import lru_cache
+
+from json_codec import dumps
 
 class Colors:
     HEADER = '\033[95m'
@@ -15,67 +18,101 @@ class Colors:
     BOLD = '\033[1m'
     DIM = '\033[2m'
 
+_IS_TTY = sys.stdout.isatty()
+
+# Drop ANSI codes entirely when output is piped or NO_COLOR is set
+if not _IS_TTY or os.getenv('NO_COLOR'):
+    for _attr in ('HEADER', 'BLUE', 'CYAN', 'GREEN', 'YELLOW', 'RED', 'ENDC', 'BOLD', 'DIM'):
+        setattr(Colors, _attr, '')
+    del _attr
+
+# Static separators for workflow and stage headers
+_HEADER_BAR = f"{Colors.HEADER}{'═'*70}{Colors.ENDC}"
+_STAGE_RULE = f"{Colors.DIM}{'─'*60}{Colors.ENDC}"
+
+# Preformatted templates for the per-contact log lines
+_CONTACT_FMT = "  %s %s%s" + Colors.ENDC + " (%s) - %s"
+_COMMITTEE_FMT = "  ➕ " + Colors.YELLOW + "%s" + Colors.ENDC + " → " + Colors.CYAN + "%s" + Colors.ENDC
+_SLACK_FMT = "  📨 " + Colors.YELLOW + "%s" + Colors.ENDC
+_EMAIL_FMT = "  ✉️  " + Colors.YELLOW + "%s" + Colors.ENDC
+
+# status -> (icon, color) for contact_progress; unknown statuses render as failed
+_CONTACT_STATUS = {
+    "processing": ("🔄", Colors.YELLOW),
+    "success": ("✅", Colors.GREEN),
+    "failed": ("❌", Colors.RED)
+}
+
+# status -> template for landscape_update; unknown statuses are not logged
+_LANDSCAPE_STATUS = {
+    "checking": "  🔍 Checking " + Colors.CYAN + "%(org)s" + Colors.ENDC + " in " + Colors.CYAN + "%(project)s" + Colors.ENDC + " landscape",
+    "updating": "  🖼️  Creating PR to update " + Colors.CYAN + "%(org)s" + Colors.ENDC + " logo",
+    "success": "     " + Colors.GREEN + "✓" + Colors.ENDC + " Landscape update complete"
+}
+
+def _emit(*lines: str):
+    """Write one or more lines to stdout in a single write() call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 class OnboardingLogger:
     """Enhanced logger for tracking onboarding workflow progress"""
     
-    def __init__(self, name: str = "OnboardingWorkflow"):
-        self.logger = logging.getLogger(name)
+    __slots__ = ("current_stage", "start_time", "stage_timings", "stage_start_time")
+    
+    def __init__(self):
         self.current_stage = None
-        self.start_time = datetime.now()
+        self.start_time = time.perf_counter()
         self.stage_timings = {}
-        
-        # Configure handler with custom formatter
-        handler = logging.StreamHandler()
-        handler.setFormatter(OnboardingFormatter())
-        self.logger.addHandler(handler)
-        self.logger.setLevel(logging.INFO)
-        
-        # Disable propagation to avoid duplicate logs
-        self.logger.propagate = False
     
     def workflow_start(self, org_name: str, project_slug: str):
         """Mark the start of the workflow"""
-        self.start_time = datetime.now()
-        print(f"\n{Colors.HEADER}{'═'*70}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}🚀 ONBOARDING WORKFLOW{Colors.ENDC}")
-        print(f"{Colors.HEADER}{'═'*70}{Colors.ENDC}")
-        print(f"\n📍 Organization: {Colors.CYAN}{Colors.BOLD}{org_name}{Colors.ENDC}")
-        print(f"📍 Project: {Colors.CYAN}{Colors.BOLD}{project_slug}{Colors.ENDC}")
+        self.start_time = time.perf_counter()
+        _emit(
+            "\n" + _HEADER_BAR,
+            f"{Colors.HEADER}{Colors.BOLD}🚀 ONBOARDING WORKFLOW{Colors.ENDC}",
+            _HEADER_BAR,
+            f"\n📍 Organization: {Colors.CYAN}{Colors.BOLD}{org_name}{Colors.ENDC}",
+            f"📍 Project: {Colors.CYAN}{Colors.BOLD}{project_slug}{Colors.ENDC}"
+        )
     
     def stage_start(self, stage: str, icon: str = "🔍"):
         """Mark the start of a new workflow stage"""
         if self.current_stage:
             # Record timing for previous stage
-            self.stage_timings[self.current_stage] = (datetime.now() - self.stage_start_time).total_seconds()
+            self.stage_timings[self.current_stage] = time.perf_counter() - self.stage_start_time
         
         self.current_stage = stage
-        self.stage_start_time = datetime.now()
+        self.stage_start_time = time.perf_counter()
         
-        print(f"\n{Colors.BLUE}{Colors.BOLD}{icon} {stage.upper()}{Colors.ENDC}")
-        print(f"{Colors.DIM}{'─'*60}{Colors.ENDC}")
+        _emit(
+            f"\n{Colors.BLUE}{Colors.BOLD}{icon} {stage.upper()}{Colors.ENDC}",
+            _STAGE_RULE
+        )
     
     def info(self, message: str, icon: str = "  "):
         """Log info message with optional icon"""
-        print(f"{icon} {message}")
+        _emit(f"{icon} {message}")
     
     def success(self, message: str, elapsed: Optional[float] = None):
         """Log success message"""
         elapsed_str = f" {Colors.DIM}({elapsed:.2f}s){Colors.ENDC}" if elapsed else ""
-        print(f"     {Colors.GREEN}✓{Colors.ENDC} {message}{elapsed_str}")
+        _emit(f"     {Colors.GREEN}✓{Colors.ENDC} {message}{elapsed_str}")
     
     def warning(self, message: str):
         """Log warning message"""
-        print(f"     {Colors.YELLOW}⚠{Colors.ENDC} {message}")
+        _emit(f"     {Colors.YELLOW}⚠{Colors.ENDC} {message}")
     
     def error(self, message: str):
         """Log error message"""
-        print(f"     {Colors.RED}✗{Colors.ENDC} {message}")
+        _emit(f"     {Colors.RED}✗{Colors.ENDC} {message}")
     
     def contact_info(self, contacts: List[Dict[str, Any]]):
         """Display contact information"""
-        print(f"     {Colors.GREEN}✓{Colors.ENDC} Retrieved {len(contacts)} contacts:")
-        for c in contacts:
-            print(f"        • {c.get('first_name', '')} {c.get('last_name', '')} ({c.get('email', '')}) - {c.get('title', '')}")
+        _emit(
+            f"     {Colors.GREEN}✓{Colors.ENDC} Retrieved {len(contacts)} contacts:",
+            *(f"        • {c.get('first_name', '')} {c.get('last_name', '')} ({c.get('email', '')}) - {c.get('title', '')}"
+              for c in contacts)
+        )
     
     def batch_progress(self, current_batch: int, total_batches: int):
         """Show batch processing progress"""
@@ -84,70 +121,68 @@ class OnboardingLogger:
     def contact_progress(self, contact: Dict[str, Any], action: str, status: str = "processing"):
         """Show individual contact processing"""
         email = contact.get('email', 'Unknown')
-        name = f"{contact.get('first_name', '')} {contact.get('last_name', '')}"
-        
-        if status == "processing":
-            icon = "🔄"
-            color = Colors.YELLOW
-        elif status == "success":
-            icon = "✅"
-            color = Colors.GREEN
-        else:
-            icon = "❌"
-            color = Colors.RED
+        name = "%s %s" % (contact.get('first_name', ''), contact.get('last_name', ''))
         
-        print(f"  {icon} {color}{name}{Colors.ENDC} ({email}) - {action}")
+        icon, color = _CONTACT_STATUS.get(status, _CONTACT_STATUS["failed"])
+        _emit(_CONTACT_FMT % (icon, color, name, email, action))
     
     def committee_assignment(self, email: str, committee: str):
         """Log committee assignment"""
-        print(f"  ➕ {Colors.YELLOW}{email}{Colors.ENDC} → {Colors.CYAN}{committee}{Colors.ENDC}")
+        _emit(_COMMITTEE_FMT % (email, committee))
     
     def slack_invitation(self, email: str):
         """Log Slack invitation"""
-        print(f"  📨 {Colors.YELLOW}{email}{Colors.ENDC}")
+        _emit(_SLACK_FMT % email)
     
     def email_sent(self, email: str):
         """Log email sent"""
-        print(f"  ✉️  {Colors.YELLOW}{email}{Colors.ENDC}")
+        _emit(_EMAIL_FMT % email)
     
     def landscape_update(self, org: str, project: str, status: str):
         """Log landscape update"""
-        if status == "checking":
-            print(f"  🔍 Checking {Colors.CYAN}{org}{Colors.ENDC} in {Colors.CYAN}{project}{Colors.ENDC} landscape")
-        elif status == "updating":
-            print(f"  🖼️  Creating PR to update {Colors.CYAN}{org}{Colors.ENDC} logo")
-        elif status == "success":
-            print(f"     {Colors.GREEN}✓{Colors.ENDC} Landscape update complete")
+        template = _LANDSCAPE_STATUS.get(status)
+        if template:
+            _emit(template % {"org": org, "project": project})
     
     def workflow_complete(self, stats: Dict[str, Any]):
         """Mark workflow completion with summary"""
         if self.current_stage:
-            self.stage_timings[self.current_stage] = (datetime.now() - self.stage_start_time).total_seconds()
+            self.stage_timings[self.current_stage] = time.perf_counter() - self.stage_start_time
         
-        total_elapsed = (datetime.now() - self.start_time).total_seconds()
+        total_elapsed = time.perf_counter() - self.start_time
         
-        print(f"\n{Colors.HEADER}{'═'*70}{Colors.ENDC}")
-        print(f"{Colors.GREEN}{Colors.BOLD}✅ WORKFLOW COMPLETED{Colors.ENDC}")
-        print(f"{Colors.HEADER}{'═'*70}{Colors.ENDC}")
+        if not _IS_TTY:
+            # Piped output goes to a log sink: one structured line instead of the banner
+            _emit("workflow_complete " + dumps({**stats, "duration_seconds": round(total_elapsed, 2)}, default=str))
+            return
         
-        print(f"\n📊 Results:")
-        print(f"   • Total contacts: {stats.get('total_contacts', 0)}")
-        print(f"   • Successfully onboarded: {Colors.GREEN}{stats.get('successful_contacts', 0)}{Colors.ENDC}")
-        print(f"   • Failed: {Colors.RED}{stats.get('failed_contacts', 0)}{Colors.ENDC}")
-        print(f"   • Duration: {Colors.CYAN}{total_elapsed:.2f} seconds{Colors.ENDC}")
+        lines = [
+            "\n" + _HEADER_BAR,
+            f"{Colors.GREEN}{Colors.BOLD}✅ WORKFLOW COMPLETED{Colors.ENDC}",
+            _HEADER_BAR,
+            f"\n📊 Results:",
+            f"   • Total contacts: {stats.get('total_contacts', 0)}",
+            f"   • Successfully onboarded: {Colors.GREEN}{stats.get('successful_contacts', 0)}{Colors.ENDC}",
+            f"   • Failed: {Colors.RED}{stats.get('failed_contacts', 0)}{Colors.ENDC}",
+            *([f"   • Not processed: {Colors.YELLOW}{stats['not_processed']}{Colors.ENDC}"]
+              if stats.get('not_processed') else []),
+            f"   • Duration: {Colors.CYAN}{total_elapsed:.2f} seconds{Colors.ENDC}"
+        ]
         
         if stats.get('landscape_pr'):
-            print(f"\n🌍 Landscape PR: {Colors.CYAN}{stats['landscape_pr']}{Colors.ENDC}")
+            lines.append(f"\n🌍 Landscape PR: {Colors.CYAN}{stats['landscape_pr']}{Colors.ENDC}")
         
-        print(f"\n💾 Session data saved to database (ID: {stats.get('session_id', 'N/A')})")
-        print("")
+        lines.append(f"\n💾 Session data saved to database (ID: {stats.get('session_id', 'N/A')})")
+        lines.append("")
+        _emit(*lines)
 
-class OnboardingFormatter(logging.Formatter):
-    """Custom formatter that strips standard logging prefix for cleaner output"""
-    
-    def format(self, record):
-        # For our custom logger, just return the message
-        return record.getMessage()
+@lru_cache(maxsize=1)
+def get_onboarding_logger() -> OnboardingLogger:
+    """Get the shared workflow logger, creating it on first access"""
+    return OnboardingLogger()
 
-# Singleton instance
-onboarding_logger = OnboardingLogger()
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    # Lazy module attribute: the shared logger singleton
+    if name == "onboarding_logger":
+        return get_onboarding_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
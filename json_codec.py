@@ -0,0 +1,31 @@
+"""JSON serialization helpers with an optional orjson fast path, shared by the top-level runners and src/"""
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+    import json
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None, indent: bool = False) -> str:
+    """Serialize obj to a JSON string"""
+    return dumps_bytes(obj, default=default, indent=indent).decode()
+
+
+def dumps_bytes(obj: Any, default: Optional[Callable[[Any], Any]] = None,
+                indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=default, option=option)
+    if indent:
+        return json.dumps(obj, default=default, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, default=default, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+def loads(data: Any) -> Any:
+    """Deserialize a JSON str or bytes payload"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
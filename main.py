@@ -1,39 +1,109 @@
 import asyncio
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Set, Tuple, Callable
+from dataclasses import dataclass, asdict
 from datetime import datetime
-import json
+from types import MappingProxyType
+from operator import attrgetter
+from functools import lru_cache
 import logging
-from contextlib import asynccontextmanager
+import re
 from agno.agent import Agent, Function, Message
 from agno.models.openai import OpenAIChat
-from src.tools.mcp_database import OnboardingDatabaseToolsMCP
+import httpx
+from openai import AsyncOpenAI
+from src.tools.mcp_database import OnboardingDatabaseToolsMCP, overall_status
 import os
-from dotenv import load_dotenv
-from enhanced_logger import onboarding_logger as workflow_logger
+import sys
+from enhanced_logger import get_onboarding_logger
+from src.utils.serialization import dumps
 
-# Load environment variables from .env file
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=1)
+def _init_runtime():
+    """Load .env and configure logging once, when the workflow actually runs"""
+    from dotenv import load_dotenv
+    
+    # Load environment variables from .env file
+    load_dotenv()
+    
+    # Set up logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    # Check for API key
+    if not os.getenv("OPENAI_API_KEY"):
+        logger.error("OPENAI_API_KEY not found in environment variables")
+        logger.warning("Please set it with: export OPENAI_API_KEY='your-api-key-here'")
+        logger.warning("Or create a .env file with: OPENAI_API_KEY=your-api-key-here")
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Maximum number of contact batches processed at the same time
+BATCH_CONCURRENCY = 4
+# Maximum number of contacts processed at the same time within a batch
+CONTACT_CONCURRENCY = 10
+# Maximum number of committee add attempts in flight at the same time
+COMMITTEE_CONCURRENCY = 5
+
+# Fixed leading text of the committee add prompt, kept identical across contacts
+_ADD_MEMBER_PREFIX = (
+    "Add member to committee using add_committee_member tool with the parameters below.\n\n"
+    "Call the function exactly as: "
 )
-logger = logging.getLogger(__name__)
 
-# Check for API key
-api_key = os.environ.get('OPENAI_API_KEY')
-if not api_key:
-    logger.error("OPENAI_API_KEY not found in environment variables")
+# Background status writer: how long to gather updates before a bulk write, and its size cap
+STATUS_FLUSH_INTERVAL = 0.05
+STATUS_FLUSH_SIZE = 50
 
-# Additional check with instructions
-if not os.getenv("OPENAI_API_KEY"):
-    logger.warning("Please set it with: export OPENAI_API_KEY='your-api-key-here'")
-    logger.warning("Or create a .env file with: OPENAI_API_KEY=your-api-key-here")
+# One-shot workflow stage headers, tracked as bits in OrchestratorAgent._stages_started
+_STAGE_SLACK = 1
+_STAGE_EMAIL = 2
+
+# contact_type -> committee display name / welcome email template
+_COMMITTEE_NAMES = MappingProxyType({
+    "primary": "Governing Board",
+    "marketing": "Marketing Committee",
+    "technical": "Technical Committee"
+})
+_EMAIL_TEMPLATES = MappingProxyType({
+    "primary": "welcome_governing_board",
+    "marketing": "welcome_marketing_committee",
+    "technical": "welcome_technical_committee"
+})
+# contact_type -> slot in ProjectContext.committees
+_CT_IDX = MappingProxyType({"primary": 0, "marketing": 1, "technical": 2})
+
+# Committee name keyword -> contact_type; 'tech' also covers 'technical'
+_COMMITTEE_KEYWORDS = MappingProxyType({
+    "governing": "primary",
+    "board": "primary",
+    "marketing": "marketing",
+    "tech": "technical"
+})
+# All keywords in one alternation (longest first), so a name is scanned once however many there are
+_COMMITTEE_RE = re.compile(
+    '|'.join(map(re.escape, sorted(_COMMITTEE_KEYWORDS, key=len, reverse=True))),
+    re.IGNORECASE
+)
+
+# contact_type -> committee-specific Slack channels (on top of the base channels)
+_CHANNELS = MappingProxyType({
+    "primary": ("#board", "#announcements", "#strategic-planning"),
+    "marketing": ("#marketing", "#events", "#content-strategy", "#brand"),
+    "technical": ("#tech-discussion", "#architecture", "#dev-updates")
+})
+
+def _is_valid_contact(contact: Dict) -> bool:
+    """A contact needs an email, an id and a known contact type to be onboarded"""
+    return bool(contact.get('email') and contact.get('contact_id')
+                and contact.get('contact_type') in _COMMITTEE_NAMES)
+
+# dataclass(slots=True) needs Python 3.10; older interpreters fall back to a __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 # Data Models
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Contact:
     first_name: str
     last_name: str
@@ -43,24 +113,107 @@ class Contact:
     organization: str
     contact_id: str
     
+    # Field order shared by to_dict and to_columns
+    _ATTRS = ('first_name', 'last_name', 'title', 'email', 'contact_type', 'organization', 'contact_id')
+    _GET = attrgetter(*_ATTRS)
+    
     def to_dict(self):
-        return {
-            'first_name': self.first_name,
-            'last_name': self.last_name,
-            'title': self.title,
-            'email': self.email,
-            'contact_type': self.contact_type,
-            'organization': self.organization,
-            'contact_id': self.contact_id
-        }
+        return dict(zip(self._ATTRS, self._GET(self)))
+    
+    @classmethod
+    def to_columns(cls, contacts: List["Contact"]) -> Dict[str, List[str]]:
+        """Column-oriented view of many contacts, for bulk inserts"""
+        rows = [cls._GET(contact) for contact in contacts]
+        return {attr: [row[i] for row in rows] for i, attr in enumerate(cls._ATTRS)}
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ProjectContext:
     organization_name: str
     project_slug: str
     member_id: Optional[str] = None
     project_id: Optional[str] = None
-    committees: Optional[Dict[str, str]] = None  # contact_type -> committee_id mapping
+    # committee_id per contact type, indexed by _CT_IDX
+    committees: Tuple[Optional[str], Optional[str], Optional[str]] = (None, None, None)
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class ProcessingPlan:
+    """Everything derived from a contact's type, computed once per contact"""
+    template: str
+    committee_name: str
+    channels: Tuple[str, ...]
+    committee_id: Optional[str]
+
+@lru_cache(maxsize=64)
+def _slack_channels(contact_type: Optional[str], project_slug: str) -> Tuple[str, ...]:
+    """Base channels plus the committee-specific ones for a contact type"""
+    return ("#general", "#welcome", f"#{project_slug}") + _CHANNELS.get(contact_type, ())
+
+def build_plan(contact: Dict, committees: Tuple[Optional[str], ...], project_slug: str) -> ProcessingPlan:
+    """Resolve template, committee and Slack channels for a contact"""
+    contact_type = contact.get('contact_type')
+    idx = _CT_IDX.get(contact_type)
+    return ProcessingPlan(
+        template=_EMAIL_TEMPLATES.get(contact_type, "welcome_general"),
+        committee_name=_COMMITTEE_NAMES.get(contact_type, "Project Committee"),
+        channels=_slack_channels(contact_type, project_slug),
+        committee_id=committees[idx] if idx is not None else None
+    )
+
+@lru_cache(maxsize=1)
+def _shared_openai_client() -> Optional[AsyncOpenAI]:
+    """One pooled keep-alive client shared by every agent's model, created on first use"""
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        # Let agno build its own client and report the missing key on first call
+        return None
+    return AsyncOpenAI(api_key=api_key, http_client=httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60)
+    ))
+
+def _chat_model(model_id: str = "gpt-4o-mini") -> OpenAIChat:
+    """OpenAIChat model that reuses the shared connection pool"""
+    return OpenAIChat(id=model_id, async_client=_shared_openai_client())
+
+async def _close_shared_openai_client():
+    """Close the shared client's connections; the next agent creates a fresh one"""
+    if _shared_openai_client.cache_info().currsize:
+        client = _shared_openai_client()
+        _shared_openai_client.cache_clear()
+        if client is not None:
+            await client.close()
+
+# Overall contact result statuses that count as failures
+_FAILED_RESULTS = frozenset(('error', 'partial_failure'))
+# Committee step statuses that count as success
+_COMMITTEE_OK = frozenset(('success', 'already_member'))
+# Stand-in for a step that has no result yet
+_NO_RESULT = MappingProxyType({})
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class FailureStats:
+    """Failure counts over a list of contact results"""
+    total: int
+    failures: int
+    committee_failures: int
+    slack_failures: int
+    email_failures: int
+    
+    @property
+    def failure_rate(self) -> float:
+        return self.failures / self.total if self.total else 0.0
+
+def summarize_results(results: List[Dict]) -> FailureStats:
+    """Count failed contacts and their failed steps in a single pass"""
+    failures = committee = slack = email = 0
+    for r in results:
+        if r.get('status') not in _FAILED_RESULTS:
+            continue
+        failures += 1
+        # Steps are None when the contact failed before reaching them
+        committee += (r.get('committee') or _NO_RESULT).get('status') == 'failed'
+        slack += (r.get('slack') or _NO_RESULT).get('status') == 'failed'
+        email += (r.get('email') or _NO_RESULT).get('status') == 'failed'
+    return FailureStats(len(results), failures, committee, slack, email)
 
 # Database operations are now handled by OnboardingDatabaseTools
 # from mcp_database_abstraction module - no SQL queries needed
@@ -69,11 +222,45 @@ class ProjectContext:
 class DatabaseAgent(Agent):
     """Agent responsible for database operations via MCP"""
     
+    # Task prefix -> OnboardingDatabaseToolsMCP method, checked in order before using the model
+    _ROUTES = tuple((re.compile(pattern, re.IGNORECASE), method) for pattern, method in (
+        (r"initialize database schema\b", "initialize"),
+        (r"create new onboarding session\b", "create_onboarding_session"),
+        (r"add contacts to onboarding session\b", "add_contacts_bulk"),
+        (r"add contact to onboarding session\b", "add_contact_to_session"),
+        (r"bulk update contact statuses\b", "update_contact_statuses_bulk"),
+        (r"update contact statuses\b", "update_contact_statuses"),
+        (r"update contact status\b", "update_contact_status"),
+        (r"update session statistics\b", "update_session_statistics"),
+        (r"flush session statistics\b", "flush_session_statistics"),
+        (r"generate session report\b", "get_session_report")
+    ))
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _shared_tools() -> Tuple[OnboardingDatabaseToolsMCP, Tuple[Function, ...]]:
+        """Create the database tools and their Function schemas once, on first use"""
+        db_tools = OnboardingDatabaseToolsMCP()
+        return db_tools, tuple(Function.from_callable(method) for method in (
+            db_tools.initialize,
+            db_tools.create_onboarding_session,
+            db_tools.add_contact_to_session,
+            db_tools.add_contacts_bulk,
+            db_tools.update_contact_statuses,
+            db_tools.update_contact_statuses_bulk,
+            db_tools.update_overall_status,
+            db_tools.update_session_statistics,
+            db_tools.flush_session_statistics,
+            db_tools.get_session_report,
+            db_tools.find_contacts_by_status,
+            db_tools.get_contact_timeline
+        ))
+    
     def __init__(self, mcp_server_type: str = "sqlite"):
-        self.db_tools = OnboardingDatabaseToolsMCP()
+        self.db_tools, tools = self._shared_tools()
         super().__init__(
             name="DatabaseManager",
-            model=OpenAIChat(id="gpt-4o-mini"),
+            model=_chat_model(),
             instructions=f"""You manage all database operations through MCP's CRUD tools.
             Your tasks:
             1. Initialize database schema if not exists
@@ -92,14 +279,15 @@ class DatabaseAgent(Agent):
             IMPORTANT: When handling "Update contact status" requests:
             - Look at the context for 'contact_id' and 'status_type'
             - Based on status_type, call the appropriate method:
-              - "committee" -> update_contact_committee_status
-              - "slack" -> update_contact_slack_status  
-              - "email" -> update_contact_email_status
-              - "overall" -> update_overall_status
-            - Pass any additional_data as appropriate parameters
+              - "committee", "slack" or "email" -> update_contact_statuses, passing the
+                status as the keyword of the same name (committee=..., slack=..., email=...)
+              - "overall" with a status -> update_contact_statuses(overall=...);
+                without one -> update_overall_status
+            - Pass any additional_data as appropriate parameters (committee_id, slack_user_id)
+            - When several statuses change at once, set them all in ONE update_contact_statuses call
             
             Example: If context has {{"contact_id": 1, "status_type": "committee", "status": "success", "additional_data": {{"committee_id": "123"}}}}
-            You should call: update_contact_committee_status(contact_id=1, status="success", committee_id="123")
+            You should call: update_contact_statuses(contact_id=1, committee="success", committee_id="123")
             
             When asked to "Add contact to onboarding session":
             - You will see "Parameters to use:" followed by session_id and contact
@@ -110,24 +298,24 @@ class DatabaseAgent(Agent):
             
             All database operations use MCP's CRUD tools - no SQL queries.
             """,
-            tools=[
-                Function.from_callable(self.db_tools.initialize),
-                Function.from_callable(self.db_tools.create_onboarding_session),
-                Function.from_callable(self.db_tools.add_contact_to_session),
-                Function.from_callable(self.db_tools.update_contact_committee_status),
-                Function.from_callable(self.db_tools.update_contact_slack_status),
-                Function.from_callable(self.db_tools.update_contact_email_status),
-                Function.from_callable(self.db_tools.update_overall_status),
-                Function.from_callable(self.db_tools.update_session_statistics),
-                Function.from_callable(self.db_tools.get_session_report),
-                Function.from_callable(self.db_tools.find_contacts_by_status),
-                Function.from_callable(self.db_tools.get_contact_timeline)
-            ]
+            tools=list(tools)
         )
         self.mcp_server_type = mcp_server_type
+    
+    def route(self, task: str) -> Optional[Callable[..., Any]]:
+        """Return the tool for a deterministic task, or None if the model should handle it"""
+        for pattern, method in self._ROUTES:
+            if pattern.match(task):
+                return getattr(self.db_tools, method)
+        return None
 
 # Import config and stub services
-from config import config
+from config import get_config
+from src.utils.cache import async_ttl_cache
+from src.utils.batching import BatchLoader
+from src.utils.retry import retry_async, RETRIES_EXHAUSTED
+from src.utils.ratelimit import RateLimiter, UNLIMITED
+from src.utils.parsing import parse_agent_content
 from stub_services import (
     get_stub_member_service,
     get_stub_project_service,
@@ -137,82 +325,107 @@ from stub_services import (
     get_stub_database_service
 )
 
+def _lookup_ttl() -> Optional[float]:
+    """Lookup cache lifetime: stub data never changes, live data expires after 5 minutes"""
+    return None if get_config().is_using_stubs() else 300
+
+def _log_cache_hit(name: str, key: tuple):
+    get_onboarding_logger().info(f"cache_hit {name}{key}", "  ⚡")
+
+@lru_cache(maxsize=256)
+def _service_request(endpoint: str, description: str, params: Tuple[Tuple[str, str], ...] = ()) -> Dict:
+    """Build (and memoize) a production request descriptor; callers must not mutate it"""
+    request = {"endpoint": endpoint}
+    if params:
+        request["params"] = dict(params)
+    request["description"] = description
+    return request
+
 # Tool Definitions
 class MemberServiceTools:
     """Tools for Member Service API interactions"""
     
     @staticmethod
+    @async_ttl_cache(maxsize=512, ttl=_lookup_ttl, on_hit=_log_cache_hit)
     async def get_member_by_organization(org_name: str) -> Dict:
         """Get member ID by organization name"""
-        if config.is_using_stubs():
-            service = get_stub_member_service()
-            return await service.get_member_by_organization(org_name)
+        if get_config().is_using_stubs():
+            return get_stub_member_service().get_member_by_organization_sync(org_name)
         
         # Production API call would go here
-        return {
-            "endpoint": "GET /member-service/members",
-            "params": {
-                "organization_name": org_name,
-                "status": "active"
-            },
-            "description": "Fetch member record by organization name"
-        }
+        return _service_request(
+            "GET /member-service/members",
+            "Fetch member record by organization name",
+            (("organization_name", org_name), ("status", "active"))
+        )
     
     @staticmethod
     async def get_member_contacts(member_id: str) -> List[Dict]:
         """Fetch all contacts for a specific member"""
-        if config.is_using_stubs():
-            service = get_stub_member_service()
-            result = await service.get_member_contacts(member_id)
-            return result
+        if get_config().is_using_stubs():
+            return get_stub_member_service().get_member_contacts_sync(member_id)
+        
+        return _service_request(
+            f"GET /member-service/members/{member_id}/contacts",
+            "Fetch all contacts associated with the member organization"
+        )
+    
+    @staticmethod
+    async def get_member_with_contacts(org_name: str) -> Dict:
+        """Get member ID and all of its contacts in a single call"""
+        member_result = await MemberServiceTools.get_member_by_organization(org_name)
+        if not member_result.get('member_id'):
+            return member_result
         
+        contacts_result = await MemberServiceTools.get_member_contacts(member_result['member_id'])
+        contacts = contacts_result.get('contacts', [])
         return {
-            "endpoint": f"GET /member-service/members/{member_id}/contacts",
-            "description": "Fetch all contacts associated with the member organization"
+            "status": "success",
+            "member_id": member_result['member_id'],
+            "member_info": member_result.get('member_info', {}),
+            "contacts": contacts,
+            "count": len(contacts)
         }
     
     @staticmethod
     async def get_contact_details(member_id: str, contact_id: str) -> Dict:
         """Get detailed information about a specific contact"""
-        return {
-            "endpoint": f"GET /member-service/members/{member_id}/contacts/{contact_id}",
-            "description": "Retrieve full contact details"
-        }
+        return _service_request(
+            f"GET /member-service/members/{member_id}/contacts/{contact_id}",
+            "Retrieve full contact details"
+        )
 
 class ProjectServiceTools:
     """Tools for Project Service API interactions"""
     
     @staticmethod
+    @async_ttl_cache(maxsize=512, ttl=_lookup_ttl, on_hit=_log_cache_hit)
     async def get_project_by_slug(project_slug: str) -> Dict:
         """Get project details by slug"""
-        if config.is_using_stubs():
-            service = get_stub_project_service()
-            return await service.get_project_by_slug(project_slug)
+        if get_config().is_using_stubs():
+            return get_stub_project_service().get_project_by_slug_sync(project_slug)
         
-        return {
-            "endpoint": f"GET /project-service/projects",
-            "params": {
-                "slug": project_slug
-            },
-            "description": "Fetch project details by slug"
-        }
+        return _service_request(
+            "GET /project-service/projects",
+            "Fetch project details by slug",
+            (("slug", project_slug),)
+        )
     
     @staticmethod
     async def get_project_committees(project_id: str) -> List[Dict]:
         """Get all committees for a project"""
-        if config.is_using_stubs():
-            service = get_stub_project_service()
-            return await service.get_project_committees(project_id)
+        if get_config().is_using_stubs():
+            return get_stub_project_service().get_project_committees_sync(project_id)
         
-        return {
-            "endpoint": f"GET /project-service/projects/{project_id}/committees",
-            "description": "Fetch all committees in the project"
-        }
+        return _service_request(
+            f"GET /project-service/projects/{project_id}/committees",
+            "Fetch all committees in the project"
+        )
     
     @staticmethod
     async def add_committee_member(project_id: str, committee_id: str, member_data: Dict) -> Dict:
         """Add a member to a committee"""
-        if config.is_using_stubs():
+        if get_config().is_using_stubs():
             service = get_stub_project_service()
             return await service.add_committee_member(project_id, committee_id, member_data)
         
@@ -222,20 +435,37 @@ class ProjectServiceTools:
             "description": "Add contact to specified committee"
         }
     
+    @staticmethod
+    async def get_committee_members(project_id: str, committee_id: str) -> Dict:
+        """List the current members of a committee"""
+        if get_config().is_using_stubs():
+            return get_stub_project_service().get_committee_members_sync(project_id, committee_id)
+        
+        return _service_request(
+            f"GET /project-service/projects/{project_id}/committees/{committee_id}/committee_members",
+            "List committee members"
+        )
+    
+    @staticmethod
+    async def check_committee_memberships(project_id: str, members: List[Dict]) -> Dict:
+        """Check several {committee_id, email} pairs in one call; results keep the input order"""
+        results = await asyncio.gather(*(
+            ProjectServiceTools.check_committee_membership(project_id, member['committee_id'], member['email'])
+            for member in members
+        ))
+        return {"status": "success", "results": list(results)}
+    
     @staticmethod
     async def check_committee_membership(project_id: str, committee_id: str, email: str) -> Dict:
         """Check if contact is already in committee"""
-        if config.is_using_stubs():
-            service = get_stub_project_service()
-            return await service.check_committee_membership(project_id, committee_id, email)
+        if get_config().is_using_stubs():
+            return get_stub_project_service().check_committee_membership_sync(project_id, committee_id, email)
         
-        return {
-            "endpoint": f"GET /project-service/projects/{project_id}/committees/{committee_id}/committee_members",
-            "params": {
-                "email": email
-            },
-            "description": "Verify existing committee membership"
-        }
+        return _service_request(
+            f"GET /project-service/projects/{project_id}/committees/{committee_id}/committee_members",
+            "Verify existing committee membership",
+            (("email", email),)
+        )
 
 class SlackTools:
     """Tools for Slack operations"""
@@ -281,15 +511,9 @@ class EmailTools:
     @staticmethod
     async def send_welcome_email(contact: Dict, project_info: Dict) -> Dict:
         """Send personalized welcome email"""
-        template_map = {
-            "primary": "welcome_governing_board",
-            "marketing": "welcome_marketing_committee",
-            "technical": "welcome_technical_committee"
-        }
-        
         return {
             "to": contact['email'],
-            "template": template_map.get(contact['contact_type'], "welcome_general"),
+            "template": _EMAIL_TEMPLATES.get(contact['contact_type'], "welcome_general"),
             "variables": {
                 "first_name": contact['first_name'],
                 "organization": contact['organization'],
@@ -302,12 +526,7 @@ class EmailTools:
     @staticmethod
     def get_committee_name(contact_type: str) -> str:
         """Get committee name based on contact type"""
-        committee_map = {
-            "primary": "Governing Board",
-            "marketing": "Marketing Committee",
-            "technical": "Technical Committee"
-        }
-        return committee_map.get(contact_type, "Project Committee")
+        return _COMMITTEE_NAMES.get(contact_type, "Project Committee")
 
 class LandscapeTools:
     """Tools for Project Landscape operations"""
@@ -338,13 +557,21 @@ class LandscapeTools:
 class MemberContactFetcherAgent(Agent):
     """Agent responsible for fetching member contacts"""
     
+    # Built once at class definition; Function.from_callable inspects signatures
+    _TOOLS = [
+        Function.from_callable(MemberServiceTools.get_member_by_organization),
+        Function.from_callable(MemberServiceTools.get_member_contacts),
+        Function.from_callable(MemberServiceTools.get_member_with_contacts),
+        Function.from_callable(MemberServiceTools.get_contact_details)
+    ]
+    
     def __init__(self):
         super().__init__(
             name="MemberContactFetcher",
-            model=OpenAIChat(id="gpt-4o-mini"),
+            model=_chat_model(),
             instructions="""You are responsible for fetching contacts from the Member Service.
             
-            IMPORTANT: You handle TWO different types of requests:
+            IMPORTANT: You handle THREE different types of requests:
             
             1. "Get member ID for organization X" - Use get_member_by_organization tool
                - This returns: {"status": "success", "member_id": "...", "member_info": {...}}
@@ -352,26 +579,35 @@ class MemberContactFetcherAgent(Agent):
             2. "Fetch all contacts for organization X" - First get member_id, then use get_member_contacts tool
                - This returns: {"status": "success", "contacts": [...], "count": N}
             
+            3. "Get member and contacts for organization X" - Use get_member_with_contacts tool
+               - This returns: {"status": "success", "member_id": "...", "member_info": {...}, "contacts": [...], "count": N}
+            
             CRITICAL: 
             - When asked to "Get member ID", ONLY use get_member_by_organization
             - When asked to "Fetch all contacts", use BOTH tools in sequence
+            - When asked to "Get member and contacts", ONLY use get_member_with_contacts
             - Return the EXACT JSON response from the tool
             - DO NOT interpret or modify the response
             """,
-            tools=[
-                Function.from_callable(MemberServiceTools.get_member_by_organization),
-                Function.from_callable(MemberServiceTools.get_member_contacts),
-                Function.from_callable(MemberServiceTools.get_contact_details)
-            ]
+            tools=list(self._TOOLS)
         )
 
 class ProjectCommitteeAgent(Agent):
     """Agent responsible for managing project committees"""
     
+    _TOOLS = [
+        Function.from_callable(ProjectServiceTools.get_project_by_slug),
+        Function.from_callable(ProjectServiceTools.get_project_committees),
+        Function.from_callable(ProjectServiceTools.add_committee_member),
+        Function.from_callable(ProjectServiceTools.check_committee_membership),
+        Function.from_callable(ProjectServiceTools.check_committee_memberships),
+        Function.from_callable(ProjectServiceTools.get_committee_members)
+    ]
+    
     def __init__(self):
         super().__init__(
             name="ProjectCommitteeManager",
-            model=OpenAIChat(id="gpt-4o-mini"),
+            model=_chat_model(),
             instructions="""You manage project committee memberships.
             
             IMPORTANT: You handle different types of requests:
@@ -399,27 +635,36 @@ class ProjectCommitteeAgent(Agent):
                    member_data=<entire member_data dict from context>
                )
             
+            5. "Bulk check committee memberships" - Use check_committee_memberships tool
+               Parameters: project_id, members (the ENTIRE list of {committee_id, email} objects)
+               Returns: {"status": "success", "results": [...]} with one result per member, in order
+            
+            6. "List members of committee X" - Use get_committee_members tool
+               Parameters: project_id, committee_id
+               Returns: {"status": "success", "members": [...], "count": N}
+            
             CRITICAL:
             - Return the EXACT JSON response from tools
             - Do NOT interpret or summarize
             - ALWAYS use the Context section when provided
             - The member_data parameter MUST be the complete dictionary from the context
             """,
-            tools=[
-                Function.from_callable(ProjectServiceTools.get_project_by_slug),
-                Function.from_callable(ProjectServiceTools.get_project_committees),
-                Function.from_callable(ProjectServiceTools.add_committee_member),
-                Function.from_callable(ProjectServiceTools.check_committee_membership)
-            ]
+            tools=list(self._TOOLS)
         )
 
 class SlackOnboardingAgent(Agent):
     """Agent responsible for Slack workspace management"""
     
+    _TOOLS = [
+        Function.from_callable(SlackTools.invite_to_workspace),
+        Function.from_callable(SlackTools.add_to_channel),
+        Function.from_callable(SlackTools.send_direct_message)
+    ]
+    
     def __init__(self):
         super().__init__(
             name="SlackOnboarder",
-            model=OpenAIChat(id="gpt-4o-mini"),
+            model=_chat_model(),
             instructions="""You manage Slack workspace invitations and channel assignments.
             Your tasks:
             1. Send workspace invitations to new contacts
@@ -435,20 +680,20 @@ class SlackOnboardingAgent(Agent):
             4. Handle invitation failures with smart retry logic
             5. Return Slack user ID once joined
             """,
-            tools=[
-                Function.from_callable(SlackTools.invite_to_workspace),
-                Function.from_callable(SlackTools.add_to_channel),
-                Function.from_callable(SlackTools.send_direct_message)
-            ]
+            tools=list(self._TOOLS)
         )
 
 class EmailCommunicationAgent(Agent):
     """Agent responsible for email communications"""
     
+    _TOOLS = [
+        Function.from_callable(EmailTools.send_welcome_email)
+    ]
+    
     def __init__(self):
         super().__init__(
             name="EmailCommunicator",
-            model=OpenAIChat(id="gpt-4o-mini"),
+            model=_chat_model(),
             instructions="""You handle all email communications with contacts.
             
             IMPORTANT: The send_welcome_email tool expects EXACTLY 2 parameters:
@@ -466,18 +711,21 @@ class EmailCommunicationAgent(Agent):
             2. The tool handles all the template selection and personalization
             3. Just pass the contact and project_info exactly as provided
             """,
-            tools=[
-                Function.from_callable(EmailTools.send_welcome_email)
-            ]
+            tools=list(self._TOOLS)
         )
 
 class LandscapeUpdateAgent(Agent):
     """Agent responsible for updating project landscape"""
     
+    _TOOLS = [
+        Function.from_callable(LandscapeTools.update_member_logo),
+        Function.from_callable(LandscapeTools.check_landscape_entry)
+    ]
+    
     def __init__(self):
         super().__init__(
             name="LandscapeUpdater",
-            model=OpenAIChat(id="gpt-4o-mini"),
+            model=_chat_model(),
             instructions="""You manage updates to the project landscape.
             Your tasks:
             1. Check if organization entry exists in project landscape
@@ -489,10 +737,7 @@ class LandscapeUpdateAgent(Agent):
             4. Create pull request with changes
             5. Monitor PR status
             """,
-            tools=[
-                Function.from_callable(LandscapeTools.update_member_logo),
-                Function.from_callable(LandscapeTools.check_landscape_entry)
-            ]
+            tools=list(self._TOOLS)
         )
 
 class OrchestratorAgent(Agent):
@@ -501,7 +746,7 @@ class OrchestratorAgent(Agent):
     def __init__(self, project_context: ProjectContext, mcp_server_type: str = "sqlite"):
         super().__init__(
             name="Orchestrator",
-            model=OpenAIChat(id="gpt-4o-mini"),
+            model=_chat_model(),
             instructions=f"""You are the master coordinator for onboarding contacts from {project_context.organization_name} 
             to the {project_context.project_slug} project.
             
@@ -538,7 +783,36 @@ class OrchestratorAgent(Agent):
         self.project_context = project_context
         self.mcp_server_type = mcp_server_type
         self.session_id = None
-        self.workflow_logger = workflow_logger  # Add enhanced logger
+        self.workflow_logger = get_onboarding_logger()  # Add enhanced logger
+        self._batch_sem = None
+        self._committee_sem = None
+        self._stages_started = 0  # bitmask of _STAGE_* headers already logged
+        self._plans: Dict[Optional[str], ProcessingPlan] = {}  # contact_type -> plan
+        self._member_emails: Dict[str, Set[str]] = {}  # committee_id -> lowercased member emails
+        # Per-service request ceilings for the per-contact calls; stubs have no quota to protect
+        config = get_config()
+        # Failure rate (MAX_FAILURE_RATE) past which every remaining batch is cancelled
+        self._max_failure_rate = config.agent_config['max_failure_rate']
+        self._limiters = {
+            service: UNLIMITED if config.is_using_stubs() else RateLimiter(rate, period)
+            for service, (rate, period) in config.service_rate_limits.items()
+        }
+        
+        # Channels and committee names depend only on contact type and project slug
+        slug = project_context.project_slug
+        self._channels_by_type = {contact_type: _slack_channels(contact_type, slug) for contact_type in _CT_IDX}
+        self._channels_default = _slack_channels(None, slug)
+        self._committee_name_by_type = {contact_type: _COMMITTEE_NAMES[contact_type] for contact_type in _CT_IDX}
+        self._stats = {}
+        self._member_contacts = None
+        self._project_info: Optional[Dict] = None  # welcome email project info, shared by all contacts
+        
+        # Coalesce per-contact membership checks into batch calls
+        self._membership_loader = BatchLoader(self._check_memberships, max_batch=CONTACT_CONCURRENCY)
+        # Status updates are queued here and written in bulk by a background task
+        self._status_queue: Optional[asyncio.Queue] = None
+        self._status_writer: Optional[asyncio.Task] = None
+        self._failed_status_updates: List[Dict] = []  # retried once when the writer is stopped
         
         # Initialize sub-agents
         self.contact_fetcher = MemberContactFetcherAgent()
@@ -587,61 +861,133 @@ class OrchestratorAgent(Agent):
             self.workflow_logger.stage_start("FETCHING CONTACTS", "👥")
             self.workflow_logger.info("Retrieving contact list...", "  📋")
             
-            contacts_result = await self.delegate_to_agent(
-                self.contact_fetcher,
-                f"Fetch all contacts for organization '{self.project_context.organization_name}'",
-                {"member_id": self.project_context.member_id}
-            )
+            contacts_result = self._member_contacts
+            if contacts_result is None:
+                contacts_result = await self.delegate_to_agent(
+                    self.contact_fetcher,
+                    f"Fetch all contacts for organization '{self.project_context.organization_name}'",
+                    {"member_id": self.project_context.member_id}
+                )
             
-            logger.debug(f"Contact fetch result: {contacts_result}")
+            logger.debug("Contact fetch result: %s", contacts_result)
             contacts = contacts_result.get('contacts', [])
             self.workflow_logger.contact_info(contacts)
             
-            # Add contacts to database via MCP
-            contact_db_mapping = {}
+            # Skip contacts missing required data before any DB or agent work
+            valid_contacts = [c for c in contacts if _is_valid_contact(c)]
+            if len(valid_contacts) != len(contacts):
+                self.workflow_logger.warning(
+                    f"Skipping {len(contacts) - len(valid_contacts)} contacts with missing email, id or contact type"
+                )
+                contacts = valid_contacts
+            
+            # add_contacts_bulk rejects a batch that repeats a contact_id, so keep the first of each
+            first_by_id: Dict[str, Dict] = {}
             for contact in contacts:
-                add_result = await self.delegate_to_agent(
-                    self.db_manager,
-                    "Add contact to onboarding session",
-                    {
-                        "session_id": self.session_id,
-                        "contact": contact
-                    }
+                first_by_id.setdefault(contact['contact_id'], contact)
+            unique_contacts = list(first_by_id.values())
+            if len(unique_contacts) != len(contacts):
+                self.workflow_logger.warning(
+                    f"Skipping {len(contacts) - len(unique_contacts)} contacts with a duplicate contact id"
                 )
-                contact_db_mapping[contact['contact_id']] = add_result.get('contact_onboarding_id')
+                contacts = unique_contacts
+            
+            # Add all contacts to the database via MCP in one all-or-nothing call (still one
+            # create_record per contact underneath: the MCP server has no multi-row insert)
+            add_result = await self.delegate_to_agent(
+                self.db_manager,
+                "Add contacts to onboarding session",
+                {
+                    "session_id": self.session_id,
+                    "contacts": contacts
+                }
+            )
+            if add_result.get('status') != 'success':
+                # Nothing was written, so there are no rows to track the contacts' progress in
+                self.workflow_logger.error(f"Failed to add contacts to session: {add_result.get('message')}")
+                return {"status": "error", "message": f"Failed to add contacts to session: {add_result.get('message')}"}
+            added_ids = {
+                entry['contact_id']: entry['contact_onboarding_id']
+                for entry in add_result.get('contacts', [])
+            }
+            contact_db_mapping = {contact['contact_id']: added_ids.get(contact['contact_id']) for contact in contacts}
             
             # Step 3: Setup committees
             self.workflow_logger.stage_start("COMMITTEE ASSIGNMENTS", "🏛️")
             committee_setup = await self.setup_committees()
             if not committee_setup.get('success'):
                 self.workflow_logger.warning("Committee setup incomplete, proceeding with available committees")
+            if not AgentSystemConfig.COMMITTEE_ADD_IS_IDEMPOTENT:
+                await self.prefetch_committee_rosters()
             
-            # Step 4: Process contacts in batches
+            # Step 4: Process contacts in batches, several batches in flight at once
             batch_size = 3  # Reduced to avoid rate limits
+            # Created here rather than in __init__ so it binds to the running loop on 3.9
+            self._batch_sem = asyncio.Semaphore(BATCH_CONCURRENCY)
+            batches = [contacts[i:i + batch_size] for i in range(0, len(contacts), batch_size)]
             all_results = []
+            # Counted by each contact's stored overall status, as update_session_statistics
+            # would; contacts that never finish (e.g. after a failure-rate stop) stay pending
+            self._stats = {
+                "total_contacts": len(contacts),
+                "successful_contacts": 0,
+                "failed_contacts": 0,
+                "pending_contacts": len(contacts)
+            }
+            failures = 0
+            # Judge the failure rate only once at least a batch worth of results is in
+            min_sample = min(batch_size, len(contacts))
+            # Set once by record_result when the failure rate passes the threshold; every
+            # batch checks it, so one stop decision halts the whole workflow
+            failure_stop = asyncio.Event()
             
-            for i in range(0, len(contacts), batch_size):
-                batch = contacts[i:i + batch_size]
-                self.workflow_logger.batch_progress(
-                    i//batch_size + 1, 
-                    (len(contacts)-1)//batch_size + 1
-                )
-                
-                batch_results = await self.process_contact_batch(batch, contact_db_mapping)
-                all_results.extend(batch_results)
-                
-                # Update session stats via MCP
-                await self.delegate_to_agent(
-                    self.db_manager,
-                    "Update session statistics",
-                    {"session_id": self.session_id}
+            def record_result(result: Dict) -> bool:
+                """Collect one contact result; returns True once the failure threshold is crossed"""
+                nonlocal failures
+                all_results.append(result)
+                # Track session stats in memory from the overall status each contact's row was
+                # given, so the flushed totals match get_session_report; flushed once at the end
+                stored = result['overall_status']
+                if stored == "completed":
+                    self._stats["successful_contacts"] += 1
+                elif stored == "failed":
+                    self._stats["failed_contacts"] += 1
+                if stored != "pending":
+                    self._stats["pending_contacts"] -= 1
+                # Same failure rule as summarize_results
+                failures += result.get('status') in _FAILED_RESULTS
+                if len(all_results) >= min_sample and failures / len(all_results) > self._max_failure_rate:
+                    failure_stop.set()
+                return failure_stop.is_set()
+            
+            batch_tasks = [
+                asyncio.ensure_future(self._run_batch(n, len(batches), batch, contact_db_mapping,
+                                                      record_result, failure_stop))
+                for n, batch in enumerate(batches, 1)
+            ]
+            
+            try:
+                for next_batch in asyncio.as_completed(batch_tasks):
+                    await next_batch
+                    if failure_stop.is_set():
+                        break
+            finally:
+                # Stop any batches that have not finished yet
+                pending = [task for task in batch_tasks if not task.done()]
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+            
+            not_processed = len(contacts) - len(all_results)
+            if failure_stop.is_set():
+                summary = summarize_results(all_results)
+                self.workflow_logger.warning(
+                    f"High failure rate detected: {summary.failure_rate:.2%} (limit {self._max_failure_rate:.0%})"
                 )
-                
-                # Check failure rate
-                failure_rate = self.calculate_failure_rate(all_results)
-                if failure_rate > 0.2:
-                    self.workflow_logger.warning(f"High failure rate detected: {failure_rate:.2%}")
-                    await self.handle_high_failure_rate(all_results)
+                await self.handle_high_failure_rate(all_results, summary)
+            if not_processed:
+                # Left pending in the session; reported rather than dropped
+                self.workflow_logger.warning(f"Stopped early: {not_processed} contacts were not processed")
             
             # Step 5: Update project landscape
             self.workflow_logger.stage_start("LANDSCAPE UPDATE", "🌍")
@@ -661,6 +1007,14 @@ class OrchestratorAgent(Agent):
                     "success"
                 )
             
+            # Finish the queued status writes, then flush the in-memory session stats via MCP
+            await self._stop_status_writer()
+            await self.delegate_to_agent(
+                self.db_manager,
+                "Flush session statistics",
+                {"session_id": self.session_id, "stats": self._stats}
+            )
+            
             # Step 6: Generate final report from database via MCP
             report_result = await self.delegate_to_agent(
                 self.db_manager,
@@ -669,19 +1023,14 @@ class OrchestratorAgent(Agent):
             )
             report = report_result.get('report', {})
             report['landscape_update'] = landscape_result
-            
-            # Final session update via MCP
-            await self.delegate_to_agent(
-                self.db_manager,
-                "Update session statistics",
-                {"session_id": self.session_id}
-            )
+            report['not_processed'] = not_processed
             
             # Complete workflow
             stats = {
                 'total_contacts': report.get('session', {}).get('total_contacts', 0),
                 'successful_contacts': report.get('session', {}).get('successful_contacts', 0),
                 'failed_contacts': report.get('session', {}).get('failed_contacts', 0),
+                'not_processed': not_processed,
                 'session_id': self.session_id,
                 'landscape_pr': landscape_result.get('pr_url')
             }
@@ -690,26 +1039,28 @@ class OrchestratorAgent(Agent):
             return report
             
         except Exception as e:
-            logger.error(f"Orchestration error: {str(e)}")
+            logger.error("Orchestration error: %s", e)
             self.workflow_logger.error(f"Orchestration error: {str(e)}")
-            return {"status": "error", "message": str(e), "context": self.project_context.__dict__}
+            await self._stop_status_writer()
+            return {"status": "error", "message": str(e), "context": asdict(self.project_context)}
     
     async def get_member_and_project_info(self) -> Dict:
         """Get member ID and project details"""
-        # Get member ID
+        # Get member ID together with its contacts, which the fetch stage reuses
         member_result = await self.delegate_to_agent(
             self.contact_fetcher,
-            f"Get member ID for organization '{self.project_context.organization_name}'",
+            f"Get member and contacts for organization '{self.project_context.organization_name}'",
             {"organization_name": self.project_context.organization_name}
         )
         
-        logger.debug(f"Member result: {member_result}")
+        logger.debug("Member result: %s", member_result)
         
         if not member_result.get('member_id'):
             self.workflow_logger.error(f"Member not found: {self.project_context.organization_name}")
             return None
         
         self.project_context.member_id = member_result['member_id']
+        self._member_contacts = member_result if 'contacts' in member_result else None
         member_info = member_result.get('member_info', {})
         self.workflow_logger.success(f"Found: {member_info.get('name')} (ID: {member_result.get('member_id')})")
         
@@ -721,7 +1072,7 @@ class OrchestratorAgent(Agent):
             {"project_slug": self.project_context.project_slug}
         )
         
-        logger.debug(f"Project result: {project_result}")
+        logger.debug("Project result: %s", project_result)
         
         if not project_result.get('project_id'):
             self.workflow_logger.error(f"Project not found: {self.project_context.project_slug}")
@@ -738,37 +1089,151 @@ class OrchestratorAgent(Agent):
             "project_info": project_result.get('project_info', {})
         }
     
+    async def _run_batch(self, batch_number: int, total_batches: int, batch: List[Dict],
+                         contact_db_mapping: Dict,
+                         on_result: Optional[Callable[[Dict], bool]] = None,
+                         stop: Optional[asyncio.Event] = None) -> List[Dict]:
+        """Process one batch under the batch semaphore; nothing is started once stop is set"""
+        async with self._batch_sem:
+            if stop is not None and stop.is_set():
+                return []
+            self.workflow_logger.batch_progress(batch_number, total_batches)
+            return await self.process_contact_batch(batch, contact_db_mapping, on_result, stop)
+    
+    async def prefetch_committee_rosters(self):
+        """Fetch each committee's member list once so membership is checked locally"""
+        committee_ids = list(dict.fromkeys(c for c in self.project_context.committees if c))
+        rosters = await asyncio.gather(*(
+            self.delegate_to_agent(
+                self.committee_manager,
+                f"List members of committee {committee_id}",
+                {"project_id": self.project_context.project_id, "committee_id": committee_id}
+            )
+            for committee_id in committee_ids
+        ), return_exceptions=True)
+        
+        for committee_id, roster in zip(committee_ids, rosters):
+            # Committees without a usable roster fall back to per-contact checks
+            if isinstance(roster, dict) and isinstance(roster.get('members'), list):
+                self._member_emails[committee_id] = {
+                    m.get('email', '').lower() for m in roster['members'] if isinstance(m, dict)
+                }
+            else:
+                logger.warning("Could not prefetch members of committee %s: %s", committee_id, roster)
+    
+    async def _check_memberships(self, members: List[Dict]) -> List[Dict]:
+        """BatchLoader callback: one committee agent call for many membership checks"""
+        async with self._limiters['committee']:
+            result = await self.delegate_to_agent(
+                self.committee_manager,
+                "Bulk check committee memberships",
+                {"project_id": self.project_context.project_id, "members": members}
+            )
+        return result.get('results', [])
+    
+    async def _status_writer_loop(self, queue: asyncio.Queue):
+        """Write queued status updates in bulk until the None sentinel arrives"""
+        stopping = False
+        while not stopping:
+            update = await queue.get()
+            if update is None:
+                break
+            # Give the other in-flight contacts a moment to queue theirs too
+            await asyncio.sleep(STATUS_FLUSH_INTERVAL)
+            updates = [update]
+            while len(updates) < STATUS_FLUSH_SIZE and not queue.empty():
+                update = queue.get_nowait()
+                if update is None:
+                    stopping = True
+                    break
+                updates.append(update)
+            
+            self._failed_status_updates.extend(await self._write_status_updates(updates))
+    
+    async def _write_status_updates(self, updates: List[Dict]) -> List[Dict]:
+        """Write status updates in one bulk call; returns the ones that were not written"""
+        try:
+            result = await self.delegate_to_agent(
+                self.db_manager,
+                "Bulk update contact statuses",
+                {"updates": updates}
+            )
+        except Exception as e:
+            logger.error("Failed to write %d status updates: %s", len(updates), e)
+            return updates
+        if result.get('status') == 'success':
+            return []
+        # Per-update results line up with updates; without them, treat the whole call as failed
+        results = result.get('results')
+        if not isinstance(results, list) or len(results) != len(updates):
+            failed = updates
+        else:
+            failed = [update for update, r in zip(updates, results) if r.get('status') != 'success']
+        logger.error("Failed to write %d of %d status updates: %s",
+                     len(failed), len(updates), result.get('message', 'see per-update results'))
+        return failed
+    
+    async def _stop_status_writer(self):
+        """Write everything still queued, retry failed writes once and stop the background writer"""
+        if self._status_writer is None:
+            return
+        writer = self._status_writer
+        self._status_queue.put_nowait(None)
+        self._status_queue = self._status_writer = None
+        await writer
+        
+        failed, self._failed_status_updates = self._failed_status_updates, []
+        if failed:
+            still_failed = await self._write_status_updates(failed)
+            if still_failed:
+                self.workflow_logger.warning(
+                    f"{len(still_failed)} contact status updates could not be written; "
+                    "the report may not match the session totals"
+                )
+    
     async def setup_committees(self) -> Dict:
-        """Setup committee mappings"""
-        logger.info(f"Getting committees for project ID: {self.project_context.project_id}")
+        """Setup committee mappings; the lookup runs once per project context"""
+        if any(self.project_context.committees):
+            committee_map = {
+                contact_type: self.project_context.committees[idx]
+                for contact_type, idx in _CT_IDX.items()
+                if self.project_context.committees[idx] is not None
+            }
+            missing = [contact_type for contact_type in _CT_IDX if contact_type not in committee_map]
+            return {
+                "success": len(missing) == 0,
+                "committee_map": committee_map,
+                "missing_committees": missing
+            }
+        
+        logger.info("Getting committees for project ID: %s", self.project_context.project_id)
         committees_result = await self.delegate_to_agent(
             self.committee_manager,
             f"Get all committees for project {self.project_context.project_id}",
             {"project_id": self.project_context.project_id}
         )
-        logger.info(f"Committee result: {committees_result}")
+        logger.info("Committee result: %s", committees_result)
         
         committee_map = {}
         committees = committees_result.get('committees', [])
-        logger.info(f"Found {len(committees)} committees: {committees}")
+        logger.info("Found %d committees: %s", len(committees), committees)
         
         for committee in committees:
-            name_lower = committee.get('name', '').lower()
-            if 'governing' in name_lower or 'board' in name_lower:
-                committee_map['primary'] = committee['id']
-            elif 'marketing' in name_lower:
-                committee_map['marketing'] = committee['id']
-            elif 'technical' in name_lower or 'tech' in name_lower:
-                committee_map['technical'] = committee['id']
+            keywords = _COMMITTEE_RE.findall(committee.get('name', ''))
+            if keywords:
+                # Governing/board beats marketing beats technical, as in _CT_IDX order
+                contact_type = min((_COMMITTEE_KEYWORDS[k.lower()] for k in keywords), key=_CT_IDX.__getitem__)
+                committee_map[contact_type] = committee['id']
         
-        self.project_context.committees = committee_map
-        logger.info(f"Committee mapping: {committee_map}")
+        committee_ids = [None, None, None]
+        for contact_type, committee_id in committee_map.items():
+            committee_ids[_CT_IDX[contact_type]] = committee_id
+        self.project_context.committees = tuple(committee_ids)
+        self._plans.clear()  # plans embed committee ids
+        logger.info("Committee mapping: %s", committee_map)
         
         # Check if all committees are found
-        missing = []
-        for contact_type in ['primary', 'marketing', 'technical']:
-            if contact_type not in committee_map:
-                missing.append(contact_type)
+        missing = [contact_type for contact_type, idx in _CT_IDX.items() if committee_ids[idx] is None]
         
         return {
             "success": len(missing) == 0,
@@ -776,16 +1241,46 @@ class OrchestratorAgent(Agent):
             "missing_committees": missing
         }
     
-    async def process_contact_batch(self, batch: List[Dict], contact_db_mapping: Dict) -> List[Dict]:
-        """Process a batch of contacts with rate limiting"""
+    async def process_contact_batch(self, batch: List[Dict], contact_db_mapping: Dict,
+                                    on_result: Optional[Callable[[Dict], bool]] = None,
+                                    stop: Optional[asyncio.Event] = None) -> List[Dict]:
+        """
+        Process a batch of contacts concurrently, at most CONTACT_CONCURRENCY at a time.
+        
+        on_result is called with each contact's result as soon as it is ready;
+        returning True cancels the contacts that have not finished yet. Contacts
+        still waiting for a slot are not started once stop is set (by any batch).
+        """
+        sem = asyncio.Semaphore(CONTACT_CONCURRENCY)
+        
+        async def process_one(contact: Dict) -> Optional[Dict]:
+            async with sem:
+                if stop is not None and stop.is_set():
+                    return None
+                try:
+                    return await self.process_single_contact(contact, contact_db_mapping[contact['contact_id']])
+                except Exception as e:
+                    logger.error("Error processing contact %s: %s", contact.get('contact_id'), e)
+                    db_id = contact_db_mapping.get(contact['contact_id'])
+                    if db_id is not None:
+                        self._update_status(db_id, "overall", "failed", {"error": str(e)})
+                    return {"contact": contact, "status": "error", "error": str(e), "overall_status": "failed"}
+        
+        tasks = [asyncio.ensure_future(process_one(contact)) for contact in batch]
         results = []
-        for contact in batch:
-            db_id = contact_db_mapping[contact['contact_id']]
-            # Process contacts sequentially to avoid rate limits
-            result = await self.process_single_contact(contact, db_id)
-            results.append(result)
-            # Add a small delay between contacts to avoid rate limits
-            await asyncio.sleep(0.5)
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                if result is None:
+                    continue
+                results.append(result)
+                if on_result is not None and on_result(result):
+                    break
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
         
         return results
     
@@ -803,33 +1298,40 @@ class OrchestratorAgent(Agent):
         }
         
         try:
+            plan = self._plan_for(contact)
+            
             # Add to committee based on contact_type
-            committee_id = self.project_context.committees.get(contact['contact_type'])
-            logger.info(f"Processing {contact['first_name']} {contact['last_name']} ({contact['contact_type']}) - Committee ID: {committee_id}")
+            committee_id = plan.committee_id
+            logger.info("Processing %s %s (%s) - Committee ID: %s",
+                        contact['first_name'], contact['last_name'], contact['contact_type'], committee_id)
             if committee_id:
                 results['committee'] = await self.add_to_committee(contact, committee_id, db_id)
             else:
-                logger.warning(f"No committee found for contact type: {contact['contact_type']}")
+                logger.warning("No committee found for contact type: %s", contact['contact_type'])
                 results['committee'] = {"status": "skipped", "reason": "committee_not_found"}
-                await self.delegate_to_agent(
-                    self.db_manager,
-                    "Update contact status",
-                    {
-                        "contact_id": db_id,
-                        "status_type": "committee",
-                        "status": "skipped",
-                        "additional_data": {"reason": "committee_not_found"}
-                    }
-                )
+                self._update_status(db_id, "committee", "skipped", {"reason": "committee_not_found"})
             
             # Parallel processing for Slack and Email
-            slack_task = self.process_slack_onboarding(contact, db_id)
+            slack_task = self.process_slack_onboarding(contact, db_id, plan)
             email_task = self.process_email_onboarding(contact, db_id)
             
             results['slack'], results['email'] = await asyncio.gather(
                 slack_task, email_task,
                 return_exceptions=True
             )
+            for channel in ('slack', 'email'):
+                if isinstance(results[channel], BaseException):
+                    results[channel] = {"status": "failed", "error": str(results[channel])}
+            
+            # Both outcomes and the overall status derived from the stored step statuses
+            # merge with the committee status into one row update at flush time
+            slack_status = "success" if results['slack'].get('status') == 'success' else "failed"
+            email_status = "success" if results['email'].get('status') == 'success' else "failed"
+            self._update_status(db_id, "slack", slack_status,
+                                {"slack_user_id": results['slack'].get('slack_user_id')})
+            self._update_status(db_id, "email", email_status)
+            results['overall_status'] = overall_status((results['committee']['status'], slack_status, email_status))
+            self._update_status(db_id, "overall", results['overall_status'])
             
             # Determine final status
             if self.is_onboarding_successful(results):
@@ -838,315 +1340,218 @@ class OrchestratorAgent(Agent):
                 results['status'] = 'partial_failure'
                 
         except Exception as e:
-            logger.error(f"Error processing contact {contact_id}: {str(e)}")
+            logger.error("Error processing contact %s: %s", contact_id, e)
             self.workflow_logger.error(f"Error processing contact {contact_id}: {str(e)}")
             self.workflow_logger.contact_progress(contact, "Failed", "error")
             results['status'] = 'error'
             results['error'] = str(e)
-            await self.delegate_to_agent(
-                self.db_manager,
-                "Update contact status",
-                {
-                    "contact_id": db_id,
-                    "status_type": "overall",
-                    "status": "failed",
-                    "additional_data": {"error": str(e)}
-                }
-            )
+            results['overall_status'] = "failed"
+            self._update_status(db_id, "overall", "failed", {"error": str(e)})
         
         return results
     
+    def _plan_for(self, contact: Dict) -> ProcessingPlan:
+        """ProcessingPlan for a contact, built once per contact type and shared"""
+        contact_type = contact.get('contact_type')
+        plan = self._plans.get(contact_type)
+        if plan is None:
+            plan = self._plans[contact_type] = build_plan(
+                contact, self.project_context.committees, self.project_context.project_slug
+            )
+        return plan
+    
+    def _update_status(self, db_id: int, status_type: str, status: str,
+                       extra: Optional[Dict] = None):
+        """Queue one contact status update for the background writer"""
+        if self._status_writer is None:
+            # Created on first use so the queue binds to the running loop on 3.9
+            self._status_queue = asyncio.Queue()
+            self._status_writer = asyncio.ensure_future(self._status_writer_loop(self._status_queue))
+        self._status_queue.put_nowait({
+            "contact_id": db_id,
+            "status_type": status_type,
+            "status": status,
+            "additional_data": extra
+        })
+    
     async def add_to_committee(self, contact: Dict, committee_id: str, db_id: int) -> Dict:
-        """Add contact to committee with retry logic"""
-        max_retries = 3
-        retry_count = 0
+        """Add contact to committee, retrying with jittered backoff"""
+        if self._committee_sem is None:
+            self._committee_sem = asyncio.Semaphore(COMMITTEE_CONCURRENCY)
         
-        while retry_count < max_retries:
-            try:
-                # Check if already a member
-                check_result = await self.delegate_to_agent(
-                    self.committee_manager,
-                    f"Check if {contact['email']} is already in committee {committee_id}",
-                    {
-                        "project_id": self.project_context.project_id,
-                        "committee_id": committee_id,
-                        "email": contact['email']
-                    }
-                )
-                
-                if check_result.get('is_member'):
-                    await self.delegate_to_agent(
-                        self.db_manager,
-                        "Update contact status",
-                        {
-                            "contact_id": db_id,
-                            "status_type": "committee",
-                            "status": "already_member",
-                            "additional_data": {"committee_id": committee_id}
-                        }
-                    )
-                    return {"status": "already_member", "committee_id": committee_id}
-                
-                # Add to committee
-                member_data = {
-                    "name": f"{contact['first_name']} {contact['last_name']}",
-                    "email": contact['email'],
-                    "organization": self.project_context.organization_name,
-                    "title": contact['title'],
-                    "role": contact['contact_type'],
-                    "join_date": datetime.now().isoformat()
-                }
-                
-                self.logger.info(f"Adding contact to committee with member_data: {member_data}")
-                
-                # Create a very explicit message for the agent
-                task_message = f"""Add member to committee using add_committee_member tool with these exact parameters:
-                
-project_id: {self.project_context.project_id}
-committee_id: {committee_id}
-member_data: {json.dumps(member_data)}
-
-Call the function exactly as: add_committee_member(project_id="{self.project_context.project_id}", committee_id="{committee_id}", member_data={json.dumps(member_data)})
-"""
-                
-                result = await self.delegate_to_agent(
-                    self.committee_manager,
-                    task_message,
-                    {
-                        "project_id": self.project_context.project_id,
-                        "committee_id": committee_id,
-                        "member_data": member_data
-                    }
-                )
+        # Built once, so every retry sends the same payload and first-attempt join_date
+        member_data = {
+            "name": f"{contact['first_name']} {contact['last_name']}",
+            "email": contact['email'],
+            "organization": self.project_context.organization_name,
+            "title": contact['title'],
+            "role": contact['contact_type'],
+            "join_date": datetime.now().isoformat()
+        }
+        # Create a very explicit message for the agent; the parameters themselves
+        # are appended once by delegate_to_agent
+        task_message = (
+            _ADD_MEMBER_PREFIX
+            + f'add_committee_member(project_id="{self.project_context.project_id}", '
+            f'committee_id="{committee_id}", member_data={dumps(member_data)})\n'
+        )
+        add_context = {
+            "project_id": self.project_context.project_id,
+            "committee_id": committee_id,
+            "member_data": member_data
+        }
+        
+        async def _add() -> Dict:
+            logger.info("Adding contact to committee with member_data: %s", member_data)
+            async with self._limiters['committee']:
+                return await self.delegate_to_agent(self.committee_manager, task_message, add_context)
+        
+        async def _try_add() -> Dict:
+            async with self._committee_sem:
+                if AgentSystemConfig.COMMITTEE_ADD_IS_IDEMPOTENT:
+                    # A duplicate add reports already_member itself, so skip the check round trip
+                    return await _add()
                 
-                if result.get('status') == 'success':
-                    await self.delegate_to_agent(
-                        self.db_manager,
-                        "Update contact status",
-                        {
-                            "contact_id": db_id,
-                            "status_type": "committee",
-                            "status": "success",
-                            "additional_data": {"committee_id": committee_id}
-                        }
-                    )
+                roster = self._member_emails.get(committee_id)
+                if roster is not None:
+                    if contact['email'].lower() in roster:
+                        return {"status": "already_member", "committee_id": committee_id}
+                    result = await _add()
+                    if result.get('status') == 'success':
+                        roster.add(contact['email'].lower())
                     return result
                 
-                retry_count += 1
-                if retry_count < max_retries:
-                    await asyncio.sleep(2 ** retry_count)  # Exponential backoff
-                    
-            except Exception as e:
-                retry_count += 1
-                if retry_count >= max_retries:
-                    await self.delegate_to_agent(
-                        self.db_manager,
-                        "Update contact status",
-                        {
-                            "contact_id": db_id,
-                            "status_type": "committee",
-                            "status": "failed",
-                            "additional_data": {"error": str(e)}
-                        }
-                    )
-                    return {"status": "failed", "error": str(e)}
+                # Otherwise check before adding: a sent add cannot be taken back, and
+                # each retry checks again in case an earlier attempt went through
+                check_result = await self._membership_loader.load({
+                    "committee_id": committee_id,
+                    "email": contact['email']
+                })
+                if check_result.get('is_member'):
+                    return {"status": "already_member", "committee_id": committee_id}
+                return await _add()
         
-        await self.delegate_to_agent(
-            self.db_manager,
-            "Update contact status",
-            {
-                "contact_id": db_id,
-                "status_type": "committee",
-                "status": "failed",
-                "additional_data": {"error": "retries_exhausted"}
-            }
+        result, reason = await retry_async(
+            _try_add,
+            is_success=lambda r: r.get('status') in _COMMITTEE_OK
         )
-        return {"status": "failed", "retries_exhausted": True}
+        
+        if reason is None:
+            self._update_status(db_id, "committee", result['status'], {"committee_id": committee_id})
+            return result
+        
+        self._update_status(db_id, "committee", "failed", {"error": reason})
+        if reason == RETRIES_EXHAUSTED:
+            return {"status": "failed", "retries_exhausted": True}
+        return {"status": "failed", "error": reason}
     
-    async def process_slack_onboarding(self, contact: Dict, db_id: int) -> Dict:
-        """Handle Slack onboarding with appropriate channels"""
+    async def process_slack_onboarding(self, contact: Dict, db_id: int,
+                                       plan: Optional[ProcessingPlan] = None) -> Dict:
+        """Handle Slack onboarding with appropriate channels; the caller records the status"""
         try:
             # Show Slack stage if not already shown
-            if not hasattr(self, '_slack_stage_started'):
+            if not self._stages_started & _STAGE_SLACK:
                 self.workflow_logger.stage_start("SLACK INVITATIONS", "💬")
-                self._slack_stage_started = True
+                self._stages_started |= _STAGE_SLACK
             
             self.workflow_logger.slack_invitation(contact['email'])
             
-            # Get channels based on committee
-            channels = self.get_slack_channels(contact['contact_type'])
-            
-            result = await self.delegate_to_agent(
-                self.slack_onboarder,
-                f"Complete Slack onboarding for {contact['email']} with committee-specific channels",
-                {
-                    "contact": contact,
-                    "organization": self.project_context.organization_name,
-                    "channels": channels,
-                    "committee": self.get_committee_name(contact['contact_type'])
-                }
-            )
+            if plan is None:
+                plan = self._plan_for(contact)
             
-            if result.get('status') == 'success':
-                slack_user_id = result.get('slack_user_id')
-                await self.delegate_to_agent(
-                    self.db_manager,
-                    "Update contact status",
-                    {
-                        "contact_id": db_id,
-                        "status_type": "slack",
-                        "status": "success",
-                        "additional_data": {"slack_user_id": slack_user_id}
-                    }
-                )
-            else:
-                await self.delegate_to_agent(
-                    self.db_manager,
-                    "Update contact status",
+            async with self._limiters['slack']:
+                result = await self.delegate_to_agent(
+                    self.slack_onboarder,
+                    f"Complete Slack onboarding for {contact['email']} with committee-specific channels",
                     {
-                        "contact_id": db_id,
-                        "status_type": "slack",
-                        "status": "failed",
-                        "additional_data": {"error": result.get('error', 'Unknown error')}
+                        "contact": contact,
+                        "organization": self.project_context.organization_name,
+                        "channels": plan.channels,
+                        "committee": plan.committee_name
                     }
                 )
             
             return result
             
         except Exception as e:
-            await self.delegate_to_agent(
-                self.db_manager,
-                "Update contact status",
-                {
-                    "contact_id": db_id,
-                    "status_type": "slack",
-                    "status": "failed",
-                    "additional_data": {"error": str(e)}
-                }
-            )
             return {"status": "failed", "error": str(e)}
     
     async def process_email_onboarding(self, contact: Dict, db_id: int) -> Dict:
-        """Handle email onboarding with committee-specific content"""
+        """Handle email onboarding with committee-specific content; the caller records the status"""
         try:
             # Show email stage if not already shown
-            if not hasattr(self, '_email_stage_started'):
+            if not self._stages_started & _STAGE_EMAIL:
                 self.workflow_logger.stage_start("WELCOME EMAILS", "📧")
-                self._email_stage_started = True
+                self._stages_started |= _STAGE_EMAIL
             
             self.workflow_logger.email_sent(contact['email'])
             
-            # Get the actual project name from the context
-            project_info = {
-                "name": getattr(self.project_context, 'project_name', self.project_context.project_slug),
-                "id": self.project_context.project_id,
-                "slug": self.project_context.project_slug
-            }
-            
-            result = await self.delegate_to_agent(
-                self.email_communicator,
-                f"Send committee-specific welcome email to {contact['email']}",
-                {
-                    "contact": contact,
-                    "project_info": project_info
+            # Get the actual project name from the context; built on first use, once the project is known
+            project_info = self._project_info
+            if project_info is None:
+                project_info = self._project_info = {
+                    "name": getattr(self.project_context, 'project_name', self.project_context.project_slug),
+                    "id": self.project_context.project_id,
+                    "slug": self.project_context.project_slug
                 }
-            )
             
-            if result.get('status') == 'success':
-                await self.delegate_to_agent(
-                    self.db_manager,
-                    "Update contact status",
-                    {
-                        "contact_id": db_id,
-                        "status_type": "email",
-                        "status": "success"
-                    }
-                )
-            else:
-                await self.delegate_to_agent(
-                    self.db_manager,
-                    "Update contact status",
+            async with self._limiters['email']:
+                result = await self.delegate_to_agent(
+                    self.email_communicator,
+                    f"Send committee-specific welcome email to {contact['email']}",
                     {
-                        "contact_id": db_id,
-                        "status_type": "email",
-                        "status": "failed",
-                        "additional_data": {"error": result.get('error', 'Unknown error')}
+                        "contact": contact,
+                        "project_info": project_info
                     }
                 )
             
             return result
             
         except Exception as e:
-            await self.delegate_to_agent(
-                self.db_manager,
-                "Update contact status",
-                {
-                    "contact_id": db_id,
-                    "status_type": "email",
-                    "status": "failed",
-                    "additional_data": {"error": str(e)}
-                }
-            )
             return {"status": "failed", "error": str(e)}
     
     def get_committee_name(self, contact_type: str) -> str:
         """Get committee name based on contact type"""
-        committee_names = {
-            "primary": "Governing Board",
-            "marketing": "Marketing Committee",
-            "technical": "Technical Committee"
-        }
-        return committee_names.get(contact_type, "Project Committee")
+        return self._committee_name_by_type.get(contact_type, "Project Committee")
     
-    def get_slack_channels(self, contact_type: str) -> List[str]:
+    def get_slack_channels(self, contact_type: str) -> Tuple[str, ...]:
         """Get Slack channels based on contact type"""
-        base_channels = ["#general", "#welcome", f"#{self.project_context.project_slug}"]
-        
-        type_channels = {
-            "primary": ["#board", "#announcements", "#strategic-planning"],
-            "marketing": ["#marketing", "#events", "#content-strategy", "#brand"],
-            "technical": ["#tech-discussion", "#architecture", "#dev-updates"]
-        }
-        
-        return base_channels + type_channels.get(contact_type, [])
+        return self._channels_by_type.get(contact_type, self._channels_default)
     
     def is_onboarding_successful(self, results: Dict) -> bool:
         """Determine if onboarding was successful"""
-        committee_success = results.get('committee', {}).get('status') in ['success', 'already_member']
-        slack_success = results.get('slack', {}).get('status') == 'success'
-        email_success = results.get('email', {}).get('status') == 'success'
-        
         # At least committee and one communication channel should succeed
-        return committee_success and (slack_success or email_success)
+        return (
+            (results.get('committee') or _NO_RESULT).get('status') in _COMMITTEE_OK
+            and ((results.get('slack') or _NO_RESULT).get('status') == 'success'
+                 or (results.get('email') or _NO_RESULT).get('status') == 'success')
+        )
     
     def calculate_failure_rate(self, results: List[Dict]) -> float:
         """Calculate the failure rate of processed contacts"""
-        if not results:
-            return 0.0
-        
-        failures = sum(1 for r in results if r.get('status') in ['error', 'partial_failure'])
-        return failures / len(results)
+        return summarize_results(results).failure_rate
     
-    async def handle_high_failure_rate(self, results: List[Dict]):
+    async def handle_high_failure_rate(self, results: List[Dict], summary: Optional[FailureStats] = None):
         """Handle high failure rate scenario"""
-        analysis = self.analyze_failures(results)
-        logger.critical(f"High failure rate alert for {self.project_context.organization_name}: {analysis}")
+        analysis = self.analyze_failures(results, summary)
+        logger.critical("High failure rate alert for %s: %s", self.project_context.organization_name, analysis)
         
         # In production, this would trigger alerts
         # Could implement automatic recovery strategies
     
-    def analyze_failures(self, results: List[Dict]) -> Dict:
-        """Analyze failure patterns"""
-        failures = [r for r in results if r.get('status') in ['error', 'partial_failure']]
+    def analyze_failures(self, results: List[Dict], summary: Optional[FailureStats] = None) -> Dict:
+        """Analyze failure patterns; pass summary to reuse an existing summarize_results pass"""
+        if summary is None:
+            summary = summarize_results(results)
         
         analysis = {
             "organization": self.project_context.organization_name,
             "project": self.project_context.project_slug,
-            "total_failures": len(failures),
-            "failure_rate": len(failures) / len(results) if results else 0,
-            "committee_failures": sum(1 for f in failures if f.get('committee', {}).get('status') == 'failed'),
-            "slack_failures": sum(1 for f in failures if f.get('slack', {}).get('status') == 'failed'),
-            "email_failures": sum(1 for f in failures if f.get('email', {}).get('status') == 'failed'),
+            "total_failures": summary.failures,
+            "failure_rate": summary.failure_rate,
+            "committee_failures": summary.committee_failures,
+            "slack_failures": summary.slack_failures,
+            "email_failures": summary.email_failures,
             "timestamp": datetime.now().isoformat()
         }
         
@@ -1154,17 +1559,19 @@ Call the function exactly as: add_committee_member(project_id="{self.project_con
     
     async def delegate_to_agent(self, agent: Agent, task: str, context: Dict = None) -> Any:
         """Delegate a task to a specific agent"""
+        # Database tasks with a known tool are called directly instead of via the LLM
+        if agent is self.db_manager:
+            tool = agent.route(task)
+            if tool is not None:
+                return await tool(**(context or {}))
+        
         # Include context in the task message for better agent understanding
         if context:
             # Make context extremely clear for LLM agents
-            context_parts = []
-            for key, value in context.items():
-                if isinstance(value, dict):
-                    context_parts.append(f"{key}: {json.dumps(value)}")
-                else:
-                    context_parts.append(f"{key}: {value}")
-            
-            task_with_context = f"{task}\n\nParameters to use:\n" + "\n".join(context_parts)
+            task_with_context = f"{task}\n\nParameters to use:\n" + "\n".join(
+                f"{key}: {dumps(value, default=str) if isinstance(value, (dict, list, tuple)) else value}"
+                for key, value in context.items()
+            )
         else:
             task_with_context = task
             
@@ -1180,76 +1587,7 @@ Call the function exactly as: add_committee_member(project_id="{self.project_con
             # Try to parse JSON response if it's a string
             content = response.content
             if isinstance(content, str):
-                # Check if content is wrapped in markdown code blocks
-                if content.strip().startswith('```'):
-                    # Extract content between ``` markers
-                    lines = content.strip().split('\n')
-                    json_lines = []
-                    in_json = False
-                    for line in lines:
-                        if line.startswith('```json'):
-                            in_json = True
-                            continue
-                        elif line.startswith('```'):
-                            in_json = False
-                            continue
-                        elif in_json:
-                            json_lines.append(line)
-                    content = '\n'.join(json_lines)
-                
-                try:
-                    # First try to parse as JSON
-                    parsed = json.loads(content)
-                    # If it has a 'response' field that's a string, parse that too
-                    if isinstance(parsed, dict) and 'response' in parsed and isinstance(parsed['response'], str):
-                        response_str = parsed['response']
-                        # Check if the response contains a JSON object at the beginning
-                        if response_str.strip().startswith('{'):
-                            # Find the end of the JSON object
-                            brace_count = 0
-                            json_end = 0
-                            for i, char in enumerate(response_str):
-                                if char == '{':
-                                    brace_count += 1
-                                elif char == '}':
-                                    brace_count -= 1
-                                    if brace_count == 0:
-                                        json_end = i + 1
-                                        break
-                            if json_end > 0:
-                                json_part = response_str[:json_end]
-                                try:
-                                    import ast
-                                    return ast.literal_eval(json_part)
-                                except:
-                                    try:
-                                        return json.loads(json_part.replace("'", '"'))
-                                    except:
-                                        pass
-                    return parsed
-                except json.JSONDecodeError:
-                    # Try to parse as Python dict string
-                    try:
-                        import ast
-                        # First check if the content starts with a dict
-                        if content.strip().startswith('{'):
-                            # Find the end of the dict
-                            brace_count = 0
-                            dict_end = 0
-                            for i, char in enumerate(content):
-                                if char == '{':
-                                    brace_count += 1
-                                elif char == '}':
-                                    brace_count -= 1
-                                    if brace_count == 0:
-                                        dict_end = i + 1
-                                        break
-                            if dict_end > 0:
-                                dict_part = content[:dict_end]
-                                return ast.literal_eval(dict_part)
-                        return ast.literal_eval(content)
-                    except:
-                        return {"status": "success", "response": content}
+                return parse_agent_content(content)
             return content
         return response
 
@@ -1257,6 +1595,8 @@ Call the function exactly as: add_committee_member(project_id="{self.project_con
 async def run_contact_onboarding(organization_name: str, project_slug: str, 
                                 mcp_server_type: str = "sqlite"):
     """Main entry point for the autonomous agent system"""
+    _init_runtime()
+    
     # Create project context
     project_context = ProjectContext(
         organization_name=organization_name,
@@ -1267,9 +1607,10 @@ async def run_contact_onboarding(organization_name: str, project_slug: str,
     orchestrator = OrchestratorAgent(project_context, mcp_server_type)
     
     # Start the autonomous process
-    result = await orchestrator.process_contacts()
-    
-    return result
+    try:
+        return await orchestrator.process_contacts()
+    finally:
+        await _close_shared_openai_client()
 
 # Configuration for production deployment
 class AgentSystemConfig:
@@ -1296,6 +1637,8 @@ class AgentSystemConfig:
     
     # Agent behavior configuration
     MAX_RETRIES = 3
+    # Adding an existing member returns already_member, so no membership check is needed first
+    COMMITTEE_ADD_IS_IDEMPOTENT = True
     RETRY_DELAY = 5  # seconds
     BATCH_SIZE = 10  # contacts per batch
     
@@ -1306,13 +1649,15 @@ class AgentSystemConfig:
 # Helper function to run with proper error handling
 async def main(organization_name: str, project_slug: str):
     """Main function with error handling and monitoring"""
+    _init_runtime()
+    
     try:
         # Validate inputs
         if not organization_name or not project_slug:
             raise ValueError("Both organization_name and project_slug are required")
         
         # Initialize system
-        logger.debug(f"Initializing onboarding system for {organization_name} → {project_slug}")
+        logger.debug("Initializing onboarding system for %s → %s", organization_name, project_slug)
         
         # Run the system with MCP
         result = await run_contact_onboarding(
@@ -1323,17 +1668,15 @@ async def main(organization_name: str, project_slug: str):
         
         # Log completion is handled by self.workflow_logger in process_contacts
         if result.get('status') == 'error':
-            logger.error(f"Onboarding failed: {result.get('message')}")
+            logger.error("Onboarding failed: %s", result.get('message'))
         
         return result
         
     except Exception as e:
-        logger.error(f"System error: {str(e)}")
+        logger.error("System error: %s", e)
         raise
 
 if __name__ == "__main__":
-    import sys
-    
     if len(sys.argv) != 3:
         print("Usage: python main.py <organization_name> <project_slug>")
         print("Example: python main.py 'Acme Corp' 'kubernetes'")
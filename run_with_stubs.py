@@ -2,11 +2,15 @@
 """Run the onboarding system with stub services (no OpenAI required)"""
 
 import asyncio
-import json
 import logging
+import os
+import sys
+import time
 from datetime import datetime
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Any, Awaitable, Callable
+
+from config import get_config
 
 # Import stub services
 from stub_services import (
@@ -18,17 +22,57 @@ from stub_services import (
     get_stub_database_service
 )
 
+from src.utils.serialization import dumps_bytes
+from src.utils.logging import BoundLogger, setup_logging
+from src.utils.ratelimit import AdmissionController, UNLIMITED
+from src.utils.retry import retry_async
+from src.utils.tracing import span
+from src.utils.tasks import gather_or_cancel
+
 # Import real MCP database tools
-from src.tools.mcp_database_abstraction import OnboardingDatabaseTools
+from src.tools.mcp_database import OnboardingDatabaseToolsMCP, step_status
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Set up logging; LOG_FORMAT=json emits one structured record per line instead
+_JSON_LOGS = os.getenv("LOG_FORMAT", "").lower() == "json"
+if _JSON_LOGS:
+    setup_logging("INFO", json_format=True)
+else:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
 logger = logging.getLogger(__name__)
+_BANNER = "=" * 60
+
+# Maximum number of contacts onboarded at the same time; lowered while services report errors
+CONTACT_CONCURRENCY = 10
+
+# Workspace channels every invited contact joins
+SLACK_DEFAULT_CHANNELS = ("#general", "#welcome")
+
+# Attempts per service call; errors that retrying cannot fix are returned at once
+SERVICE_RETRIES = 3
+_PERMANENT_ERRORS = frozenset({"user_already_invited"})
 
-@dataclass
+# contact_type -> committee name keywords, in priority order
+COMMITTEE_KEYWORDS = (
+    ('primary', ('governing', 'board')),
+    ('marketing', ('marketing',)),
+    ('technical', ('tech',)),  # also matches 'technical'
+)
+
+def classify_committee(name: str) -> Optional[str]:
+    """contact_type whose keywords appear in a committee name, or None"""
+    folded = name.casefold()
+    for contact_type, keywords in COMMITTEE_KEYWORDS:
+        if any(keyword in folded for keyword in keywords):
+            return contact_type
+    return None
+
+# dataclass(slots=True) needs Python 3.10; older interpreters fall back to a __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class Contact:
     first_name: str
     last_name: str
@@ -37,8 +81,9 @@ class Contact:
     contact_type: str
     organization: str
     contact_id: str
+    member_id: Optional[str] = None
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ProjectContext:
     organization_name: str
     project_slug: str
@@ -49,9 +94,18 @@ class ProjectContext:
 class StubOrchestrator:
     """Orchestrator that uses stub services directly"""
     
-    def __init__(self, project_context: ProjectContext):
+    def __init__(self, project_context: ProjectContext, results_path: str = "stub_results.jsonl"):
         self.project_context = project_context
         self.session_id = None
+        # Each contact's service responses are appended here as one JSON line when it finishes
+        self.results_path = results_path
+        self._results_file = None
+        # Payload parts shared by every contact, built once instead of per contact
+        self._member_static = {"organization": project_context.organization_name}
+        self._project_info = {"name": project_context.project_slug}
+        # Structured fields attached to every record this orchestrator logs
+        self.log = BoundLogger(logger, {"org": project_context.organization_name,
+                                        "project": project_context.project_slug})
         
         # Initialize stub services
         self.member_service = get_stub_member_service()
@@ -60,184 +114,255 @@ class StubOrchestrator:
         self.email_service = get_stub_email_service()
         self.landscape_service = get_stub_landscape_service()
         # Use real MCP database instead of stub
-        self.db_service = OnboardingDatabaseTools()
+        self.db_service = OnboardingDatabaseToolsMCP()
+        # Per-service limiter slots as in main.py; stubs have no quota to protect
+        self._limiters = dict.fromkeys(get_config().service_rate_limits, UNLIMITED)
         
         logger.info("Initialized stub services with real MCP database")
     
     async def process_contacts(self):
+        """Main workflow orchestration, traced as one workflow span"""
+        with span("workflow.process_contacts",
+                  org=self.project_context.organization_name,
+                  project=self.project_context.project_slug) as root:
+            result = await self._process_contacts()
+            root.set_attribute("status", result['status'])
+            if result['status'] == 'success':
+                root.set_attribute("session_id", result['session_id'])
+                root.set_attribute("contacts_total", result['contacts_processed'])
+        return result
+    
+    async def _process_contacts(self):
         """Main workflow orchestration"""
         try:
-            logger.info("="*60)
-            logger.info(f"STARTING ONBOARDING WORKFLOW (STUB MODE)")
-            logger.info(f"Organization: {self.project_context.organization_name}")
-            logger.info(f"Project: {self.project_context.project_slug}")
-            logger.info("="*60)
+            if not _JSON_LOGS and logger.isEnabledFor(logging.INFO):
+                logger.info(_BANNER)
+                logger.info("STARTING ONBOARDING WORKFLOW (STUB MODE)")
+                logger.info("Organization: %s", self.project_context.organization_name)
+                logger.info("Project: %s", self.project_context.project_slug)
+                logger.info(_BANNER)
             
-            # Step 1: Get member info
-            logger.info("\n--- Step 1: Getting Member Information ---")
-            member_result = await self.member_service.get_member_by_organization(
-                self.project_context.organization_name
-            )
+            # Steps 1-2: Member and project lookups are independent, so run them together
+            logger.info("\n--- Steps 1-2: Getting Member and Project Information ---")
+            with span("step.member_project_lookup"):
+                member_result, project_result = await gather_or_cancel(
+                    self.member_service.get_member_by_organization(self.project_context.organization_name),
+                    self.project_service.get_project_by_slug(self.project_context.project_slug)
+                )
             if member_result['status'] != 'success':
                 return {"status": "error", "message": "Member not found"}
-            
-            self.project_context.member_id = member_result['member_id']
-            logger.info(f"✓ Found member: {member_result['member_info']['name']} (ID: {self.project_context.member_id})")
-            
-            # Step 2: Get project info
-            logger.info("\n--- Step 2: Getting Project Information ---")
-            project_result = await self.project_service.get_project_by_slug(
-                self.project_context.project_slug
-            )
             if project_result['status'] != 'success':
                 return {"status": "error", "message": "Project not found"}
             
+            self.project_context.member_id = member_result['member_id']
+            self.log.info("✓ Found member: %s (ID: %s)", member_result['member_info']['name'], self.project_context.member_id,
+                          extra={"step": "member_lookup", "member_id": self.project_context.member_id})
             self.project_context.project_id = project_result['project_id']
-            logger.info(f"✓ Found project: {project_result['project_info']['name']} (ID: {self.project_context.project_id})")
-            
-            # Step 3: Initialize database and create session
-            logger.info("\n--- Step 3: Creating Database Session ---")
-            # Initialize database schema
-            await self.db_service.initialize()
+            self.log.info("✓ Found project: %s (ID: %s)", project_result['project_info']['name'], self.project_context.project_id,
+                          extra={"step": "project_lookup", "project_id": self.project_context.project_id})
             
-            # Create onboarding session
-            session_result = await self.db_service.create_onboarding_session(
-                self.project_context.organization_name,
-                self.project_context.project_slug,
-                self.project_context.member_id,
-                self.project_context.project_id
-            )
+            # Steps 3-5: Session creation, contacts and committees only need the IDs above
+            logger.info("\n--- Steps 3-5: Creating Database Session, Fetching Contacts and Committees ---")
+            with span("step.session_contacts_committees"):
+                session_result, contacts_result, committees_result = await gather_or_cancel(
+                    self._create_session(),
+                    self.member_service.get_member_contacts(self.project_context.member_id),
+                    self.project_service.get_project_committees(self.project_context.project_id)
+                )
             self.session_id = session_result['session_id']
-            logger.info(f"✓ Created session ID: {self.session_id}")
-            
-            # Step 4: Get contacts
-            logger.info("\n--- Step 4: Fetching Contacts ---")
-            contacts_result = await self.member_service.get_member_contacts(
-                self.project_context.member_id
-            )
-            contacts = contacts_result['contacts']
-            logger.info(f"✓ Found {len(contacts)} contacts")
-            
-            # Step 5: Get committees
-            logger.info("\n--- Step 5: Setting Up Committees ---")
-            committees_result = await self.project_service.get_project_committees(
-                self.project_context.project_id
-            )
+            self.log = self.log.bind(session_id=self.session_id)
+            self.log.info("✓ Created session ID: %s", self.session_id, extra={"step": "session"})
+            contacts = [Contact(**row) for row in contacts_result['contacts']]
+            self.log.info("✓ Found %d contacts", len(contacts), extra={"step": "contacts", "count": len(contacts)})
             committees = committees_result['committees']
-            logger.info(f"✓ Found {len(committees)} committees")
+            self.log.info("✓ Found %d committees", len(committees), extra={"step": "committees", "count": len(committees)})
             
             # Map committees by type
             committee_map = {}
             for committee in committees:
-                name_lower = committee['name'].lower()
-                if 'governing' in name_lower or 'board' in name_lower:
-                    committee_map['primary'] = committee['id']
-                elif 'marketing' in name_lower:
-                    committee_map['marketing'] = committee['id']
-                elif 'technical' in name_lower or 'tech' in name_lower:
-                    committee_map['technical'] = committee['id']
+                contact_type = classify_committee(committee['name'])
+                if contact_type:
+                    committee_map[contact_type] = committee['id']
             
             self.project_context.committees = committee_map
             
-            # Step 6: Process each contact
+            # Step 6: Process contacts concurrently, at most CONTACT_CONCURRENCY at a time;
+            # one failing contact cancels the rest and the background landscape update
             logger.info("\n--- Step 6: Processing Individual Contacts ---")
-            results = []
-            
-            for i, contact in enumerate(contacts, 1):
-                logger.info(f"\nProcessing contact {i}/{len(contacts)}: {contact['first_name']} {contact['last_name']}")
-                
-                # Add to database
-                db_result = await self.db_service.add_contact_to_session(self.session_id, contact)
-                contact_db_id = db_result['contact_onboarding_id']
-                
-                # Process committee assignment
-                committee_id = committee_map.get(contact['contact_type'])
-                if committee_id:
-                    committee_result = await self.project_service.add_committee_member(
-                        self.project_context.project_id,
-                        committee_id,
-                        {
-                            "name": f"{contact['first_name']} {contact['last_name']}",
-                            "email": contact['email'],
-                            "organization": self.project_context.organization_name,
-                            "title": contact['title'],
-                            "role": contact['contact_type']
-                        }
-                    )
-                    logger.info(f"  ✓ Added to committee: {committee_result['status']}")
-                
-                # Process Slack invitation
-                slack_result = await self.slack_service.invite_to_workspace(
-                    contact['email'],
-                    ["#general", "#welcome"],
-                    self.project_context.organization_name
-                )
-                logger.info(f"  ✓ Slack invitation: {slack_result['status']}")
-                
-                # Send welcome email
-                email_result = await self.email_service.send_welcome_email(
-                    contact,
-                    {"name": self.project_context.project_slug}
-                )
-                logger.info(f"  ✓ Welcome email: {email_result['status']}")
-                
-                # Update contact statuses
-                await self.db_service.update_contact_committee_status(
-                    contact_db_id, 
-                    "success" if committee_result['status'] == 'success' else "failed",
-                    committee_result.get('member_id')
-                )
-                await self.db_service.update_contact_slack_status(
-                    contact_db_id,
-                    "success" if slack_result['status'] == 'success' else "failed",
-                    slack_result.get('slack_user_id')
-                )
-                await self.db_service.update_contact_email_status(
-                    contact_db_id,
-                    "success" if email_result['status'] == 'success' else "failed"
-                )
-                await self.db_service.update_overall_status(contact_db_id)
-                
-                results.append({
-                    "contact": contact,
-                    "committee": committee_result,
-                    "slack": slack_result,
-                    "email": email_result
-                })
-            
-            # Step 7: Update landscape
-            logger.info("\n--- Step 7: Updating Project Landscape ---")
-            landscape_result = await self.landscape_service.update_member_logo(
+            # The landscape PR (Step 7) needs no contact results, so it runs in the background meanwhile
+            landscape_task = asyncio.ensure_future(self.landscape_service.update_member_logo(
                 self.project_context.project_slug,
                 self.project_context.organization_name,
                 ""
-            )
-            logger.info(f"✓ Landscape update: Created PR {landscape_result['pr_url']}")
+            ))
+            admission = AdmissionController(CONTACT_CONCURRENCY)
+            try:
+                with span("step.process_contacts", contacts_total=len(contacts)), \
+                        open(self.results_path, 'wb') as self._results_file:
+                    await gather_or_cancel(*(
+                        self._process_one(i, len(contacts), contact, admission)
+                        for i, contact in enumerate(contacts, 1)
+                    ))
+            except BaseException:
+                landscape_task.cancel()
+                raise
+            finally:
+                self._results_file = None
+            self.log.info("✓ Contact results written to: %s", self.results_path,
+                          extra={"step": "results", "path": self.results_path})
+            
+            # Step 7: Update landscape
+            logger.info("\n--- Step 7: Updating Project Landscape ---")
+            with span("step.landscape_update"):
+                landscape_result = await landscape_task
+            self.log.info("✓ Landscape update: Created PR %s", landscape_result['pr_url'],
+                          extra={"step": "landscape", "pr_url": landscape_result['pr_url']})
             
             # Step 8: Update session statistics and generate report
             logger.info("\n--- Step 8: Generating Final Report ---")
-            # Update session statistics
-            await self.db_service.update_session_statistics(self.session_id)
-            # Generate report
-            report = await self.db_service.get_session_report(self.session_id)
+            with span("step.final_report", session_id=self.session_id):
+                # Update session statistics
+                await self.db_service.update_session_statistics(self.session_id)
+                # Generate report
+                report = await self.db_service.get_session_report(self.session_id)
             
-            logger.info("\n" + "="*60)
-            logger.info("ONBOARDING WORKFLOW COMPLETED")
-            logger.info("="*60)
+            if not _JSON_LOGS and logger.isEnabledFor(logging.INFO):
+                logger.info("\n%s", _BANNER)
+                logger.info("ONBOARDING WORKFLOW COMPLETED")
+                logger.info(_BANNER)
             
             return {
                 "status": "success",
                 "session_id": self.session_id,
                 "contacts_processed": len(contacts),
-                "results": results,
+                "results_file": self.results_path,
                 "landscape_pr": landscape_result['pr_url'],
                 "report": report
             }
             
         except Exception as e:
-            logger.error(f"Error in orchestration: {str(e)}")
+            self.log.error("Error in orchestration: %s", e, extra={"step": "orchestration"})
             return {"status": "error", "message": str(e)}
 
+    async def _create_session(self) -> Dict:
+        """Initialize the database schema and create the onboarding session"""
+        await self.db_service.initialize()
+        return await self.db_service.create_onboarding_session(
+            self.project_context.organization_name,
+            self.project_context.project_slug,
+            self.project_context.member_id,
+            self.project_context.project_id
+        )
+    
+    async def _process_one(self, index: int, total: int, contact: Contact, admission: AdmissionController):
+        """Onboard one contact; committee, Slack and email calls run concurrently"""
+        async with admission:
+            with span("contact.process", contact_id=contact.contact_id, contact_type=contact.contact_type):
+                started = time.perf_counter()
+                clog = self.log.bind(contact_id=contact.contact_id)
+                clog.info("\nProcessing contact %d/%d: %s %s", index, total, contact.first_name, contact.last_name,
+                          extra={"step": "contact_start"})
+                
+                # The database and email services take plain dicts; convert once per contact
+                contact_row = asdict(contact)
+                
+                # Add to database
+                db_result = await self.db_service.add_contact_to_session(self.session_id, contact_row)
+                contact_db_id = db_result['contact_onboarding_id']
+                
+                # Committee assignment, Slack invitation and welcome email are independent
+                calls = [
+                    self._call("slack", lambda: self.slack_service.invite_to_workspace(
+                        contact.email,
+                        SLACK_DEFAULT_CHANNELS,
+                        self.project_context.organization_name
+                    )),
+                    self._call("email", lambda: self.email_service.send_welcome_email(
+                        contact_row,
+                        self._project_info
+                    ))
+                ]
+                # Contacts whose type has no committee in this project skip that step
+                committee_result = {"status": "skipped", "member_id": None}
+                committee_id = self.project_context.committees.get(contact.contact_type)
+                if committee_id:
+                    calls.append(self._call("committee", lambda: self.project_service.add_committee_member(
+                        self.project_context.project_id,
+                        committee_id,
+                        {
+                            **self._member_static,
+                            "name": f"{contact.first_name} {contact.last_name}",
+                            "email": contact.email,
+                            "title": contact.title,
+                            "role": contact.contact_type
+                        }
+                    )))
+                slack_result, email_result, *committee_results = await gather_or_cancel(*calls)
+                if committee_results:
+                    committee_result = committee_results[0]
+                    clog.info("  ✓ Added to committee: %s", committee_result['status'],
+                              extra={"step": "committee", "status": committee_result['status']})
+                clog.info("  ✓ Slack invitation: %s", slack_result['status'],
+                          extra={"step": "slack", "status": slack_result['status']})
+                clog.info("  ✓ Welcome email: %s", email_result['status'],
+                          extra={"step": "email", "status": email_result['status']})
+                # Slack's error is a pending invitation, not overload, so only the other two count
+                await self._adjust_admission(admission, email_result, *committee_results)
+                
+                # Record all three outcomes and the derived overall status in one update
+                await self.db_service.update_contact_results(
+                    contact_db_id,
+                    step_status(committee_result['status']),
+                    committee_result.get('member_id') if committee_result['status'] == 'success' else None,
+                    step_status(slack_result['status']),
+                    slack_result.get('slack_user_id'),
+                    step_status(email_result['status'])
+                )
+                
+                clog.debug("Contact processed", extra={
+                    "step": "contact_done",
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 1)
+                })
+                self._results_file.write(dumps_bytes({
+                    "contact_id": contact.contact_id,
+                    "contact": contact_row,
+                    "committee": committee_result,
+                    "slack": slack_result,
+                    "email": email_result
+                }, default=str) + b"\n")
+
+    async def _call(self, service: str, make_call: Callable[[], Awaitable[Dict]]) -> Dict:
+        """
+        Call a service through its rate limiter, retrying transient errors with backoff.
+
+        Each attempt takes its own limiter slot, so retries stay within the service's
+        rate. A permanent error (e.g. an invitation already pending) is returned as is.
+        """
+        async def attempt():
+            async with self._limiters[service]:
+                return await make_call()
+        
+        result, reason = await retry_async(
+            attempt,
+            retries=SERVICE_RETRIES,
+            base=0.5,
+            cap=8.0,
+            is_success=lambda r: r['status'] != 'error' or r.get('error') in _PERMANENT_ERRORS
+        )
+        if result is None:
+            return {"status": "error", "message": reason}
+        return result
+    
+    async def _adjust_admission(self, admission: AdmissionController, *results: Dict):
+        """Halve the contact concurrency on a transient service error, regrow it by one on success"""
+        if any(result['status'] == 'error' for result in results):
+            if admission.limit > 1:
+                await admission.resize(admission.limit // 2)
+                self.log.warning("Service reported a transient error; contact concurrency now %d", admission.limit,
+                                 extra={"step": "backpressure", "limit": admission.limit})
+        elif admission.limit < CONTACT_CONCURRENCY:
+            await admission.resize(admission.limit + 1)
+
 async def main(organization_name: str, project_slug: str):
     """Main entry point"""
     try:
@@ -247,32 +372,31 @@ async def main(organization_name: str, project_slug: str):
             project_slug=project_slug
         )
         
-        # Create and run orchestrator
-        orchestrator = StubOrchestrator(project_context)
+        # Create and run orchestrator; per-contact results stream to the .jsonl file
+        output_stem = f"stub_result_{organization_name.lower().replace(' ', '_')}_{project_slug}"
+        orchestrator = StubOrchestrator(project_context, f"{output_stem}.jsonl")
         result = await orchestrator.process_contacts()
         
-        # Save results
-        output_file = f"stub_result_{organization_name.lower().replace(' ', '_')}_{project_slug}.json"
-        with open(output_file, 'w') as f:
-            json.dump(result, f, indent=2, default=str)
+        # Save the summary and report
+        output_file = f"{output_stem}_summary.json"
+        with open(output_file, 'wb') as f:
+            f.write(dumps_bytes(result, default=str, indent=True))
         
-        logger.info(f"\nResults saved to: {output_file}")
+        logger.info("\nSummary saved to: %s", output_file)
         
         # Print summary
         if result['status'] == 'success':
-            logger.info(f"\n✅ Successfully processed {result['contacts_processed']} contacts")
+            logger.info("\n✅ Successfully processed %d contacts", result['contacts_processed'])
         else:
-            logger.error(f"\n❌ Failed: {result.get('message', 'Unknown error')}")
+            logger.error("\n❌ Failed: %s", result.get('message', 'Unknown error'))
         
         return result
         
     except Exception as e:
-        logger.error(f"System error: {str(e)}")
+        logger.error("System error: %s", e)
         raise
 
 if __name__ == "__main__":
-    import sys
-    
     if len(sys.argv) != 3:
         print("Usage: python run_with_stubs.py <organization_name> <project_slug>")
         print("Example: python run_with_stubs.py 'Acme Corp' 'cncf'")
@@ -1,14 +1,19 @@
 """Orchestrator Agent that coordinates all other agents"""
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+import re
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Set
 from datetime import datetime
 from agno.agent import Agent, Message
 
 from ..models.project import ProjectContext
-from ..models.events import ContactResult, BatchResult, OnboardingStatus
-from ..tools.mcp.database import OnboardingDatabase
+from ..models.events import ContactResult, BatchResult, FailureTally, OnboardingStatus
+from ..tools.mcp_database import OnboardingDatabaseToolsMCP
+from ..utils.exceptions import APIException
 from ..utils.progress_logger import progress_logger
+from ..utils.cache import async_ttl_cache
+from ..utils.retry import retry_async, RETRIES_EXHAUSTED
 
 # Import specialized agents
 from .specialized.member_contact import MemberContactFetcherAgent
@@ -20,49 +25,85 @@ from .specialized.database import DatabaseAgent
 
 logger = logging.getLogger(__name__)
 
+# Contacts onboarded at the same time across the whole session
+CONTACT_CONCURRENCY = 10
+# Completed contacts between status flushes and failure-rate checks
+PROGRESS_INTERVAL = 10
+# Adding an existing committee member returns already_member, so no membership check is needed first
+COMMITTEE_ADD_IS_IDEMPOTENT = True
+# Seconds member, project and committee lookups are reused across workflow runs
+LFX_LOOKUP_TTL = 300
 
-class OrchestratorAgent(Agent):
-    """Master agent that coordinates all other agents"""
+# contact_type -> committee display name
+_COMMITTEE_NAMES = MappingProxyType({
+    "primary": "Governing Board",
+    "marketing": "Marketing Committee",
+    "technical": "Technical Committee"
+})
+_DEFAULT_COMMITTEE_META = MappingProxyType({"id": None, "name": "Project Committee"})
+
+# Committee name keyword -> contact type ('tech' also matches 'technical')
+_COMMITTEE_KEYWORDS = MappingProxyType({
+    "governing": "primary",
+    "board": "primary",
+    "marketing": "marketing",
+    "tech": "technical"
+})
+# All keywords in one alternation (longest first), so a name is scanned once
+_COMMITTEE_RE = re.compile(
+    '|'.join(map(re.escape, sorted(_COMMITTEE_KEYWORDS, key=len, reverse=True))),
+    re.IGNORECASE
+)
+_CONTACT_TYPE_PRIORITY = ("primary", "marketing", "technical")
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Retry rate limits (429), server errors and failures without a status; not other 4xx"""
+    if isinstance(exc, APIException) and exc.status_code is not None:
+        return exc.status_code == 429 or exc.status_code >= 500
+    return True
+
+
+def _shared_key(_self: Any, *args: Any) -> tuple:
+    """Cache key for lookups shared by every orchestrator instance"""
+    return args
+
+
+async def _resolved(value: Dict) -> Dict:
+    """Coroutine for a step whose result is already known, so it can join a gather"""
+    return value
+
+
+def _to_status(outcome: Any) -> Dict:
+    """Turn an exception returned by gather(return_exceptions=True) into a failed step"""
+    if isinstance(outcome, Exception):
+        return {"status": "failed", "error": str(outcome)}
+    return outcome
+
+
+class OrchestratorAgent:
+    """
+    Coordinates the specialized agents through a fixed onboarding workflow.
     
-    def __init__(self, project_context: ProjectContext, db: OnboardingDatabase):
-        super().__init__(
-            name="Orchestrator",
-            instructions=f"""You are the master coordinator for onboarding contacts from {project_context.organization_name} 
-            to the {project_context.project_slug} project.
-            
-            Your responsibilities:
-            1. Coordinate work between all specialized agents
-            2. Maintain workflow state in the database
-            3. Handle error recovery with intelligent retry strategies
-            4. Ensure all contacts are properly onboarded to their committees
-            5. Generate comprehensive status reports
-            6. Make autonomous decisions on workflow progression
-            
-            Workflow order:
-            1. Fetch member ID and contacts from Member Service
-            2. Get project details and identify committees
-            3. For each contact batch (process in batches of 10):
-               - Add to appropriate committee based on contact_type
-               - Update database with progress
-               - Parallel process:
-                 * Send Slack invitation with role-specific channels
-                 * Send committee-specific welcome email
-               - Track all status in database
-            4. After all contacts processed:
-               - Update project landscape with organization data
-               - Generate completion report from database
-            
-            Decision rules:
-            - If contact missing required data: Log and skip
-            - If committee doesn't exist: Alert and use default committee
-            - If Slack invitation fails 3 times: Mark as failed
-            - If >20% failure rate: Pause, analyze, and alert
-            """
-        )
-        
+    The workflow is deterministic, so this is a plain asyncio coordinator rather
+    than an agno Agent: no prompt or model dispatch sits between its steps. Only the
+    sub-agents it delegates to are Agents.
+    """
+    
+    name = "Orchestrator"
+    
+    def __init__(self, project_context: ProjectContext, db: OnboardingDatabaseToolsMCP):
         self.project_context = project_context
         self.db = db
         self.session_id = None
+        # Status updates queued by update_contact_status until the next checkpoint
+        self._pending_status_updates: List[Dict] = []
+        # Per-contact-type committee id and name, built by setup_committees
+        self._committee_meta: Dict[str, Dict] = {}
+        # committee_id -> lowercased member emails, preloaded by load_committee_rosters
+        self._committee_members: Dict[str, Set[str]] = {}
+        # Welcome email project info, built on first use once the project is known
+        self._project_info: Optional[Dict] = None
         
         # Initialize sub-agents
         self.contact_fetcher = MemberContactFetcherAgent()
@@ -70,6 +111,7 @@ class OrchestratorAgent(Agent):
         self.slack_onboarder = SlackOnboardingAgent()
         self.email_communicator = EmailCommunicationAgent()
         self.landscape_updater = LandscapeUpdateAgent()
+        # Routine reads and writes call self.db directly; the agent is kept for task-style requests
         self.db_manager = DatabaseAgent(db)
         
         logger.debug(f"Initialized Orchestrator for {project_context.organization_name} → {project_context.project_slug}")
@@ -82,6 +124,7 @@ class OrchestratorAgent(Agent):
     
     async def process_contacts(self):
         """Main workflow orchestration method"""
+        landscape_task = None
         try:
             # Start workflow with visual header
             progress_logger.start_workflow(
@@ -104,16 +147,15 @@ class OrchestratorAgent(Agent):
             if not member_data:
                 return {"status": "error", "message": "Failed to find member or project"}
             
+            # Step 7 only needs the organization and project, so it runs alongside Steps 3-6
+            landscape_task = asyncio.ensure_future(self.update_landscape())
+            
             # Step 3: Create onboarding session
-            session_result = await self.delegate_to_agent(
-                self.db_manager,
-                "Create new onboarding session",
-                {
-                    "org_name": self.project_context.organization_name,
-                    "project_slug": self.project_context.project_slug,
-                    "member_id": self.project_context.member_id,
-                    "project_id": self.project_context.project_id
-                }
+            session_result = await self.db.create_onboarding_session(
+                org_name=self.project_context.organization_name,
+                project_slug=self.project_context.project_slug,
+                member_id=self.project_context.member_id,
+                project_id=self.project_context.project_id
             )
             self.session_id = session_result.get('session_id')
             
@@ -127,83 +169,76 @@ class OrchestratorAgent(Agent):
             contacts = contacts_result.get('contacts', [])
             logger.info(f"Found {len(contacts)} contacts to process")
             
-            # Add contacts to database
-            contact_db_mapping = {}
-            for contact in contacts:
-                add_result = await self.delegate_to_agent(
-                    self.db_manager,
-                    "Add contact to onboarding session",
-                    {"session_id": self.session_id, "contact": contact}
-                )
-                contact_db_mapping[contact['contact_id']] = add_result.get('contact_onboarding_id')
+            # Add all contacts to the database in one all-or-nothing call (one create_record per contact)
+            added = await self.db.add_contacts_bulk(session_id=self.session_id, contacts=contacts)
+            if added.get('status') != 'success':
+                landscape_task.cancel()
+                return {"status": "error", "message": f"Failed to add contacts to session: {added.get('message')}"}
+            contact_db_mapping = {
+                row['contact_id']: row['contact_onboarding_id']
+                for row in added.get('contacts', [])
+            }
             
             # Step 5: Setup committees
             committee_setup = await self.setup_committees()
             if not committee_setup.get('success'):
                 logger.warning("Committee setup incomplete, proceeding with available committees")
             
-            # Step 6: Process contacts in batches
-            batch_size = 10
-            all_results = []
+            # Step 6a: Add each committee's contacts in one bulk call per committee
+            committee_results = await self.add_to_committees(contacts, contact_db_mapping)
             
-            for i in range(0, len(contacts), batch_size):
-                batch = contacts[i:i + batch_size]
-                logger.info(f"Processing batch {i//batch_size + 1} of {(len(contacts)-1)//batch_size + 1}")
-                
-                batch_results = await self.process_contact_batch(batch, contact_db_mapping)
-                all_results.extend(batch_results)
-                
-                # Update session stats
-                await self.delegate_to_agent(
-                    self.db_manager,
-                    "Update session statistics",
-                    {"session_id": self.session_id}
-                )
-                
-                # Check failure rate
-                failure_rate = self.calculate_failure_rate(all_results)
-                if failure_rate > 0.2:
-                    logger.warning(f"High failure rate detected: {failure_rate:.2%}")
-                    await self.handle_high_failure_rate(all_results)
+            # Step 6b: Slack and email for all contacts concurrently, at most CONTACT_CONCURRENCY
+            # in flight; a monitor task checkpoints progress as results complete
+            logger.info(f"Processing {len(contacts)} contacts, {CONTACT_CONCURRENCY} at a time")
+            sem = asyncio.Semaphore(CONTACT_CONCURRENCY)
+            completed: asyncio.Queue = asyncio.Queue()
+            monitor = asyncio.ensure_future(self._monitor_progress(completed))
+            try:
+                await asyncio.gather(*(
+                    self._run_contact_with_sem(sem, contact, contact_db_mapping[contact['contact_id']], completed,
+                                               committee_results.get(contact['contact_id']))
+                    for contact in contacts
+                ))
+            finally:
+                completed.put_nowait(None)
+                await monitor
             
-            # Step 7: Update landscape
-            landscape_result = await self.delegate_to_agent(
-                self.landscape_updater,
-                f"Update {self.project_context.organization_name} entry in {self.project_context.project_slug} landscape"
-            )
+            # Anything queued since the last checkpoint is written before the report is built
+            await self.flush_status_updates()
             
-            # Step 8: Generate final report
-            report_result = await self.delegate_to_agent(
-                self.db_manager,
-                "Generate session report",
-                {"session_id": self.session_id}
-            )
+            # Step 7: Collect the landscape update started after Step 2
+            landscape_result = await landscape_task
             
+            # Step 8: Update session statistics once, then generate the final report from them
+            await self.db.update_session_statistics(session_id=self.session_id)
+            report_result = await self.db.get_session_report(session_id=self.session_id)
             report = report_result.get('report', {})
             report['landscape_update'] = landscape_result
             
-            # Final session update
-            await self.delegate_to_agent(
-                self.db_manager,
-                "Update session statistics",
-                {"session_id": self.session_id}
-            )
-            
             logger.info("Onboarding workflow completed")
             return report
             
         except Exception as e:
+            if landscape_task is not None:
+                landscape_task.cancel()
             logger.error(f"Orchestration error: {str(e)}")
             return {"status": "error", "message": str(e), "context": self.project_context.__dict__}
     
+    async def update_landscape(self) -> Dict:
+        """Update the organization's landscape entry; failures are returned, not raised"""
+        try:
+            return await self.delegate_to_agent(
+                self.landscape_updater,
+                f"Update {self.project_context.organization_name} entry in {self.project_context.project_slug} landscape"
+            )
+        except Exception as e:
+            logger.error(f"Landscape update error: {str(e)}")
+            return {"status": "failed", "error": str(e)}
+    
     async def get_member_and_project_info(self) -> Optional[Dict]:
         """Get member ID and project details"""
         # Get member ID
-        member_result = await self.delegate_to_agent(
-            self.contact_fetcher,
-            f"Get member ID for organization '{self.project_context.organization_name}'",
-            {"organization_name": self.project_context.organization_name}
-        )
+        member_result = await self._lookup_member(self.project_context.organization_name)
         
         if not member_result.get('member_id'):
             return None
@@ -211,11 +246,7 @@ class OrchestratorAgent(Agent):
         self.project_context.member_id = member_result['member_id']
         
         # Get project details
-        project_result = await self.delegate_to_agent(
-            self.committee_manager,
-            f"Get project details for slug '{self.project_context.project_slug}'",
-            {"project_slug": self.project_context.project_slug}
-        )
+        project_result = await self._lookup_project(self.project_context.project_slug)
         
         if not project_result.get('project_id'):
             return None
@@ -230,27 +261,58 @@ class OrchestratorAgent(Agent):
             "project_info": project_result.get('project_info', {})
         }
     
-    async def setup_committees(self) -> Dict:
-        """Setup committee mappings"""
-        committees_result = await self.delegate_to_agent(
+    # LFX lookups are cached per argument across runs (e.g. several orgs under one
+    # project); unsuccessful results are not kept. Membership writes never change
+    # these results, so nothing invalidates them besides the TTL.
+    @async_ttl_cache(maxsize=128, ttl=LFX_LOOKUP_TTL, key=_shared_key,
+                     should_cache=lambda result: bool(result.get('member_id')))
+    async def _lookup_member(self, organization_name: str) -> Dict:
+        return await self.delegate_to_agent(
+            self.contact_fetcher,
+            f"Get member ID for organization '{organization_name}'",
+            {"organization_name": organization_name}
+        )
+    
+    @async_ttl_cache(maxsize=128, ttl=LFX_LOOKUP_TTL, key=_shared_key,
+                     should_cache=lambda result: bool(result.get('project_id')))
+    async def _lookup_project(self, project_slug: str) -> Dict:
+        return await self.delegate_to_agent(
+            self.committee_manager,
+            f"Get project details for slug '{project_slug}'",
+            {"project_slug": project_slug}
+        )
+    
+    @async_ttl_cache(maxsize=128, ttl=LFX_LOOKUP_TTL, key=_shared_key,
+                     should_cache=lambda result: 'committees' in result)
+    async def _lookup_committees(self, project_id: str) -> Dict:
+        return await self.delegate_to_agent(
             self.committee_manager,
-            f"Get all committees for project {self.project_context.project_id}",
-            {"project_id": self.project_context.project_id}
+            f"Get all committees for project {project_id}",
+            {"project_id": project_id}
         )
+    
+    async def setup_committees(self) -> Dict:
+        """Setup committee mappings"""
+        committees_result = await self._lookup_committees(self.project_context.project_id)
         
         committee_map = {}
         committees = committees_result.get('committees', [])
         
         for committee in committees:
-            name_lower = committee.get('name', '').lower()
-            if 'governing' in name_lower or 'board' in name_lower:
-                committee_map['primary'] = committee['id']
-            elif 'marketing' in name_lower:
-                committee_map['marketing'] = committee['id']
-            elif 'technical' in name_lower or 'tech' in name_lower:
-                committee_map['technical'] = committee['id']
+            keywords = _COMMITTEE_RE.findall(committee.get('name', ''))
+            if keywords:
+                # Governing/board beats marketing beats technical
+                contact_type = min((_COMMITTEE_KEYWORDS[k.lower()] for k in keywords), key=_CONTACT_TYPE_PRIORITY.index)
+                committee_map[contact_type] = committee['id']
         
         self.project_context.committees = committee_map
+        self._committee_meta = {
+            contact_type: {"id": committee_map.get(contact_type), "name": name}
+            for contact_type, name in _COMMITTEE_NAMES.items()
+        }
+        # An idempotent add already reports existing members, so a roster would only add calls
+        if not COMMITTEE_ADD_IS_IDEMPOTENT:
+            await self.load_committee_rosters(set(committee_map.values()))
         
         # Check if all committees are found
         missing = []
@@ -264,34 +326,50 @@ class OrchestratorAgent(Agent):
             "missing_committees": missing
         }
     
-    async def process_contact_batch(self, batch: List[Dict], contact_db_mapping: Dict) -> List[ContactResult]:
-        """Process a batch of contacts in parallel"""
-        tasks = []
-        for contact in batch:
-            db_id = contact_db_mapping[contact['contact_id']]
-            task = self.process_single_contact(contact, db_id)
-            tasks.append(task)
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Convert to ContactResult objects
-        contact_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                contact_results.append(ContactResult(
-                    contact_id=batch[i]['contact_id'],
-                    email=batch[i]['email'],
-                    db_id=contact_db_mapping[batch[i]['contact_id']],
+    async def _run_contact_with_sem(self, sem: asyncio.Semaphore, contact: Dict, db_id: int,
+                                    completed: asyncio.Queue,
+                                    committee_result: Optional[Dict] = None):
+        """Process one contact once the semaphore admits it and hand the result to the monitor"""
+        async with sem:
+            try:
+                result = await self.process_single_contact(contact, db_id, committee_result)
+            except Exception as e:
+                result = ContactResult(
+                    contact_id=contact['contact_id'],
+                    email=contact['email'],
+                    db_id=db_id,
                     status=OnboardingStatus.FAILED,
-                    error=str(result)
-                ))
-            else:
-                contact_results.append(result)
+                    error=str(e)
+                )
+        completed.put_nowait(result)
+    
+    async def _monitor_progress(self, completed: asyncio.Queue):
+        """Checkpoint every PROGRESS_INTERVAL completed contacts until a None sentinel arrives"""
+        # Only running counts are kept; full results go to the database as they complete
+        tally = FailureTally()
+        while True:
+            result = await completed.get()
+            if result is None:
+                break
+            tally.add(result)
+            if tally.total % PROGRESS_INTERVAL == 0:
+                await self._checkpoint(tally)
+        
+        if tally.total % PROGRESS_INTERVAL:
+            await self._checkpoint(tally)
+    
+    async def _checkpoint(self, tally: FailureTally):
+        """Flush queued statuses and check the failure rate so far"""
+        # Session stats are aggregated once at the end of the workflow, not per checkpoint
+        await self.flush_status_updates()
         
-        return contact_results
+        if tally.failure_rate > 0.2:
+            logger.warning(f"High failure rate detected: {tally.failure_rate:.2%}")
+            await self.handle_high_failure_rate(tally=tally)
     
-    async def process_single_contact(self, contact: Dict, db_id: int) -> ContactResult:
-        """Process a single contact through all systems"""
+    async def process_single_contact(self, contact: Dict, db_id: int,
+                                     committee_result: Optional[Dict] = None) -> ContactResult:
+        """Process a single contact through all systems; committee_result skips the committee step"""
         result = ContactResult(
             contact_id=contact['contact_id'],
             email=contact['email'],
@@ -299,28 +377,26 @@ class OrchestratorAgent(Agent):
         )
         
         try:
-            # Add to committee
-            committee_id = self.project_context.committees.get(contact['contact_type'])
-            if committee_id:
-                result.committee = await self.add_to_committee(contact, committee_id, db_id)
+            # Committee id and name are fixed by setup_committees, so all three steps
+            # are chosen up front and awaited in one gather
+            meta = self._committee_meta.get(contact['contact_type'], _DEFAULT_COMMITTEE_META)
+            if committee_result is not None:
+                committee_coro = _resolved(committee_result)
+            elif meta['id']:
+                committee_coro = self.add_to_committee(contact, meta['id'], db_id)
             else:
-                result.committee = {"status": "skipped", "reason": "committee_not_found"}
-                await self.update_contact_status(db_id, "committee", "skipped")
-            
-            # Parallel processing for Slack and Email
-            slack_task = self.process_slack_onboarding(contact, db_id)
-            email_task = self.process_email_onboarding(contact, db_id)
+                self.update_contact_status(db_id, "committee", "skipped")
+                committee_coro = _resolved({"status": "skipped", "reason": "committee_not_found"})
             
-            result.slack, result.email_result = await asyncio.gather(
-                slack_task, email_task,
+            committee, slack, email = await asyncio.gather(
+                committee_coro,
+                self.process_slack_onboarding(contact, db_id, meta),
+                self.process_email_onboarding(contact, db_id, meta),
                 return_exceptions=True
             )
-            
-            # Handle exceptions
-            if isinstance(result.slack, Exception):
-                result.slack = {"status": "failed", "error": str(result.slack)}
-            if isinstance(result.email_result, Exception):
-                result.email_result = {"status": "failed", "error": str(result.email_result)}
+            result.committee = _to_status(committee)
+            result.slack = _to_status(slack)
+            result.email_result = _to_status(email)
             
             # Determine final status
             if result.is_successful:
@@ -335,70 +411,159 @@ class OrchestratorAgent(Agent):
         
         return result
     
+    async def add_to_committees(self, contacts: List[Dict], contact_db_mapping: Dict) -> Dict[str, Dict]:
+        """
+        Add contacts to their committees with one bulk call per committee, run concurrently.
+        
+        Returns contact_id -> committee result. Members the bulk call could not add
+        are retried one by one through add_to_committee.
+        """
+        by_committee: Dict[str, List[Dict]] = {}
+        results = {}
+        for contact in contacts:
+            committee_id = self.project_context.committees.get(contact['contact_type'])
+            if committee_id:
+                by_committee.setdefault(committee_id, []).append(contact)
+            else:
+                results[contact['contact_id']] = {"status": "skipped", "reason": "committee_not_found"}
+                self.update_contact_status(contact_db_mapping[contact['contact_id']], "committee", "skipped")
+        
+        for committee_results in await asyncio.gather(*(
+            self._bulk_add_to_committee(committee_id, members, contact_db_mapping)
+            for committee_id, members in by_committee.items()
+        )):
+            results.update(committee_results)
+        return results
+    
+    async def _bulk_add_to_committee(self, committee_id: str, contacts: List[Dict],
+                                     contact_db_mapping: Dict) -> Dict[str, Dict]:
+        """Bulk-add one committee's contacts, falling back to per-contact adds for failures"""
+        results = {}
+        pending = []
+        for contact in contacts:
+            known = self._known_member(contact, committee_id, contact_db_mapping[contact['contact_id']])
+            if known:
+                results[contact['contact_id']] = known
+            else:
+                pending.append(contact)
+        if not pending:
+            return results
+        contacts = pending
+        
+        try:
+            bulk = await self.delegate_to_agent(
+                self.committee_manager,
+                f"Bulk add members to committee {committee_id}",
+                {
+                    "project_id": self.project_context.project_id,
+                    "committee_id": committee_id,
+                    "members": [self._committee_member_data(contact) for contact in contacts]
+                }
+            )
+            member_results = bulk.get('results', []) if bulk.get('status') == 'success' else []
+        except Exception as e:
+            logger.warning(f"Bulk add to committee {committee_id} failed: {str(e)}")
+            member_results = []
+        
+        retry = []
+        for i, contact in enumerate(contacts):
+            member_result = member_results[i] if i < len(member_results) else None
+            if member_result and member_result.get('status') in ('success', 'already_member'):
+                self.update_contact_status(contact_db_mapping[contact['contact_id']], "committee",
+                                           member_result['status'], {"committee_id": committee_id})
+                results[contact['contact_id']] = member_result
+            else:
+                retry.append(contact)
+        
+        retried = await asyncio.gather(*(
+            self.add_to_committee(contact, committee_id, contact_db_mapping[contact['contact_id']])
+            for contact in retry
+        ))
+        results.update((contact['contact_id'], result) for contact, result in zip(retry, retried))
+        return results
+    
+    def _known_member(self, contact: Dict, committee_id: str, db_id: int) -> Optional[Dict]:
+        """already_member result if the preloaded roster lists the contact, else None"""
+        roster = self._committee_members.get(committee_id)
+        if roster is None or contact['email'].lower() not in roster:
+            return None
+        self.update_contact_status(db_id, "committee", "already_member", {"committee_id": committee_id})
+        return {"status": "already_member", "committee_id": committee_id}
+    
+    async def load_committee_rosters(self, committee_ids):
+        """Fetch each committee's member emails once so adds can skip existing members"""
+        committee_ids = list(committee_ids)
+        rosters = await asyncio.gather(*(
+            self.delegate_to_agent(
+                self.committee_manager,
+                f"List committee members of {committee_id}",
+                {"project_id": self.project_context.project_id, "committee_id": committee_id}
+            )
+            for committee_id in committee_ids
+        ), return_exceptions=True)
+        
+        for committee_id, roster in zip(committee_ids, rosters):
+            # Without a roster, adds for that committee go to the API as before
+            if isinstance(roster, dict) and roster.get('status') == 'success':
+                self._committee_members[committee_id] = {
+                    member['email'].lower() for member in roster.get('members', []) if member.get('email')
+                }
+    
+    def _committee_member_data(self, contact: Dict) -> Dict:
+        """Committee membership payload for a contact"""
+        return {
+            "name": f"{contact.get('first_name', '')} {contact.get('last_name', '')}",
+            "email": contact['email'],
+            "organization": self.project_context.organization_name,
+            "title": contact.get('title', ''),
+            "role": contact['contact_type'],
+            "join_date": datetime.now().isoformat()
+        }
+    
     async def add_to_committee(self, contact: Dict, committee_id: str, db_id: int) -> Dict:
-        """Add contact to committee with retry logic"""
-        max_retries = 3
-        retry_count = 0
+        """Add contact to committee with retry logic; an existing member counts as done"""
+        known = self._known_member(contact, committee_id, db_id)
+        if known:
+            return known
         
-        while retry_count < max_retries:
-            try:
-                # Check if already a member
-                check_result = await self.delegate_to_agent(
-                    self.committee_manager,
-                    f"Check if {contact['email']} is already in committee {committee_id}",
-                    {
-                        "project_id": self.project_context.project_id,
-                        "committee_id": committee_id,
-                        "email": contact['email']
-                    }
-                )
-                
-                if check_result.get('is_member'):
-                    await self.update_contact_status(db_id, "committee", "already_member", 
-                                                   {"committee_id": committee_id})
-                    return {"status": "already_member", "committee_id": committee_id}
-                
-                # Add to committee
-                result = await self.delegate_to_agent(
-                    self.committee_manager,
-                    f"Add {contact['email']} to committee {committee_id}",
-                    {
-                        "project_id": self.project_context.project_id,
-                        "committee_id": committee_id,
-                        "member_data": {
-                            "name": f"{contact.get('first_name', '')} {contact.get('last_name', '')}",
-                            "email": contact['email'],
-                            "organization": self.project_context.organization_name,
-                            "title": contact.get('title', ''),
-                            "role": contact['contact_type'],
-                            "join_date": datetime.now().isoformat()
-                        }
-                    }
-                )
-                
-                if result.get('status') == 'success':
-                    await self.update_contact_status(db_id, "committee", "success", 
-                                                   {"committee_id": committee_id})
-                    return result
-                
-                retry_count += 1
-                if retry_count < max_retries:
-                    await asyncio.sleep(2 ** retry_count)  # Exponential backoff
-                    
-            except Exception as e:
-                retry_count += 1
-                if retry_count >= max_retries:
-                    await self.update_contact_status(db_id, "committee", "failed", 
-                                                   {"error": str(e)})
-                    return {"status": "failed", "error": str(e)}
-        
-        await self.update_contact_status(db_id, "committee", "failed", 
-                                       {"error": "retries_exhausted"})
-        return {"status": "failed", "retries_exhausted": True}
+        # Built once so every retry sends the same payload, join_date included
+        task = f"Add or noop committee member {contact['email']} in committee {committee_id}"
+        task_context = {
+            "project_id": self.project_context.project_id,
+            "committee_id": committee_id,
+            "member_data": self._committee_member_data(contact)
+        }
+        
+        async def attempt():
+            # One idempotent call: adds the member, or reports already_member
+            return await self.delegate_to_agent(self.committee_manager, task, task_context)
+        
+        # Jittered backoff from ~0.1s, capped at 5s; client errors are not retried
+        result, reason = await retry_async(
+            attempt,
+            retries=3,
+            base=0.05,
+            cap=5.0,
+            is_success=lambda r: r.get('status') in ('success', 'already_member'),
+            retry_on=_is_retryable
+        )
+        
+        if reason is None:
+            self.update_contact_status(db_id, "committee", result['status'],
+                                     {"committee_id": committee_id})
+            return result
+        
+        self.update_contact_status(db_id, "committee", "failed", {"error": reason})
+        if reason == RETRIES_EXHAUSTED:
+            return {"status": "failed", "retries_exhausted": True}
+        return {"status": "failed", "error": reason}
     
-    async def process_slack_onboarding(self, contact: Dict, db_id: int) -> Dict:
+    async def process_slack_onboarding(self, contact: Dict, db_id: int,
+                                       meta: Optional[Mapping] = None) -> Dict:
         """Handle Slack onboarding"""
         try:
+            if meta is None:
+                meta = self._committee_meta.get(contact['contact_type'], _DEFAULT_COMMITTEE_META)
             result = await self.delegate_to_agent(
                 self.slack_onboarder,
                 f"Complete Slack onboarding for {contact['email']} with committee-specific channels",
@@ -406,76 +571,80 @@ class OrchestratorAgent(Agent):
                     "contact": contact,
                     "organization": self.project_context.organization_name,
                     "project_slug": self.project_context.project_slug,
-                    "committee": self.get_committee_name(contact['contact_type'])
+                    "committee": meta['name']
                 }
             )
             
             if result.get('status') == 'success':
-                await self.update_contact_status(db_id, "slack", "success", 
-                                               {"slack_user_id": result.get('slack_user_id')})
+                self.update_contact_status(db_id, "slack", "success",
+                                         {"slack_user_id": result.get('slack_user_id')})
             else:
-                await self.update_contact_status(db_id, "slack", "failed", 
-                                               {"error": result.get('error', 'Unknown error')})
+                self.update_contact_status(db_id, "slack", "failed",
+                                         {"error": result.get('error', 'Unknown error')})
             
             return result
             
         except Exception as e:
-            await self.update_contact_status(db_id, "slack", "failed", {"error": str(e)})
+            self.update_contact_status(db_id, "slack", "failed", {"error": str(e)})
             return {"status": "failed", "error": str(e)}
     
-    async def process_email_onboarding(self, contact: Dict, db_id: int) -> Dict:
+    async def process_email_onboarding(self, contact: Dict, db_id: int,
+                                       meta: Optional[Mapping] = None) -> Dict:
         """Handle email onboarding"""
         try:
-            project_info = {
-                "name": self.project_context.project_name or self.project_context.project_slug,
-                "slug": self.project_context.project_slug,
-                "organization": self.project_context.organization_name
-            }
+            if self._project_info is None:
+                self._project_info = {
+                    "name": self.project_context.project_name or self.project_context.project_slug,
+                    "slug": self.project_context.project_slug,
+                    "organization": self.project_context.organization_name
+                }
+            if meta is None:
+                meta = self._committee_meta.get(contact['contact_type'], _DEFAULT_COMMITTEE_META)
             
             result = await self.delegate_to_agent(
                 self.email_communicator,
                 f"Send committee-specific welcome email to {contact['email']}",
                 {
                     "contact": contact,
-                    "project_info": project_info,
-                    "committee": self.get_committee_name(contact['contact_type'])
+                    "project_info": self._project_info,
+                    "committee": meta['name']
                 }
             )
             
             if result.get('status') == 'success':
-                await self.update_contact_status(db_id, "email", "success")
+                self.update_contact_status(db_id, "email", "success")
             else:
-                await self.update_contact_status(db_id, "email", "failed", 
-                                               {"error": result.get('error', 'Unknown error')})
+                self.update_contact_status(db_id, "email", "failed",
+                                         {"error": result.get('error', 'Unknown error')})
             
             return result
             
         except Exception as e:
-            await self.update_contact_status(db_id, "email", "failed", {"error": str(e)})
+            self.update_contact_status(db_id, "email", "failed", {"error": str(e)})
             return {"status": "failed", "error": str(e)}
     
-    async def update_contact_status(self, db_id: int, status_type: str, status: str, 
-                                  additional_data: Optional[Dict] = None):
-        """Update contact status in database"""
-        await self.delegate_to_agent(
-            self.db_manager,
-            "Update contact status",
-            {
-                "contact_onboarding_id": db_id,
-                "status_type": status_type,
-                "status": status,
-                "additional_data": additional_data
-            }
-        )
+    def update_contact_status(self, db_id: int, status_type: str, status: str,
+                              additional_data: Optional[Dict] = None):
+        """Queue a contact status update; written by the next flush_status_updates()"""
+        self._pending_status_updates.append({
+            "contact_id": db_id,
+            "status_type": status_type,
+            "status": status,
+            "additional_data": additional_data
+        })
+    
+    async def flush_status_updates(self):
+        """Write all queued status updates with one bulk call"""
+        if not self._pending_status_updates:
+            return
+        updates, self._pending_status_updates = self._pending_status_updates, []
+        result = await self.db.update_contact_statuses_bulk(updates=updates)
+        if result.get('status') != 'success':
+            logger.error(f"Failed to write {len(updates)} contact status updates")
     
     def get_committee_name(self, contact_type: str) -> str:
         """Get committee name based on contact type"""
-        committee_names = {
-            "primary": "Governing Board",
-            "marketing": "Marketing Committee",
-            "technical": "Technical Committee"
-        }
-        return committee_names.get(contact_type, "Project Committee")
+        return _COMMITTEE_NAMES.get(contact_type, _DEFAULT_COMMITTEE_META['name'])
     
     def calculate_failure_rate(self, results: List[ContactResult]) -> float:
         """Calculate the failure rate of processed contacts"""
@@ -485,9 +654,10 @@ class OrchestratorAgent(Agent):
         failures = sum(1 for r in results if r.status in [OnboardingStatus.FAILED, OnboardingStatus.PARTIAL])
         return failures / len(results)
     
-    async def handle_high_failure_rate(self, results: List[ContactResult]):
-        """Handle high failure rate scenario"""
-        analysis = self.analyze_failures(results)
+    async def handle_high_failure_rate(self, results: Optional[List[ContactResult]] = None,
+                                       tally: Optional[FailureTally] = None):
+        """Handle high failure rate scenario, from results or an already-collected tally"""
+        analysis = self._failure_analysis(tally) if tally is not None else self.analyze_failures(results or [])
         logger.critical(f"High failure rate alert: {analysis}")
         
         # In production, this would trigger alerts
@@ -495,20 +665,23 @@ class OrchestratorAgent(Agent):
     
     def analyze_failures(self, results: List[ContactResult]) -> Dict:
         """Analyze failure patterns"""
-        failures = [r for r in results if r.status in [OnboardingStatus.FAILED, OnboardingStatus.PARTIAL]]
-        
-        analysis = {
+        tally = FailureTally()
+        for result in results:
+            tally.add(result)
+        return self._failure_analysis(tally)
+    
+    def _failure_analysis(self, tally: FailureTally) -> Dict:
+        """Failure analysis report for a tally"""
+        return {
             "organization": self.project_context.organization_name,
             "project": self.project_context.project_slug,
-            "total_failures": len(failures),
-            "failure_rate": len(failures) / len(results) if results else 0,
-            "committee_failures": sum(1 for f in failures if f.committee and f.committee.get('status') == 'failed'),
-            "slack_failures": sum(1 for f in failures if f.slack and f.slack.get('status') == 'failed'),
-            "email_failures": sum(1 for f in failures if f.email_result and f.email_result.get('status') == 'failed'),
+            "total_failures": tally.failures,
+            "failure_rate": tally.failure_rate,
+            "committee_failures": tally.committee_failures,
+            "slack_failures": tally.slack_failures,
+            "email_failures": tally.email_failures,
             "timestamp": datetime.now().isoformat()
         }
-        
-        return analysis
     
     async def delegate_to_agent(self, agent: Agent, task: str, context: Dict = None) -> Any:
         """Delegate a task to a specific agent"""
@@ -7,7 +7,7 @@ from agno.agent import Agent, Message
 
 from ..models.project import ProjectContext
 from ..models.events import ContactResult, BatchResult, OnboardingStatus
-from ..tools.mcp.database import OnboardingDatabase
+from ..tools.mcp_database import OnboardingDatabaseToolsMCP
 from ..utils.progress_logger import progress_logger
 
 # Import specialized agents
@@ -24,7 +24,7 @@ logger = logging.getLogger(__name__)
 class OrchestratorAgent(Agent):
     """Master agent that coordinates all other agents with enhanced logging"""
     
-    def __init__(self, project_context: ProjectContext, db: OnboardingDatabase):
+    def __init__(self, project_context: ProjectContext, db: OnboardingDatabaseToolsMCP):
         super().__init__(
             name="Orchestrator",
             instructions=f"""You are the master coordinator for onboarding contacts from {project_context.organization_name} 
@@ -256,7 +256,8 @@ class OrchestratorAgent(Agent):
             progress_logger.complete_stage()
             
             # Show completion summary
-            session = report_result.get('session', {})
+            report = report_result.get('report', {})
+            session = report.get('session', {})
             stats = {
                 'total_contacts': session.get('total_contacts', 0),
                 'successful_contacts': session.get('successful_contacts', 0),
@@ -268,7 +269,7 @@ class OrchestratorAgent(Agent):
             
             progress_logger.complete_workflow(stats)
             
-            return report_result
+            return report
             
         except Exception as e:
             progress_logger.log_error(f"System error: {str(e)}")
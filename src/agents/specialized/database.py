@@ -1,14 +1,14 @@
 """Database Agent for managing onboarding state"""
 from typing import Dict, Any
 from agno.agent import Agent
-from ...tools.mcp.database import OnboardingDatabase
+from ...tools.mcp_database import OnboardingDatabaseToolsMCP
 
 
 class DatabaseAgent(Agent):
     """Agent responsible for database operations via MCP"""
     
-    def __init__(self, db: OnboardingDatabase = None):
-        self.db = db or OnboardingDatabase()
+    def __init__(self, db: OnboardingDatabaseToolsMCP = None):
+        self.db = db or OnboardingDatabaseToolsMCP()
         
         super().__init__(
             name="DatabaseManager",
@@ -31,40 +31,51 @@ class DatabaseAgent(Agent):
             return {"status": "success", "message": "Database schema initialized"}
         
         elif "Create new onboarding session" in task:
-            session_id = await self.db.create_onboarding_session(
+            # Result carries session_id on success
+            return await self.db.create_onboarding_session(
                 org_name=context.get('org_name'),
                 project_slug=context.get('project_slug'),
                 member_id=context.get('member_id'),
                 project_id=context.get('project_id')
             )
-            return {"status": "success", "session_id": session_id}
+        
+        elif "Add contacts batch" in task:
+            # All-or-nothing add (one create_record per contact); returns contact_id -> contact_onboarding_id rows
+            return await self.db.add_contacts_bulk(
+                session_id=context.get('session_id'),
+                contacts=context.get('contacts') or []
+            )
         
         elif "Add contact to onboarding session" in task:
-            contact_id = await self.db.add_contact_to_session(
+            # Result carries contact_onboarding_id on success
+            return await self.db.add_contact_to_session(
                 session_id=context.get('session_id'),
                 contact=context.get('contact')
             )
-            return {"status": "success", "contact_onboarding_id": contact_id}
+        
+        elif "Bulk update contact statuses" in task:
+            # Updates are {contact_id, status_type, status, additional_data}, merged per contact
+            return await self.db.update_contact_statuses_bulk(
+                updates=context.get('updates') or []
+            )
         
         elif "Update contact status" in task:
-            await self.db.update_contact_status(
-                contact_onboarding_id=context.get('contact_onboarding_id'),
+            return await self.db.update_contact_status(
+                contact_id=context.get('contact_onboarding_id'),
                 status_type=context.get('status_type'),
                 status=context.get('status'),
                 additional_data=context.get('additional_data')
             )
-            return {"status": "success"}
         
         elif "Update session statistics" in task:
-            result = await self.db.update_session_stats(
+            return await self.db.update_session_statistics(
                 session_id=context.get('session_id')
             )
-            return result
         
         elif "Generate session report" in task:
-            report = await self.db.get_session_report(
+            # Result is {"status", "report"}
+            return await self.db.get_session_report(
                 session_id=context.get('session_id')
             )
-            return {"status": "success", "report": report}
         
         return {"status": "error", "message": "Unknown task"}
\ No newline at end of file
@@ -10,6 +10,8 @@ class ProjectCommitteeAgent(Agent):
     
     def __init__(self, client: ProjectServiceClient = None):
         self.client = client or ProjectServiceClient()
+        # (committee_id, lowercased email) pairs added so far; stands in for LFX's 409 Conflict
+        self._members = set()
         
         super().__init__(
             name="ProjectCommitteeManager",
@@ -22,8 +24,8 @@ class ProjectCommitteeAgent(Agent):
                - Technical Committee for technical contacts
             3. Check if committees exist, note if any are missing
             4. For each contact:
-               - Verify they're not already a committee member
                - Add them to the appropriate committee based on their contact_type
+                 (adding an existing member is a no-op reported as already_member)
                - Include relevant metadata (organization, role, join date)
             5. Handle any committee-specific onboarding requirements
             6. Report successful additions and any issues
@@ -32,7 +34,8 @@ class ProjectCommitteeAgent(Agent):
                 self.client.get_project_by_slug,
                 self.client.get_project_committees,
                 self.client.add_committee_member,
-                self.client.check_committee_membership
+                self.client.check_committee_membership,
+                self.client.get_committee_members
             ]
         )
     
@@ -74,6 +77,39 @@ class ProjectCommitteeAgent(Agent):
                 "committees": committees
             }
         
+        elif "List committee members" in task:
+            committee_id = context.get('committee_id')
+            if not committee_id:
+                return {"status": "error", "message": "committee_id required"}
+            
+            # Simulated roster: the members added through this agent
+            return {
+                "status": "success",
+                "members": [{"email": email} for cid, email in self._members if cid == committee_id]
+            }
+        
+        elif "Bulk add members" in task:
+            committee_id = context.get('committee_id')
+            members = context.get('members')
+            
+            if not committee_id or not members:
+                return {"status": "error", "message": "committee_id and members required"}
+            
+            # One result per member, in order
+            return {
+                "status": "success",
+                "results": [self._add_or_noop(committee_id, member_data) for member_data in members]
+            }
+        
+        elif "Add or noop committee member" in task:
+            committee_id = context.get('committee_id')
+            member_data = context.get('member_data')
+            
+            if not committee_id or not member_data:
+                return {"status": "error", "message": "committee_id and member_data required"}
+            
+            return self._add_or_noop(committee_id, member_data)
+        
         elif "Check if" in task and "already in committee" in task:
             # Check membership
             return {
@@ -95,4 +131,23 @@ class ProjectCommitteeAgent(Agent):
                 "message": f"Added {member_data.get('email')} to committee {committee_id}"
             }
         
-        return {"status": "error", "message": "Unknown task"}
\ No newline at end of file
+        return {"status": "error", "message": "Unknown task"}
+    
+    def _add_or_noop(self, committee_id: str, member_data: Dict) -> Dict:
+        """Add a member, reporting already_member instead of failing for an existing one"""
+        # Adding an existing member is answered with 409 Conflict, which is not an error here
+        key = (committee_id, member_data.get('email', '').lower())
+        if key in self._members:
+            return {
+                "status": "already_member",
+                "committee_id": committee_id,
+                "message": f"{member_data.get('email')} is already in committee {committee_id}"
+            }
+        
+        # Simulated successful addition
+        self._members.add(key)
+        return {
+            "status": "success",
+            "member_id": f"mem-{datetime.now().timestamp()}",
+            "message": f"Added {member_data.get('email')} to committee {committee_id}"
+        }
\ No newline at end of file
@@ -1,14 +1,15 @@
 """Main entry point for the onboarding agent system"""
 import asyncio
+import logging
 import sys
-import json
 from typing import Optional
 from .agents.orchestrator_enhanced import OrchestratorAgent
 from .models.project import ProjectContext
-from .tools.mcp.database import OnboardingDatabase
+from .tools.mcp_database import OnboardingDatabaseToolsMCP
 from .config.settings import settings
 from .utils.logging import setup_logging
 from .utils.metrics import metrics
+from .utils.serialization import dumps
 
 # Import stub services if in local mode
 if settings.is_local_mode():
@@ -45,8 +46,8 @@ async def run_contact_onboarding(organization_name: str, project_slug: str):
         # Validate settings
         settings.validate()
         
-        # Initialize database
-        db = OnboardingDatabase(settings.DB_TYPE, settings.DB_CONNECTION)
+        # Initialize database (SQLite through the MCP server, so DB_CONNECTION is the file path)
+        db = OnboardingDatabaseToolsMCP(settings.DB_CONNECTION)
         
         # Create project context
         project_context = ProjectContext(
@@ -73,8 +74,9 @@ async def run_contact_onboarding(organization_name: str, project_slug: str):
             success_rate = session.get('successful_contacts', 0) / session.get('total_contacts', 1) * 100
             logger.debug(f"Onboarding completed in {duration:.2f}s. Success rate: {success_rate:.1f}%")
         
-        # Log metrics summary
-        logger.debug(f"Metrics: {json.dumps(metrics.get_summary(), indent=2)}")
+        # Log metrics summary (serialized only when debug output is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Metrics: %s", dumps(metrics.get_summary(), indent=True))
         
         return result
         
@@ -100,7 +102,7 @@ async def main(organization_name: str, project_slug: str):
             pass
         else:
             # Error case - show the result
-            print(json.dumps(result, indent=2, default=str))
+            print(dumps(result, default=str, indent=True))
         
         return result
         
@@ -37,6 +37,7 @@ class ContactResult:
     slack: Optional[Dict[str, Any]] = None
     email_result: Optional[Dict[str, Any]] = None
     status: OnboardingStatus = OnboardingStatus.PENDING
+    error: Optional[str] = None
     events: List[OnboardingEvent] = field(default_factory=list)
     
     def add_event(self, event_type: str, status: OnboardingStatus, 
@@ -77,4 +78,36 @@ class BatchResult:
         """Calculate failure rate"""
         if self.total_contacts == 0:
             return 0.0
-        return (self.failed + self.partial) / self.total_contacts
\ No newline at end of file
+        return (self.failed + self.partial) / self.total_contacts
+
+_FAILED_STATUSES = (OnboardingStatus.FAILED, OnboardingStatus.PARTIAL)
+
+
+@dataclass
+class FailureTally:
+    """Running failure counts over processed contacts, updated one result at a time"""
+    total: int = 0
+    failures: int = 0
+    committee_failures: int = 0
+    slack_failures: int = 0
+    email_failures: int = 0
+    
+    def add(self, result: ContactResult):
+        """Count one contact result"""
+        self.total += 1
+        if result.status not in _FAILED_STATUSES:
+            return
+        self.failures += 1
+        if result.committee and result.committee.get('status') == 'failed':
+            self.committee_failures += 1
+        if result.slack and result.slack.get('status') == 'failed':
+            self.slack_failures += 1
+        if result.email_result and result.email_result.get('status') == 'failed':
+            self.email_failures += 1
+    
+    @property
+    def failure_rate(self) -> float:
+        """Calculate failure rate"""
+        if self.total == 0:
+            return 0.0
+        return self.failures / self.total
@@ -32,11 +32,11 @@ class ProjectServiceClient(BaseAPIClient):
         }
     
     async def add_committee_member(self, project_id: str, committee_id: str, member_data: Dict) -> Dict:
-        """Add a member to a committee"""
+        """Add a member to a committee; 409 Conflict means they already are one"""
         return {
             "endpoint": f"POST /projects/{project_id}/committees/{committee_id}/committee_members",
             "payload": member_data,
-            "description": "Add contact to specified committee"
+            "description": "Add contact to specified committee (409 Conflict: already a member)"
         }
     
     async def check_committee_membership(self, project_id: str, committee_id: str, email: str) -> Dict:
@@ -47,4 +47,11 @@ class ProjectServiceClient(BaseAPIClient):
                 "email": email
             },
             "description": "Verify existing committee membership"
-        }
\ No newline at end of file
+        }
+    
+    async def get_committee_members(self, project_id: str, committee_id: str) -> Dict:
+        """List all members of a committee"""
+        return {
+            "endpoint": f"GET /projects/{project_id}/committees/{committee_id}/committee_members",
+            "description": "Fetch the full committee roster in one call"
+        }
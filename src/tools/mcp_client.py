@@ -3,12 +3,13 @@ Real MCP Client implementation using the Model Context Protocol with proper CRUD
 """
 
 import asyncio
-import json
 import logging
 from typing import Dict, Any, List, Optional
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+from ..utils.serialization import loads
+
 logger = logging.getLogger(__name__)
 
 class RealMCPClient:
@@ -75,7 +76,7 @@ class RealMCPClient:
                     if isinstance(content, list) and len(content) > 0:
                         # Handle text content
                         if hasattr(content[0], 'text'):
-                            data = json.loads(content[0].text) if content[0].text else None
+                            data = loads(content[0].text) if content[0].text else None
                             return {"status": "success", "data": data}
                         # Handle direct data
                         return {"status": "success", "data": content[0]}
@@ -222,4 +223,8 @@ class MCPDatabaseOperations:
     async def update_records(self, table: str, updates: Dict[str, Any],
                            filter: Dict[str, Any]) -> Dict[str, Any]:
         """Update records in table"""
-        return await self.client.update_records(table, updates, filter)
\ No newline at end of file
+        return await self.client.update_records(table, updates, filter)
+    
+    async def delete_records(self, table: str, filter: Dict[str, Any]) -> Dict[str, Any]:
+        """Delete records from table"""
+        return await self.client.delete_records(table, filter)
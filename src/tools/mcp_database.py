@@ -2,37 +2,103 @@
 Database abstraction using real MCP (Model Context Protocol) with proper CRUD tools
 """
 
-from typing import Dict, List, Any, Optional
+import asyncio
+from typing import Dict, List, Any, Optional, Set
 from .mcp_client import MCPDatabaseOperations
-import json
+from ..utils.serialization import dumps
 import logging
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# create_record calls add_contacts_bulk keeps in flight at once
+_BULK_INSERT_CONCURRENCY = 8
+
+# Step statuses that count as done; an existing committee member needs no add
+STEP_SUCCESS_STATUSES = frozenset(("completed", "success", "already_member"))
+
+def step_status(status: str) -> str:
+    """Stored status for one service result status: success, skipped or failed"""
+    if status in STEP_SUCCESS_STATUSES:
+        return "success"
+    return status if status == "skipped" else "failed"
+
+def overall_status(statuses) -> str:
+    """
+    Overall status for a contact's committee/Slack/email statuses.
+    
+    completed: every non-skipped step succeeded (already_member counts as success)
+    failed: any step failed
+    partial: some steps succeeded, the rest are still pending
+    pending: nothing has succeeded or failed yet
+    skipped: every step was skipped
+    """
+    # A skipped step (e.g. no committee for the contact type) neither completes nor fails the contact
+    statuses = [s for s in statuses if s != "skipped"]
+    if not statuses:
+        return "skipped"
+    if all(s in STEP_SUCCESS_STATUSES for s in statuses):
+        return "completed"
+    if any(s == "failed" for s in statuses):
+        return "failed"
+    if any(s in STEP_SUCCESS_STATUSES for s in statuses):
+        return "partial"
+    return "pending"
+
+def _overall_status_fields(statuses) -> Dict[str, str]:
+    """overall_status (plus completed_at when done) for a contact's committee/Slack/email statuses"""
+    return _overall_fields(overall_status(statuses))
+
+def _overall_fields(status: str) -> Dict[str, str]:
+    """Row fields for an already-derived overall status (completed_at when done)"""
+    if status == "completed":
+        return {"overall_status": status, "completed_at": datetime.now().isoformat()}
+    return {"overall_status": status}
+
+def _inserted_id(result: Dict) -> Optional[int]:
+    """Row id reported by a successful create_record call, if the server includes one"""
+    data = result.get("data")
+    if isinstance(data, dict):
+        return data.get("insertedId", data.get("id"))
+    return None
+
 class OnboardingDatabaseToolsMCP:
     """
     High-level database tools using MCP's CRUD operations properly.
     No raw SQL queries - only MCP tool calls.
     """
     
+    # Database paths whose schema this process has already verified or created
+    _initialized_paths: Set[str] = set()
+    
     def __init__(self, db_path: str = "./local_onboarding.db"):
+        self.db_path = db_path
         self.mcp_ops = MCPDatabaseOperations(db_path)
-        self._initialized = False
+        self._initialized = db_path in self._initialized_paths
+        self._init_lock: Optional[asyncio.Lock] = None  # created on first use (Python 3.9 loop binding)
     
     async def initialize(self) -> Dict:
-        """Initialize the database schema using MCP tools"""
+        """Initialize the database schema using MCP tools; a no-op once done in this process"""
+        if self._initialized:
+            return {"status": "success", "message": "Schema already initialized"}
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        async with self._init_lock:
+            if self.db_path in self._initialized_paths:
+                self._initialized = True
+                return {"status": "success", "message": "Schema already initialized"}
+            result = await self._initialize_schema()
+            if self._initialized:
+                self._initialized_paths.add(self.db_path)
+            return result
+    
+    async def _initialize_schema(self) -> Dict:
         try:
             # First check if tables exist by trying to read their schema
             tables_to_check = ['onboarding_sessions', 'contact_onboarding', 'onboarding_events']
-            existing_tables = []
-            
-            for table in tables_to_check:
-                result = await self.mcp_ops.get_table_schema(table)
-                if result["status"] == "success":
-                    existing_tables.append(table)
+            schemas = await asyncio.gather(*(self.mcp_ops.get_table_schema(table) for table in tables_to_check))
             
-            if len(existing_tables) == len(tables_to_check):
+            if all(result["status"] == "success" for result in schemas):
                 self._initialized = True
                 return {"status": "success", "message": "Schema already initialized"}
             
@@ -133,14 +199,106 @@ class OnboardingDatabaseToolsMCP:
         
         return result
     
-    async def update_contact_committee_status(self, contact_id: int, 
-                                            status: str, committee_id: str = None) -> Dict:
-        """Update contact's committee status using MCP update_records"""
-        updates = {
-            "committee_status": status
+    async def add_contacts_bulk(self, session_id: int, contacts: List[Dict]) -> Dict:
+        """
+        Add several contacts to a session with concurrent MCP create_record calls.
+        
+        This is not a single multi-row insert: the MCP server has no such tool, so
+        it still costs one create_record per contact (plus a read-back when the
+        server omits the new id, and one delete per created row on failure).
+        Each row is identified by the id its own create_record call returns, so
+        concurrent batches never see each other's rows. If any insert fails, the
+        rows this call created are deleted again so the session never holds half
+        a batch. A batch listing the same contact_id twice is rejected unwritten.
+        """
+        if not contacts:
+            return {"status": "success", "contacts": []}
+        
+        seen: Set[str] = set()
+        duplicates: Set[str] = set()
+        for contact in contacts:
+            (duplicates if contact['contact_id'] in seen else seen).add(contact['contact_id'])
+        if duplicates:
+            return {"status": "error", "message": f"Duplicate contact_id in batch: {', '.join(sorted(map(str, duplicates)))}"}
+        
+        started_at = datetime.now().isoformat()
+        sem = asyncio.Semaphore(_BULK_INSERT_CONCURRENCY)
+        
+        async def insert(contact: Dict) -> Dict:
+            async with sem:
+                result = await self.mcp_ops.create_record("contact_onboarding", {
+                    "session_id": session_id,
+                    "contact_id": contact['contact_id'],
+                    "email": contact['email'],
+                    "first_name": contact.get('first_name'),
+                    "last_name": contact.get('last_name'),
+                    "title": contact.get('title'),
+                    "contact_type": contact.get('contact_type'),
+                    "committee_status": "pending",
+                    "slack_status": "pending",
+                    "email_status": "pending",
+                    "overall_status": "pending",
+                    "started_at": started_at
+                })
+                if result["status"] != "success":
+                    return result
+                row_id = _inserted_id(result)
+                if row_id is None:
+                    # Server did not report the new id; contact_id is unique within this batch
+                    found = await self.mcp_ops.read_records(
+                        "contact_onboarding",
+                        {"session_id": session_id, "contact_id": contact['contact_id']},
+                        order_by="id DESC",
+                        limit=1
+                    )
+                    if found["status"] != "success" or not found.get("data"):
+                        return {"status": "error", "message": f"Could not read back contact {contact['contact_id']}"}
+                    row_id = found["data"][0]["id"]
+                return {"status": "success", "id": row_id}
+        
+        results = await asyncio.gather(*(insert(contact) for contact in contacts), return_exceptions=True)
+        failed = next((r for r in results if isinstance(r, BaseException) or r["status"] != "success"), None)
+        if failed is not None:
+            created_ids = [r["id"] for r in results if not isinstance(r, BaseException) and r["status"] == "success"]
+            await asyncio.gather(*(
+                self.mcp_ops.delete_records("contact_onboarding", {"id": row_id}) for row_id in created_ids
+            ))
+            if isinstance(failed, BaseException):
+                return {"status": "error", "message": str(failed)}
+            return failed
+        
+        return {
+            "status": "success",
+            "contacts": [
+                {"contact_id": contact['contact_id'], "contact_onboarding_id": result["id"]}
+                for contact, result in zip(contacts, results)
+            ],
+            "message": f"Added {len(contacts)} contacts to session"
         }
-        if committee_id:
-            updates["committee_id"] = committee_id
+    
+    async def update_contact_statuses(self, contact_id: int, committee: str = None,
+                                      slack: str = None, email: str = None,
+                                      committee_id: str = None, slack_user_id: str = None,
+                                      overall: str = None) -> Dict:
+        """Update any of the committee/Slack/email/overall statuses with one MCP update_records call"""
+        updates = _overall_fields(overall) if overall is not None else {}
+        events = []
+        if committee is not None:
+            updates["committee_status"] = committee
+            if committee_id:
+                updates["committee_id"] = committee_id
+            events.append(("committee", committee, {"committee_id": committee_id}))
+        if slack is not None:
+            updates["slack_status"] = slack
+            if slack_user_id:
+                updates["slack_user_id"] = slack_user_id
+            events.append(("slack", slack, {"slack_user_id": slack_user_id}))
+        if email is not None:
+            updates["email_status"] = email
+            events.append(("email", email, {}))
+        
+        if not updates:
+            return {"status": "success", "message": "No status changes"}
         
         result = await self.mcp_ops.update_records(
             "contact_onboarding",
@@ -148,18 +306,30 @@ class OnboardingDatabaseToolsMCP:
             {"id": contact_id}
         )
         
-        # Log the event
+        # Log the events
         if result["status"] == "success":
-            await self._log_event(contact_id, "committee", status, {"committee_id": committee_id})
+            for event_type, status, details in events:
+                await self._log_event(contact_id, event_type, status, details)
         
         return result
     
-    async def update_contact_slack_status(self, contact_id: int,
-                                         status: str, slack_user_id: str = None) -> Dict:
-        """Update contact's Slack status using MCP update_records"""
+    async def update_contact_results(self, contact_id: int, committee_status: str,
+                                     committee_id: Optional[str], slack_status: str,
+                                     slack_user_id: Optional[str], email_status: str) -> Dict:
+        """
+        Record all three step outcomes and the derived overall status in one update.
+        
+        Equivalent to update_contact_statuses followed by update_overall_status,
+        without the extra read and write.
+        """
         updates = {
-            "slack_status": status
+            "committee_status": committee_status,
+            "slack_status": slack_status,
+            "email_status": email_status,
+            **_overall_status_fields((committee_status, slack_status, email_status))
         }
+        if committee_id:
+            updates["committee_id"] = committee_id
         if slack_user_id:
             updates["slack_user_id"] = slack_user_id
         
@@ -169,25 +339,108 @@ class OnboardingDatabaseToolsMCP:
             {"id": contact_id}
         )
         
-        # Log the event
         if result["status"] == "success":
-            await self._log_event(contact_id, "slack", status, {"slack_user_id": slack_user_id})
+            await asyncio.gather(
+                self._log_event(contact_id, "committee", committee_status, {"committee_id": committee_id}),
+                self._log_event(contact_id, "slack", slack_status, {"slack_user_id": slack_user_id}),
+                self._log_event(contact_id, "email", email_status, {})
+            )
         
         return result
     
-    async def update_contact_email_status(self, contact_id: int, status: str) -> Dict:
-        """Update contact's email status using MCP update_records"""
-        result = await self.mcp_ops.update_records(
-            "contact_onboarding",
-            {"email_status": status},
-            {"id": contact_id}
-        )
+    async def update_contact_status(self, contact_id: int, status_type: str, status: str,
+                                    additional_data: Optional[Dict] = None) -> Dict:
+        """
+        Update one status by type ("committee", "slack", "email" or "overall").
         
-        # Log the event
-        if result["status"] == "success":
-            await self._log_event(contact_id, "email", status, {})
+        An "overall" update writes the given status as-is; with status None it is
+        recalculated from the row's step statuses.
+        """
+        additional_data = additional_data or {}
+        if status_type == "overall":
+            if status is not None:
+                return await self.update_contact_statuses(contact_id, overall=status)
+            return await self.update_overall_status(contact_id)
+        if status_type == "committee":
+            return await self.update_contact_statuses(
+                contact_id, committee=status, committee_id=additional_data.get("committee_id")
+            )
+        if status_type == "slack":
+            return await self.update_contact_statuses(
+                contact_id, slack=status, slack_user_id=additional_data.get("slack_user_id")
+            )
+        if status_type == "email":
+            return await self.update_contact_statuses(contact_id, email=status)
+        return {"status": "error", "message": f"Unknown status type: {status_type}"}
+    
+    async def update_contact_statuses_bulk(self, updates: List[Dict]) -> Dict:
+        """
+        Apply many update_contact_status-style updates at once.
         
-        return result
+        Field updates, including "overall" updates that carry a status, are merged
+        into one update_contact_statuses call per contact; "overall" updates with
+        status None are recalculated afterwards so they see the new field values.
+        """
+        merged: Dict[int, Dict[str, Any]] = {}
+        overall_ids: List[int] = []
+        for update in updates:
+            contact_id = update["contact_id"]
+            status_type = update.get("status_type")
+            additional_data = update.get("additional_data") or {}
+            if status_type == "overall" and update.get("status") is None:
+                overall_ids.append(contact_id)
+                continue
+            fields = merged.setdefault(contact_id, {})
+            if status_type == "overall":
+                fields["overall"] = update["status"]
+            elif status_type == "committee":
+                fields["committee"] = update["status"]
+                if additional_data.get("committee_id"):
+                    fields["committee_id"] = additional_data["committee_id"]
+            elif status_type == "slack":
+                fields["slack"] = update["status"]
+                if additional_data.get("slack_user_id"):
+                    fields["slack_user_id"] = additional_data["slack_user_id"]
+            elif status_type == "email":
+                fields["email"] = update["status"]
+        
+        field_results = await asyncio.gather(*(
+            self.update_contact_statuses(contact_id, **fields) for contact_id, fields in merged.items()
+        ))
+        results_by_key = {(contact_id, "fields"): result for contact_id, result in zip(merged, field_results)}
+        
+        overall_ids = list(dict.fromkeys(overall_ids))
+        overall_results = await asyncio.gather(*(self.update_overall_status(contact_id) for contact_id in overall_ids))
+        results_by_key.update({(contact_id, "overall"): result for contact_id, result in zip(overall_ids, overall_results)})
+        
+        results = []
+        for update in updates:
+            status_type = update.get("status_type")
+            if status_type == "overall" and update.get("status") is None:
+                results.append(results_by_key[(update["contact_id"], "overall")])
+            elif status_type in ("committee", "slack", "email", "overall"):
+                results.append(results_by_key[(update["contact_id"], "fields")])
+            else:
+                results.append({"status": "error", "message": f"Unknown status type: {status_type}"})
+        
+        return {
+            "status": "success" if all(r.get("status") == "success" for r in results) else "error",
+            "results": results
+        }
+    
+    async def update_contact_committee_status(self, contact_id: int, 
+                                            status: str, committee_id: str = None) -> Dict:
+        """Update contact's committee status (wrapper around update_contact_statuses)"""
+        return await self.update_contact_statuses(contact_id, committee=status, committee_id=committee_id)
+    
+    async def update_contact_slack_status(self, contact_id: int,
+                                         status: str, slack_user_id: str = None) -> Dict:
+        """Update contact's Slack status (wrapper around update_contact_statuses)"""
+        return await self.update_contact_statuses(contact_id, slack=status, slack_user_id=slack_user_id)
+    
+    async def update_contact_email_status(self, contact_id: int, status: str) -> Dict:
+        """Update contact's email status (wrapper around update_contact_statuses)"""
+        return await self.update_contact_statuses(contact_id, email=status)
     
     async def update_overall_status(self, contact_id: int) -> Dict:
         """Update overall status based on individual statuses"""
@@ -200,30 +453,12 @@ class OnboardingDatabaseToolsMCP:
         if contact_result["status"] == "success" and contact_result.get("data"):
             contact = contact_result["data"][0]
             
-            # Determine overall status
-            statuses = [
+            # Update the overall status
+            updates = _overall_status_fields((
                 contact.get("committee_status"),
                 contact.get("slack_status"),
                 contact.get("email_status")
-            ]
-            
-            if all(s in ["completed", "success"] for s in statuses):
-                overall = "completed"
-                completed_at = datetime.now().isoformat()
-            elif any(s == "failed" for s in statuses):
-                overall = "failed"
-                completed_at = None
-            elif any(s in ["completed", "success"] for s in statuses):
-                overall = "partial"
-                completed_at = None
-            else:
-                overall = "pending"
-                completed_at = None
-            
-            # Update the overall status
-            updates = {"overall_status": overall}
-            if completed_at:
-                updates["completed_at"] = completed_at
+            ))
             
             return await self.mcp_ops.update_records(
                 "contact_onboarding",
@@ -272,6 +507,32 @@ class OnboardingDatabaseToolsMCP:
         
         return contacts_result
     
+    async def flush_session_statistics(self, session_id: int, stats: Dict) -> Dict:
+        """
+        Write pre-aggregated session statistics without re-reading the session's contacts.
+        
+        stats holds total/successful/failed counts by overall status, plus
+        pending_contacts; as in update_session_statistics, the session is only
+        completed once nothing is pending.
+        """
+        pending = stats.get("pending_contacts", 0)
+        session_status = "completed" if pending == 0 else "in_progress"
+        updates = {
+            "total_contacts": stats.get("total_contacts", 0),
+            "successful_contacts": stats.get("successful_contacts", 0),
+            "failed_contacts": stats.get("failed_contacts", 0),
+            "status": session_status
+        }
+        
+        if session_status == "completed":
+            updates["completed_at"] = datetime.now().isoformat()
+        
+        return await self.mcp_ops.update_records(
+            "onboarding_sessions",
+            updates,
+            {"id": session_id}
+        )
+    
     async def get_session_report(self, session_id: int) -> Dict:
         """Get comprehensive session report using MCP read tools"""
         report = {"status": "success", "report": {}}
@@ -342,7 +603,7 @@ class OnboardingDatabaseToolsMCP:
             "contact_onboarding_id": contact_id,
             "event_type": event_type,
             "event_status": status,
-            "event_details": json.dumps(details),
+            "event_details": dumps(details),
             "created_at": datetime.now().isoformat()
         }
         
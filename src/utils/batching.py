@@ -0,0 +1,67 @@
+"""Request coalescing for chatty per-item async calls"""
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+
+class BatchLoader:
+    """
+    Coalesce load() calls issued close together into one batch call (DataLoader pattern).
+
+    Items queue up until max_batch is reached or max_wait seconds pass since the
+    first queued item, then batch_fn is called once with the whole list. batch_fn
+    must return one result per item, in order; if it raises, every caller in that
+    batch gets the exception.
+    """
+
+    def __init__(self, batch_fn: Callable[[List[Any]], Awaitable[List[Any]]],
+                 max_batch: int = 10, max_wait: float = 0.005):
+        self._batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: Set[asyncio.Task] = set()
+
+    async def load(self, item: Any) -> Any:
+        """Queue an item and wait for its result from the next batch"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.append((item, future))
+
+        if len(self._queue) >= self.max_batch:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._dispatch)
+
+        return await future
+
+    def _dispatch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        queue, self._queue = self._queue, []
+        if queue:
+            task = asyncio.ensure_future(self._run(queue))
+            # Keep a reference so the batch isn't garbage collected mid-flight
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, queue: List[Tuple[Any, asyncio.Future]]):
+        try:
+            results = await self._batch_fn([item for item, _ in queue])
+            if len(results) != len(queue):
+                raise ValueError(f"Batch returned {len(results)} results for {len(queue)} items")
+        except asyncio.CancelledError:
+            for _, future in queue:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in queue:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(queue, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,63 @@
+"""Caching utilities for async service lookups"""
+import asyncio
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Optional, Union
+
+
+def async_ttl_cache(maxsize: int = 128,
+                    ttl: Union[float, Callable[[], Optional[float]], None] = None,
+                    on_hit: Optional[Callable[[str, tuple], None]] = None,
+                    key: Optional[Callable[..., tuple]] = None,
+                    should_cache: Optional[Callable[[Any], bool]] = None):
+    """
+    Memoize an async function on its positional/keyword arguments.
+
+    ttl is a number of seconds, None for no expiry, or a zero-argument callable
+    returning either (evaluated per miss, so it may depend on runtime config).
+    Concurrent calls with the same arguments share a single in-flight task,
+    and calls that raise are not cached.
+
+    key, if given, builds the cache key from the call's arguments instead (e.g. to
+    share entries across instances by leaving out self). should_cache, if given,
+    drops results it rejects once they complete, so failed lookups are retried.
+    """
+    def decorator(func):
+        entries: "OrderedDict[tuple, tuple]" = OrderedDict()  # key -> (expires_at, task)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key is not None else args + tuple(sorted(kwargs.items()))
+            now = time.monotonic()
+
+            entry = entries.get(cache_key)
+            if entry is not None and entry[0] > now:
+                entries.move_to_end(cache_key)
+                if on_hit is not None:
+                    on_hit(func.__qualname__, cache_key)
+                return await asyncio.shield(entry[1])
+
+            lifetime = ttl() if callable(ttl) else ttl
+            expires_at = float('inf') if lifetime is None else now + lifetime
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            entries[cache_key] = (expires_at, task)
+            entries.move_to_end(cache_key)
+            while len(entries) > maxsize:
+                entries.popitem(last=False)
+
+            try:
+                result = await asyncio.shield(task)
+            except BaseException:
+                if entries.get(cache_key, (None, None))[1] is task and task.done():
+                    del entries[cache_key]
+                raise
+            if should_cache is not None and not should_cache(result):
+                if entries.get(cache_key, (None, None))[1] is task:
+                    del entries[cache_key]
+            return result
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+
+    return decorator
@@ -1,18 +1,53 @@
 """Logging utilities"""
 import logging
 import sys
-from typing import Optional
+from typing import Any, Dict, Optional
 
+from .serialization import dumps
 
-def setup_logging(level: str = "INFO", log_file: Optional[str] = None):
-    """Setup logging configuration"""
+# Attributes every LogRecord has; anything else on a record came from extra/bound fields
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Render each record as one JSON object, including its extra and bound fields"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": record.getMessage().strip()
+        }
+        payload.update((key, value) for key, value in vars(record).items() if key not in _RECORD_ATTRS)
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return dumps(payload, default=str)
+
+
+class BoundLogger(logging.LoggerAdapter):
+    """LoggerAdapter that adds its bound fields to every record; bind() returns a child with more"""
+    
+    def process(self, msg: Any, kwargs: Dict[str, Any]):
+        kwargs["extra"] = {**self.extra, **kwargs.get("extra", {})}
+        return msg, kwargs
+    
+    def bind(self, **fields: Any) -> "BoundLogger":
+        return BoundLogger(self.logger, {**self.extra, **fields})
+
+
+def setup_logging(level: str = "INFO", log_file: Optional[str] = None, json_format: bool = False):
+    """Setup logging configuration; json_format emits one JSON object per line"""
     log_level = getattr(logging, level.upper(), logging.INFO)
     
     # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    if json_format:
+        formatter = JsonFormatter(datefmt='%Y-%m-%dT%H:%M:%S')
+    else:
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
     
     # Setup root logger
     root_logger = logging.getLogger()
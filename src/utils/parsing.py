@@ -0,0 +1,58 @@
+"""
+Parsing of agent text replies into tool results.
+
+Kept free of agent and I/O dependencies and fully annotated so it can be
+compiled with mypyc (mypyc src/utils/parsing.py); the pure-Python module is
+used when no compiled build is present.
+"""
+import ast
+import json
+import re
+from typing import Any, Final
+
+_FENCE_RE: Final = re.compile(r'^```(?:json)?[ \t]*$', re.MULTILINE)
+_JSON_DECODER: Final = json.JSONDecoder()
+_NOTHING: Final = object()
+
+def _decode_leading(text: str) -> Any:
+    """
+    Decode the JSON value that text starts with, or the first object inside it.
+    
+    Falls back to a Python literal (agents often echo dict reprs) and returns
+    _NOTHING when neither parses.
+    """
+    try:
+        value, end = _JSON_DECODER.raw_decode(text)
+        # A bare scalar only counts if it is the whole response
+        if end == len(text) or isinstance(value, (dict, list)):
+            return value
+    except ValueError:
+        pass
+    
+    brace = text.find('{')
+    if brace > 0:
+        try:
+            return _JSON_DECODER.raw_decode(text, brace)[0]
+        except ValueError:
+            pass
+    
+    try:
+        return ast.literal_eval(text[brace:text.rfind('}') + 1] if brace >= 0 else text)
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        return _NOTHING
+
+def parse_agent_content(content: str) -> Any:
+    """Turn an agent's text reply into the tool result it carries"""
+    text = _FENCE_RE.sub('', content).strip()
+    parsed = _decode_leading(text)
+    if parsed is _NOTHING:
+        return {"status": "success", "response": text}
+    
+    # Agents sometimes wrap the tool result as a string in a 'response' field
+    if isinstance(parsed, dict) and isinstance(parsed.get('response'), str):
+        inner: str = parsed['response'].strip()
+        if inner.startswith('{'):
+            inner_parsed = _decode_leading(inner)
+            if inner_parsed is not _NOTHING:
+                return inner_parsed
+    return parsed
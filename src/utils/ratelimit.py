@@ -0,0 +1,107 @@
+"""Rate limiting for calls to downstream services"""
+import asyncio
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Token bucket allowing `rate` acquisitions per `period` seconds, with bursts of up to `rate`.
+
+    Implemented as a virtual schedule (GCRA) rather than a counter and a lock, so it
+    holds no loop-bound primitives and can be created outside a running loop. Use it
+    as `async with limiter:` around each call to the limited service.
+    """
+
+    __slots__ = ("_interval", "_tolerance", "_next_at")
+
+    def __init__(self, rate: float, period: float = 1.0):
+        self._interval = period / rate
+        self._tolerance = period - self._interval  # how far ahead of now the schedule may run
+        self._next_at = 0.0
+
+    async def acquire(self):
+        now = time.monotonic()
+        next_at = max(self._next_at, now)
+        # Reserve the slot before sleeping so concurrent callers queue behind it
+        self._next_at = next_at + self._interval
+        delay = next_at - self._tolerance - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class _Unlimited:
+    """Stands in for a RateLimiter where a service has no ceiling (e.g. stubs)"""
+
+    __slots__ = ()
+
+    async def acquire(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+UNLIMITED = _Unlimited()
+
+
+class AdmissionController:
+    """
+    Concurrency cap whose limit can be changed while tasks are waiting.
+
+    Works like a semaphore (`async with admission:`), but resize() may lower the
+    limit when a service signals overload and raise it again once it recovers.
+    Lowering never interrupts tasks already admitted; new ones wait until the
+    in-flight count drops below the new limit. The Condition is created on first
+    use so the controller can be built outside a running loop.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.in_flight = 0
+        self._cond: Optional[asyncio.Condition] = None
+
+    def _condition(self) -> asyncio.Condition:
+        if self._cond is None:
+            self._cond = asyncio.Condition(asyncio.Lock())
+        return self._cond
+
+    async def acquire(self):
+        cond = self._condition()
+        async with cond:
+            await cond.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def release(self):
+        cond = self._condition()
+        async with cond:
+            self.in_flight -= 1
+            cond.notify(1)
+
+    async def resize(self, limit: int):
+        """Set a new limit (at least 1), waking waiters if it grew"""
+        limit = max(1, limit)
+        cond = self._condition()
+        async with cond:
+            grew = limit > self.limit
+            self.limit = limit
+            if grew:
+                cond.notify_all()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.release()
+        return False
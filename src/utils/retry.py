@@ -0,0 +1,38 @@
+"""Retry helper with jittered exponential backoff"""
+import asyncio
+import random
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+RETRIES_EXHAUSTED = "retries_exhausted"
+
+
+async def retry_async(attempt_fn: Callable[[], Awaitable[Any]], *, retries: int = 3,
+                      base: float = 1.0, cap: float = 30.0,
+                      is_success: Callable[[Any], bool] = lambda result: True,
+                      retry_on: Callable[[Exception], bool] = lambda exc: True) -> Tuple[Any, Optional[str]]:
+    """
+    Call attempt_fn until is_success(result) holds, at most `retries` times.
+
+    Between attempts it sleeps min(cap, base * 2**n) scaled by a random factor in
+    [0.5, 1.5), so concurrent callers don't retry in lockstep. Returns
+    (result, None) on success; otherwise (last_result, reason), where reason is the
+    last exception's message, or RETRIES_EXHAUSTED if the last attempt returned
+    an unsuccessful result. An exception for which retry_on returns False ends
+    the loop at once.
+    """
+    result, reason = None, RETRIES_EXHAUSTED
+    for attempt in range(1, retries + 1):
+        try:
+            result = await attempt_fn()
+            if is_success(result):
+                return result, None
+            reason = RETRIES_EXHAUSTED
+        except Exception as e:
+            result, reason = None, str(e)
+            if not retry_on(e):
+                break
+
+        if attempt < retries:
+            await asyncio.sleep(min(cap, base * 2 ** attempt) * random.uniform(0.5, 1.5))
+
+    return result, reason
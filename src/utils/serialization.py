@@ -0,0 +1,4 @@
+"""JSON serialization helpers; the implementation lives in the top-level json_codec module"""
+from json_codec import dumps, dumps_bytes, loads
+
+__all__ = ["dumps", "dumps_bytes", "loads"]
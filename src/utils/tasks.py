@@ -0,0 +1,32 @@
+"""Structured concurrency helpers for Python 3.9 (no asyncio.TaskGroup)"""
+import asyncio
+from typing import Any, Awaitable, List
+
+
+async def gather_or_cancel(*aws: Awaitable[Any]) -> List[Any]:
+    """
+    Like asyncio.gather, but the first failure cancels the remaining tasks.
+
+    Results come back in argument order. If any task raises, its siblings are
+    cancelled and awaited before the exception propagates, so no work is left
+    running after the caller fails; the same happens if the caller is cancelled.
+    Only the first exception is raised (TaskGroup would raise an ExceptionGroup).
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    if not tasks:
+        return []
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    except asyncio.CancelledError:
+        pending = tasks
+        raise
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    for task in done:
+        if task.exception() is not None:
+            raise task.exception()
+    return [task.result() for task in tasks]
@@ -0,0 +1,40 @@
+"""Tracing spans with an optional OpenTelemetry backend"""
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+try:
+    from opentelemetry import trace
+except ImportError:  # opentelemetry is optional; spans become no-ops
+    trace = None
+
+_tracer = trace.get_tracer("onboarding") if trace is not None else None
+
+
+class _NoopSpan:
+    """Stands in for an OpenTelemetry span when tracing is unavailable"""
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """
+    Run the block inside a span named `name` with the given attributes.
+
+    The span becomes the current one, so spans opened in tasks created inside the
+    block nest under it. Exporting is configured through the usual OpenTelemetry SDK
+    setup (e.g. OTEL_EXPORTER_OTLP_ENDPOINT); without the API installed this yields
+    a no-op span.
+    """
+    if _tracer is None:
+        yield _NOOP_SPAN
+        return
+    with _tracer.start_as_current_span(name) as current:
+        for key, value in attributes.items():
+            if value is not None:
+                current.set_attribute(key, value)
+        yield current
@@ -1,12 +1,14 @@
 """Stub services for local testing and development"""
 import asyncio
-import json
 import sqlite3
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import random
 import uuid
 from contextlib import contextmanager
+from functools import lru_cache
+
+from src.utils.serialization import dumps
 
 # Sample data for testing
 SAMPLE_ORGANIZATIONS = [
@@ -58,7 +60,10 @@ class StubMemberService:
     async def get_member_by_organization(self, org_name: str) -> Dict:
         """Get member ID by organization name"""
         await asyncio.sleep(0.1)  # Simulate network delay
-        
+        return self.get_member_by_organization_sync(org_name)
+    
+    def get_member_by_organization_sync(self, org_name: str) -> Dict:
+        """Get member ID by organization name without the simulated network delay"""
         for org in SAMPLE_ORGANIZATIONS:
             if org['name'].lower() == org_name.lower():
                 return {
@@ -75,7 +80,10 @@ class StubMemberService:
     async def get_member_contacts(self, member_id: str) -> List[Dict]:
         """Fetch all contacts for a specific member"""
         await asyncio.sleep(0.1)  # Simulate network delay
-        
+        return self.get_member_contacts_sync(member_id)
+    
+    def get_member_contacts_sync(self, member_id: str) -> List[Dict]:
+        """Fetch all contacts for a specific member without the simulated network delay"""
         contacts = [c for c in SAMPLE_CONTACTS if c['member_id'] == member_id]
         return {
             "status": "success",
@@ -108,7 +116,10 @@ class StubProjectService:
     async def get_project_by_slug(self, project_slug: str) -> Dict:
         """Get project details by slug"""
         await asyncio.sleep(0.1)  # Simulate network delay
-        
+        return self.get_project_by_slug_sync(project_slug)
+    
+    def get_project_by_slug_sync(self, project_slug: str) -> Dict:
+        """Get project details by slug without the simulated network delay"""
         for project in SAMPLE_PROJECTS:
             if project['slug'] == project_slug:
                 return {
@@ -125,7 +136,10 @@ class StubProjectService:
     async def get_project_committees(self, project_id: str) -> List[Dict]:
         """Get all committees for a project"""
         await asyncio.sleep(0.1)  # Simulate network delay
-        
+        return self.get_project_committees_sync(project_id)
+    
+    def get_project_committees_sync(self, project_id: str) -> List[Dict]:
+        """Get all committees for a project without the simulated network delay"""
         committees = SAMPLE_COMMITTEES.get(project_id, [])
         return {
             "status": "success",
@@ -137,6 +151,14 @@ class StubProjectService:
         """Add a member to a committee"""
         await asyncio.sleep(0.1)  # Simulate network delay
         
+        # Adding an existing member is a no-op that reports already_member
+        key = f"{committee_id}:{member_data['email']}"
+        if key in StubProjectService.committee_members:
+            return {
+                "status": "already_member",
+                "message": f"{member_data['email']} is already in committee {committee_id}"
+            }
+        
         # Simulate occasional failures
         if random.random() < 0.05:  # 5% failure rate
             return {
@@ -145,7 +167,6 @@ class StubProjectService:
             }
         
         # Store in memory
-        key = f"{committee_id}:{member_data['email']}"
         StubProjectService.committee_members[key] = {
             **member_data,
             "committee_id": committee_id,
@@ -162,7 +183,27 @@ class StubProjectService:
     async def check_committee_membership(self, project_id: str, committee_id: str, email: str) -> Dict:
         """Check if contact is already in committee"""
         await asyncio.sleep(0.1)  # Simulate network delay
-        
+        return self.check_committee_membership_sync(project_id, committee_id, email)
+    
+    async def get_committee_members(self, project_id: str, committee_id: str) -> Dict:
+        """List the members of a committee"""
+        await asyncio.sleep(0.1)  # Simulate network delay
+        return self.get_committee_members_sync(project_id, committee_id)
+    
+    def get_committee_members_sync(self, project_id: str, committee_id: str) -> Dict:
+        """List the members of a committee without the simulated network delay"""
+        members = [
+            member for member in StubProjectService.committee_members.values()
+            if member.get("committee_id") == committee_id
+        ]
+        return {
+            "status": "success",
+            "members": members,
+            "count": len(members)
+        }
+    
+    def check_committee_membership_sync(self, project_id: str, committee_id: str, email: str) -> Dict:
+        """Check if contact is already in committee without the simulated network delay"""
         key = f"{committee_id}:{email}"
         is_member = key in StubProjectService.committee_members
         
@@ -476,7 +517,7 @@ class StubDatabaseService:
                 contact_id,
                 status_type,
                 status,
-                json.dumps(additional_data) if additional_data else None
+                dumps(additional_data) if additional_data else None
             ))
             
             # Update overall status
@@ -558,20 +599,28 @@ class StubDatabaseService:
             }
 
 # Factory functions to get stub services
+# Factories return one shared instance per process (per db_path for the database);
+# the tools call them on every request, and the database one runs DDL on creation
+@lru_cache(maxsize=1)
 def get_stub_member_service():
     return StubMemberService()
 
+@lru_cache(maxsize=1)
 def get_stub_project_service():
     return StubProjectService()
 
+@lru_cache(maxsize=1)
 def get_stub_slack_service():
     return StubSlackService()
 
+@lru_cache(maxsize=1)
 def get_stub_email_service():
     return StubEmailService()
 
+@lru_cache(maxsize=1)
 def get_stub_landscape_service():
     return StubLandscapeService()
 
+@lru_cache(maxsize=None)
 def get_stub_database_service(db_path: str = "./local_onboarding.db"):
     return StubDatabaseService(db_path)
\ No newline at end of file